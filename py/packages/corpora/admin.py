@@ -1,6 +1,13 @@
 from django.contrib import admin
 
-from .models import Corpus, CorpusTextFile, Split
+from .models import (
+    Corpus,
+    CorpusTextFile,
+    EmbeddingCache,
+    IngestionJob,
+    Split,
+    Upload,
+)
 
 
 @admin.register(Corpus)
@@ -49,3 +56,35 @@ class SplitAdmin(admin.ModelAdmin):
         return obj.content[:50] + "..." if obj.content else "No content"
 
     content_preview.short_description = "Content Preview"
+
+
+@admin.register(EmbeddingCache)
+class EmbeddingCacheAdmin(admin.ModelAdmin):
+    list_display = ("model", "content_hash", "created_at")
+    list_filter = ("model",)
+    search_fields = ("content_hash",)
+    ordering = ("-created_at",)
+    readonly_fields = ("model", "content_hash", "created_at")
+
+
+@admin.register(Upload)
+class UploadAdmin(admin.ModelAdmin):
+    list_display = ("id", "owner", "size", "created_at", "completed_at")
+    list_filter = ("owner",)
+    ordering = ("-created_at",)
+    readonly_fields = ("id", "sha256", "staged_name", "created_at", "completed_at")
+
+
+@admin.register(IngestionJob)
+class IngestionJobAdmin(admin.ModelAdmin):
+    list_display = (
+        "id",
+        "corpus",
+        "files_updated",
+        "files_embedded",
+        "files_failed",
+        "created_at",
+        "finished_at",
+    )
+    list_filter = ("corpus",)
+    ordering = ("-created_at",)
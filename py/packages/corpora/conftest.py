@@ -0,0 +1,28 @@
+import pytest
+from django.core.cache import caches
+
+
+@pytest.fixture(autouse=True)
+def _clear_query_embedding_cache():
+    """Don't let one test's cached query embedding answer another's."""
+    caches["query_embeddings"].clear()
+    yield
+    caches["query_embeddings"].clear()
+
+
+@pytest.fixture(autouse=True)
+def _staged_uploads(settings, tmp_path):
+    """Stage uploaded tarballs in a per-test directory."""
+    settings.STORAGES = {
+        **settings.STORAGES,
+        "corpus_uploads": {
+            "BACKEND": "django.core.files.storage.FileSystemStorage",
+            "OPTIONS": {"location": str(tmp_path / "uploads")},
+        },
+    }
+
+
+@pytest.fixture(autouse=True)
+def _no_file_summaries(settings):
+    """Only queue file summaries in tests that turn them back on."""
+    settings.CORPORA_SUMMARIZE_FILES = False
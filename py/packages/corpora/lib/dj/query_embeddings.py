@@ -0,0 +1,102 @@
+"""Short-lived cache of search query embeddings.
+
+Chat REPL turns and retries re-send the same query text, so caching the
+embedding skips the provider round trip. Entries live in the
+`query_embeddings` cache (LRU with a TTL in-process, or Redis when
+configured); see `CACHES` in the project settings.
+"""
+
+import hashlib
+import logging
+import unicodedata
+from typing import TYPE_CHECKING, Dict, List
+
+from django.core.cache import caches
+
+if TYPE_CHECKING:
+    from corpora_ai.llm_interface import LLMBaseInterface
+
+logger = logging.getLogger(__name__)
+
+CACHE_ALIAS = "query_embeddings"
+HITS_KEY = "query-embedding:hits"
+MISSES_KEY = "query-embedding:misses"
+
+
+def normalize_query(text: str) -> str:
+    """Collapse whitespace and Unicode variants so trivially different
+    queries share an entry. Case is kept; the embedding depends on it.
+    """
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def cache_key(model: str, text: str) -> str:
+    # Hash the model too; names aren't guaranteed to be key-safe
+    digest = hashlib.sha256(
+        f"{model}\0{normalize_query(text)}".encode(),
+    ).hexdigest()
+    return f"query-embedding:{digest}"
+
+
+def get_query_embedding(llm: "LLMBaseInterface", text: str) -> List[float]:
+    """Return the embedding of a search query, from the cache if possible."""
+    cache = caches[CACHE_ALIAS]
+    key = cache_key(llm.embedding_model, text)
+    vector = cache.get(key)
+    _count(hit=vector is not None)
+    if vector is None:
+        vector = llm.get_embedding(normalize_query(text))
+        cache.set(key, vector)
+    return vector
+
+
+async def aget_query_embedding(
+    llm: "LLMBaseInterface",
+    text: str,
+) -> List[float]:
+    """Async `get_query_embedding`."""
+    cache = caches[CACHE_ALIAS]
+    key = cache_key(llm.embedding_model, text)
+    vector = await cache.aget(key)
+    await _acount(hit=vector is not None)
+    if vector is None:
+        vector = await llm.aget_embedding(normalize_query(text))
+        await cache.aset(key, vector)
+    return vector
+
+
+def get_query_embedding_stats() -> Dict[str, float]:
+    """Hit/miss counts since the cache was last cleared, and the hit rate."""
+    cache = caches[CACHE_ALIAS]
+    hits = cache.get(HITS_KEY, 0)
+    misses = cache.get(MISSES_KEY, 0)
+    total = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": hits / total if total else 0.0,
+    }
+
+
+def _count(*, hit: bool) -> None:
+    cache = caches[CACHE_ALIAS]
+    key = HITS_KEY if hit else MISSES_KEY
+    # Counters never expire; they're only reset with the cache itself
+    cache.add(key, 0, timeout=None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Evicted between add() and incr()
+        cache.set(key, 1, timeout=None)
+    logger.debug("query embedding cache %s", "hit" if hit else "miss")
+
+
+async def _acount(*, hit: bool) -> None:
+    cache = caches[CACHE_ALIAS]
+    key = HITS_KEY if hit else MISSES_KEY
+    await cache.aadd(key, 0, timeout=None)
+    try:
+        await cache.aincr(key)
+    except ValueError:
+        await cache.aset(key, 1, timeout=None)
+    logger.debug("query embedding cache %s", "hit" if hit else "miss")
@@ -0,0 +1,54 @@
+"""Tokens-per-minute budgets shared by background workers.
+
+Background jobs that call the LLM provider take tokens from a named
+budget before each request, so together they stay under a share of the
+account's rate limit and leave the rest for interactive traffic (chat,
+search). Budgets are counted per clock minute in the `rate_limits` cache:
+Redis when `REDIS_URL` is set, so every worker draws from the same one,
+or in-process otherwise; see `CACHES` in the project settings.
+"""
+
+import logging
+import time
+from typing import Callable
+
+from django.core.cache import caches
+
+logger = logging.getLogger(__name__)
+
+CACHE_ALIAS = "rate_limits"
+WINDOW_SECONDS = 60
+
+
+def window_key(name: str, now: float) -> str:
+    return f"tpm:{name}:{int(now // WINDOW_SECONDS)}"
+
+
+def acquire_tokens(
+    name: str,
+    tokens: int,
+    tokens_per_minute: int,
+    clock: Callable[[], float] = time.time,
+    sleep: Callable[[float], None] = time.sleep,
+) -> float:
+    """Wait until `tokens` fit in this minute's `name` budget and take them.
+    Returns the seconds spent waiting.
+
+    A request bigger than the whole budget goes alone in an otherwise
+    unused minute rather than never.
+    """
+    cache = caches[CACHE_ALIAS]
+    waited = 0.0
+    while True:
+        now = clock()
+        key = window_key(name, now)
+        # Windows outlive their minute a little so a late incr still finds one
+        cache.add(key, 0, timeout=WINDOW_SECONDS * 2)
+        used = cache.incr(key, tokens)
+        if used <= tokens_per_minute or used == tokens:
+            return waited
+        cache.decr(key, tokens)
+        delay = WINDOW_SECONDS - now % WINDOW_SECONDS
+        logger.info(f"{name}: {tokens_per_minute} tokens/minute used, waiting {delay:.1f}s")
+        sleep(delay)
+        waited += delay
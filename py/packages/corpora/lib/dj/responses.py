@@ -0,0 +1,15 @@
+from typing import AsyncIterator
+
+from django.http import StreamingHttpResponse
+
+
+def text_stream_response(chunks: AsyncIterator[str]) -> StreamingHttpResponse:
+    """Stream text to the client as it is produced, e.g. LLM completion deltas."""
+    response = StreamingHttpResponse(
+        chunks,
+        content_type="text/plain; charset=utf-8",
+    )
+    response["Cache-Control"] = "no-cache"
+    # Stop nginx from buffering the whole body before forwarding it
+    response["X-Accel-Buffering"] = "no"
+    return response
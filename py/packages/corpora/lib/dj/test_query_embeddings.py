@@ -0,0 +1,76 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from django.core.cache import caches
+
+from corpora.lib.dj.query_embeddings import (
+    aget_query_embedding,
+    cache_key,
+    get_query_embedding,
+    get_query_embedding_stats,
+    normalize_query,
+)
+
+
+def make_llm(model="text-embedding-3-small", vector=None):
+    llm = MagicMock()
+    llm.embedding_model = model
+    llm.get_embedding.return_value = vector or [0.1] * 3
+    llm.aget_embedding = AsyncMock(return_value=vector or [0.1] * 3)
+    return llm
+
+
+def test_normalize_query():
+    assert normalize_query("  how   does\tsync\nwork? ") == "how does sync work?"
+    # NFD "é" and NFC "é" share a key
+    assert normalize_query("café") == normalize_query("café")
+    assert normalize_query("Sync") != normalize_query("sync")
+
+
+def test_cache_key_includes_model():
+    assert cache_key("small", "q") != cache_key("large", "q")
+    assert cache_key("small", "q ") == cache_key("small", " q")
+
+
+def test_get_query_embedding_caches():
+    llm = make_llm()
+
+    assert get_query_embedding(llm, "where is  sync?") == [0.1] * 3
+    assert get_query_embedding(llm, " where is sync? ") == [0.1] * 3
+
+    llm.get_embedding.assert_called_once_with("where is sync?")
+    assert get_query_embedding_stats() == {
+        "hits": 1,
+        "misses": 1,
+        "hit_rate": 0.5,
+    }
+
+
+def test_get_query_embedding_is_per_model():
+    small = make_llm("small", [0.1] * 3)
+    large = make_llm("large", [0.9] * 3)
+
+    get_query_embedding(small, "same text")
+    assert get_query_embedding(large, "same text") == [0.9] * 3
+    large.get_embedding.assert_called_once_with("same text")
+
+
+def test_get_query_embedding_expires():
+    llm = make_llm()
+    get_query_embedding(llm, "q")
+    caches["query_embeddings"].delete(cache_key(llm.embedding_model, "q"))
+
+    get_query_embedding(llm, "q")
+    assert llm.get_embedding.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_aget_query_embedding_shares_cache():
+    llm = make_llm()
+    get_query_embedding(llm, "q")
+
+    assert await aget_query_embedding(llm, "q") == [0.1] * 3
+    llm.aget_embedding.assert_not_awaited()
+
+    await aget_query_embedding(llm, "other q")
+    llm.aget_embedding.assert_awaited_once_with("other q")
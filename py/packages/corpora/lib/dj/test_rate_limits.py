@@ -0,0 +1,65 @@
+import pytest
+from django.core.cache import caches
+
+from corpora.lib.dj.rate_limits import CACHE_ALIAS, acquire_tokens
+
+
+class FakeClock:
+    def __init__(self, now: float):
+        self.now = now
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture(autouse=True)
+def _clear_rate_limits():
+    caches[CACHE_ALIAS].clear()
+    yield
+    caches[CACHE_ALIAS].clear()
+
+
+def acquire(clock, tokens, tokens_per_minute=100, name="test"):
+    return acquire_tokens(
+        name, tokens, tokens_per_minute, clock=clock, sleep=clock.sleep,
+    )
+
+
+def test_acquire_tokens_within_budget():
+    clock = FakeClock(600.0)
+
+    assert acquire(clock, 60) == 0
+    assert acquire(clock, 40) == 0
+    assert clock.sleeps == []
+
+
+def test_acquire_tokens_waits_for_next_minute():
+    clock = FakeClock(615.0)
+    acquire(clock, 80)
+
+    assert acquire(clock, 30) == 45
+    assert clock.sleeps == [45]
+    # the rejected attempt gave its tokens back, so only 30 are used now
+    assert acquire(clock, 70) == 0
+
+
+def test_acquire_tokens_budgets_are_separate():
+    clock = FakeClock(600.0)
+    acquire(clock, 100, name="summaries")
+
+    assert acquire(clock, 100, name="other") == 0
+    assert clock.sleeps == []
+
+
+def test_acquire_tokens_oversized_request_goes_alone():
+    clock = FakeClock(630.0)
+    acquire(clock, 10)
+
+    # too big for any minute: waits for an unused one instead of forever
+    assert acquire(clock, 250) == 30
+    assert acquire(clock, 1) == 60
@@ -0,0 +1,45 @@
+import os
+import time
+
+import pytest
+from django.core.files.base import ContentFile
+
+from corpora.lib.dj.uploads import (
+    UploadTooLargeError,
+    cleanup_staged_uploads,
+    get_upload_storage,
+    open_staged_upload,
+    stage_upload,
+)
+
+
+def test_stage_upload():
+    name = stage_upload(ContentFile(b"tarball"))
+
+    with open_staged_upload(name) as f:
+        assert f.read() == b"tarball"
+
+
+def test_stage_upload_too_large(settings):
+    settings.CORPORA_MAX_UPLOAD_SIZE = 3
+
+    with pytest.raises(UploadTooLargeError):
+        stage_upload(ContentFile(b"tarball"))
+    assert not get_upload_storage().exists("")
+
+
+def test_cleanup_staged_uploads(settings):
+    settings.CORPORA_UPLOAD_TTL = 60
+    storage = get_upload_storage()
+    old = stage_upload(ContentFile(b"old"))
+    new = stage_upload(ContentFile(b"new"))
+    an_hour_ago = time.time() - 60 * 60
+    os.utime(storage.path(old), (an_hour_ago, an_hour_ago))
+
+    assert cleanup_staged_uploads() == 1
+    assert not storage.exists(old)
+    assert storage.exists(new)
+
+
+def test_cleanup_staged_uploads_nothing_staged():
+    assert cleanup_staged_uploads() == 0
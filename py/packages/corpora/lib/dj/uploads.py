@@ -0,0 +1,81 @@
+"""Staging store for uploaded corpus tarballs.
+
+Routers save the upload here and hand tasks only its name, so archives
+never pass through the Celery broker. The store is the `corpus_uploads`
+entry in `STORAGES`: a local directory by default, but any Django
+storage backend (e.g. an object store) that the web and worker
+processes can both reach will do.
+"""
+
+import logging
+import uuid
+from datetime import timedelta
+from typing import BinaryIO
+
+from django.conf import settings
+from django.core.files import File
+from django.core.files.storage import Storage, storages
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+STORAGE_ALIAS = "corpus_uploads"
+
+
+class UploadTooLargeError(ValueError):
+    """The upload is bigger than `CORPORA_MAX_UPLOAD_SIZE`."""
+
+
+class InvalidUploadError(ValueError):
+    """A resumable upload part or completion request doesn't add up."""
+
+
+def get_upload_storage() -> Storage:
+    return storages[STORAGE_ALIAS]
+
+
+def check_upload_size(size: int) -> None:
+    if size > settings.CORPORA_MAX_UPLOAD_SIZE:
+        raise UploadTooLargeError(
+            f"Upload is {size} bytes, "
+            f"the limit is {settings.CORPORA_MAX_UPLOAD_SIZE}.",
+        )
+
+
+def stage_upload(upload: File) -> str:
+    """Save an upload to the staging store and return its name.
+
+    Raises `UploadTooLargeError` before anything is written if it's over the
+    size limit.
+    """
+    check_upload_size(upload.size)
+    return get_upload_storage().save(f"{uuid.uuid4().hex}.tar.gz", upload)
+
+
+def open_staged_upload(name: str) -> BinaryIO:
+    return get_upload_storage().open(name, "rb")
+
+
+def delete_staged_upload(name: str) -> None:
+    get_upload_storage().delete(name)
+
+
+def cleanup_staged_uploads() -> int:
+    """Delete staged uploads older than `CORPORA_UPLOAD_TTL` seconds,
+    left behind by tasks that crashed or never ran. Returns the count.
+    """
+    storage = get_upload_storage()
+    cutoff = timezone.now() - timedelta(seconds=settings.CORPORA_UPLOAD_TTL)
+    try:
+        _, names = storage.listdir("")
+    except FileNotFoundError:
+        # Nothing has been staged yet
+        return 0
+    deleted = 0
+    for name in names:
+        if storage.get_modified_time(name) < cutoff:
+            storage.delete(name)
+            deleted += 1
+    if deleted:
+        logger.info(f"Deleted {deleted} expired staged uploads")
+    return deleted
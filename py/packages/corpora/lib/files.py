@@ -1,5 +1,6 @@
 import hashlib
-from typing import Union
+import tarfile
+from typing import BinaryIO, Iterator, Tuple, Union
 
 
 def compute_checksum(content: Union[bytes, str]) -> str:
@@ -15,3 +16,15 @@ def compute_checksum(content: Union[bytes, str]) -> str:
     size = str(len(content))
     sha = hashlib.sha1(f"blob {size}\0".encode() + content).hexdigest()
     return sha
+
+
+def iter_tarball_files(fileobj: BinaryIO) -> Iterator[Tuple[str, bytes]]:
+    """Yield `(path, raw bytes)` for each regular file in a tar.gz stream.
+
+    The archive is read in streaming mode, so members are visited in order
+    without building an index of the whole tarball first.
+    """
+    with tarfile.open(fileobj=fileobj, mode="r|gz") as tar:
+        for member in tar:
+            if member.isfile():
+                yield member.name, tar.extractfile(member).read()
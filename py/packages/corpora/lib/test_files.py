@@ -1,8 +1,10 @@
 import hashlib
+import io
+import tarfile
 
 import pytest
 
-from corpora.lib.files import compute_checksum
+from corpora.lib.files import compute_checksum, iter_tarball_files
 
 
 def git_blob_checksum(content: bytes) -> str:
@@ -31,3 +33,23 @@ def git_blob_checksum(content: bytes) -> str:
 def test_compute_checksum(content, expected_checksum):
     """Test that compute_checksum returns the correct Git-compatible checksum for both str and bytes input."""
     assert compute_checksum(content) == expected_checksum
+
+
+
+def test_iter_tarball_files():
+    """Test that iter_tarball_files streams regular files and skips directories."""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+        directory = tarfile.TarInfo(name="nested")
+        directory.type = tarfile.DIRTYPE
+        tar.addfile(directory)
+        for name, data in [("a.txt", b"alpha"), ("nested/b.py", b"beta")]:
+            tarinfo = tarfile.TarInfo(name=name)
+            tarinfo.size = len(data)
+            tar.addfile(tarinfo, io.BytesIO(data))
+    buffer.seek(0)
+
+    assert list(iter_tarball_files(buffer)) == [
+        ("a.txt", b"alpha"),
+        ("nested/b.py", b"beta"),
+    ]
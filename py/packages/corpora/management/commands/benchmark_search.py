@@ -0,0 +1,143 @@
+import statistics
+import time
+import uuid
+from typing import Callable, List, Tuple
+
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from corpora.models import Corpus, Split
+
+SearchFn = Callable[[List[float]], List[Split]]
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def run_searches(
+    search: SearchFn,
+    vectors: List[List[float]],
+) -> Tuple[List[float], List[List[uuid.UUID]]]:
+    """Latency in ms and result ids of `search` for each query vector."""
+    times = []
+    results = []
+    for vector in vectors:
+        start = time.perf_counter()
+        splits = search(vector)
+        times.append((time.perf_counter() - start) * 1000)
+        results.append([split.id for split in splits])
+    return times, results
+
+
+def recall(expected: List[List[uuid.UUID]], actual: List[List[uuid.UUID]]) -> float:
+    """Mean share of each expected result list that `actual` also found."""
+    shares = [
+        len(set(want) & set(got)) / len(want)
+        for want, got in zip(expected, actual)
+        if want
+    ]
+    return statistics.mean(shares) if shares else 0.0
+
+
+def exact_search(
+    corpus_ids: List[uuid.UUID],
+    vector: List[float],
+    limit: int,
+) -> List[Split]:
+    """`Corpus._search_splits` with index scans off, so every split of
+    the corpora is ranked; the baseline recall is measured against.
+    """
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute("SET LOCAL enable_indexscan = off")
+        return Corpus._search_splits(corpus_ids, vector, limit, None)
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the latency and recall of vector search at several "
+        "ef_search values, and of the two-stage summary search, with an "
+        "exact scan of a corpus's splits. Sampled splits serve as "
+        "queries, so no embedding requests are made."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("corpus_id")
+        parser.add_argument(
+            "--queries",
+            type=int,
+            default=50,
+            help="How many splits to sample as queries.",
+        )
+        parser.add_argument("--limit", type=int, default=10)
+        parser.add_argument(
+            "--ef-search",
+            type=int,
+            nargs="+",
+            default=[40, 100, 400],
+            help="Values of hnsw.ef_search to compare.",
+        )
+        parser.add_argument(
+            "--files",
+            type=int,
+            nargs="+",
+            default=[10, 20, 50],
+            help="Values of CORPORA_SUMMARY_SEARCH_FILES to compare.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            corpus = Corpus.objects.get(id=options["corpus_id"])
+        except (Corpus.DoesNotExist, ValidationError):
+            raise CommandError(f"Corpus {options['corpus_id']} not found.")
+        vectors = list(
+            Split.objects.filter(corpus=corpus, vector__isnull=False)
+            .order_by("?")
+            .values_list("vector", flat=True)[: options["queries"]],
+        )
+        if not vectors:
+            raise CommandError("The corpus has no embedded splits to query with.")
+        corpus_ids = [corpus.id]
+        limit = options["limit"]
+
+        self.stdout.write(
+            f"{len(vectors)} queries, top {limit} splits, "
+            f"{corpus.files.filter(vector_of_summary__isnull=False).count()}"
+            f"/{corpus.files.count()} files summarized",
+        )
+        self.stdout.write(f"{'mode':<28}{'p50 ms':>10}{'p95 ms':>10}{'recall':>10}")
+        exact_times, exact_results = run_searches(
+            lambda vector: exact_search(corpus_ids, vector, limit),
+            vectors,
+        )
+        self.report("exact", exact_times, 1.0)
+        for ef_search in options["ef_search"]:
+            times, results = run_searches(
+                lambda vector, ef_search=ef_search: Corpus._search_splits(
+                    corpus_ids, vector, limit, ef_search,
+                ),
+                vectors,
+            )
+            self.report(
+                f"vector (ef_search {ef_search})",
+                times,
+                recall(exact_results, results),
+            )
+        for files in options["files"]:
+            times, results = run_searches(
+                lambda vector, files=files: Corpus._summary_search_splits(
+                    corpus_ids, vector, limit, None, files=files,
+                ),
+                vectors,
+            )
+            self.report(
+                f"summary ({files} files)", times, recall(exact_results, results),
+            )
+
+    def report(self, mode: str, times: List[float], share: float) -> None:
+        self.stdout.write(
+            f"{mode:<28}{percentile(times, 0.5):>10.2f}"
+            f"{percentile(times, 0.95):>10.2f}{share:>10.2%}",
+        )
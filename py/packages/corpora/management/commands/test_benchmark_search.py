@@ -0,0 +1,68 @@
+from io import StringIO
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from corpora.models import Corpus, CorpusTextFile, Split
+
+from .benchmark_search import percentile, recall
+
+User = get_user_model()
+
+
+def test_percentile_and_recall():
+    assert percentile([3.0, 1.0, 2.0], 0.5) == 2.0
+    assert percentile([3.0, 1.0, 2.0], 0.95) == 3.0
+    assert recall([["a", "b"], []], [["b", "c"], ["d"]]) == 0.5
+
+
+@pytest.mark.django_db
+def test_benchmark_search():
+    """Reports exact, vector and two-stage search, without embedding any
+    queries.
+    """
+    user = User.objects.create(username="testuser", password="password123")
+    corpus = Corpus.objects.create(name="Test Corpus", owner=user)
+    for i in range(3):
+        file = CorpusTextFile.objects.create(
+            corpus=corpus,
+            path=f"file{i}.txt",
+            vector_of_summary=[0.1] * (1536 - 256 * i) + [0.2] * (256 * i),
+        )
+        Split.objects.create(
+            file=file,
+            order=0,
+            content=f"split {i}",
+            vector=[0.1] * (1536 - 256 * i) + [0.2] * (256 * i),
+        )
+    out = StringIO()
+
+    call_command(
+        "benchmark_search",
+        str(corpus.id),
+        "--limit", "3",
+        "--ef-search", "40",
+        "--files", "3",
+        stdout=out,
+    )
+
+    lines = out.getvalue().splitlines()
+    assert lines[0] == "3 queries, top 3 splits, 3/3 files summarized"
+    assert lines[2].startswith("exact")
+    assert lines[3].startswith("vector (ef_search 40)")
+    assert lines[4].startswith("summary (3 files)")
+    # Every file is searched, so nothing the exact scan found is missed
+    assert lines[4].endswith("100.00%")
+
+
+@pytest.mark.django_db
+def test_benchmark_search_needs_embedded_splits():
+    user = User.objects.create(username="testuser", password="password123")
+    corpus = Corpus.objects.create(name="Test Corpus", owner=user)
+
+    with pytest.raises(CommandError):
+        call_command("benchmark_search", str(corpus.id))
+    with pytest.raises(CommandError):
+        call_command("benchmark_search", "not-a-uuid")
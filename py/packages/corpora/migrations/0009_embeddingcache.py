@@ -0,0 +1,83 @@
+# Generated by Django 5.1.2 on 2026-10-18 17:03
+
+import uuid
+
+import django.utils.timezone
+import pgvector.django.vector
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("corpora", "0008_alter_corpustextfile_vector_of_summary"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="corpus",
+            name="url",
+            field=models.URLField(
+                blank=True,
+                help_text="Optional URL associated with the corpus, e.g., a GitHub repository.",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="corpustextfile",
+            name="vector_of_summary",
+            field=pgvector.django.vector.VectorField(
+                blank=True,
+                dimensions=1536,
+                editable=False,
+                help_text="text-embedding-3-small vector of the content",
+                null=True,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="split",
+            name="vector",
+            field=pgvector.django.vector.VectorField(
+                blank=True,
+                dimensions=1536,
+                editable=False,
+                help_text="text-embedding-3-small vector of the content",
+                null=True,
+            ),
+        ),
+        migrations.CreateModel(
+            name="EmbeddingCache",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("model", models.CharField(max_length=255)),
+                (
+                    "content_hash",
+                    models.CharField(
+                        help_text="SHA-256 hex digest of the embedded text",
+                        max_length=64,
+                    ),
+                ),
+                (
+                    "vector",
+                    pgvector.django.vector.VectorField(
+                        dimensions=1536, editable=False,
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now, editable=False,
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("model", "content_hash")},
+            },
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.1.2 on 2026-10-18 17:05
+
+import pgvector.django.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # Build the index without locking splits against writes
+    atomic = False
+
+    dependencies = [
+        ("corpora", "0009_embeddingcache"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="split",
+            index=pgvector.django.indexes.HnswIndex(
+                ef_construction=64,
+                fields=["vector"],
+                m=16,
+                name="split_vector_hnsw_idx",
+                opclasses=["vector_cosine_ops"],
+            ),
+        ),
+    ]
@@ -0,0 +1,31 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("corpora", "0010_split_vector_hnsw_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="split",
+            name="corpus",
+            field=models.ForeignKey(
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="splits",
+                to="corpora.corpus",
+            ),
+        ),
+        migrations.RunSQL(
+            sql="""
+                UPDATE corpora_split AS s
+                SET corpus_id = f.corpus_id
+                FROM corpora_corpustextfile AS f
+                WHERE s.file_id = f.id
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
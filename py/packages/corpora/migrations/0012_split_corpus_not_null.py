@@ -0,0 +1,34 @@
+import django.db.models.deletion
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Separate from the backfill: Postgres refuses ALTER TABLE while the
+    # backfill's deferred FK checks are pending in the same transaction
+    atomic = False
+
+    dependencies = [
+        ("corpora", "0011_split_corpus"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="split",
+            name="corpus",
+            field=models.ForeignKey(
+                editable=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="splits",
+                to="corpora.corpus",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="split",
+            index=models.Index(
+                condition=models.Q(("vector__isnull", False)),
+                fields=["corpus"],
+                name="split_corpus_vector_idx",
+            ),
+        ),
+    ]
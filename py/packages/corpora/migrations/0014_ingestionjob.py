@@ -0,0 +1,38 @@
+# Generated by Django 5.1.2 on 2026-10-18 17:58
+
+import uuid
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("corpora", "0013_upload"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IngestionJob",
+            fields=[
+                ("id", models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ("shards", models.PositiveIntegerField(default=1, help_text="Number of tarballs being ingested.")),
+                ("shards_done", models.PositiveIntegerField(default=0)),
+                ("files_seen", models.PositiveIntegerField(default=0)),
+                ("files_updated", models.PositiveIntegerField(default=0, help_text="Files that changed and were queued for splitting.")),
+                ("files_split", models.PositiveIntegerField(default=0)),
+                ("splits_created", models.PositiveIntegerField(default=0)),
+                ("files_embedded", models.PositiveIntegerField(default=0)),
+                ("vectors_done", models.PositiveIntegerField(default=0)),
+                ("shards_failed", models.PositiveIntegerField(default=0)),
+                ("files_failed", models.PositiveIntegerField(default=0, help_text="Files that failed to split or embed.")),
+                ("ingest_seconds", models.FloatField(default=0)),
+                ("split_seconds", models.FloatField(default=0)),
+                ("embed_seconds", models.FloatField(default=0)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("finished_at", models.DateTimeField(blank=True, null=True)),
+                ("corpus", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="ingestion_jobs", to="corpora.corpus")),
+            ],
+        ),
+    ]
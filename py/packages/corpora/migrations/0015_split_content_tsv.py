@@ -0,0 +1,44 @@
+# Generated by Django 5.1.2 on 2026-10-18 18:06
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Build the index without locking splits against writes
+    atomic = False
+
+    dependencies = [
+        ("corpora", "0014_ingestionjob"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="split",
+            name="content_tsv",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.contrib.postgres.search.SearchVector(
+                    models.Func(
+                        "content",
+                        models.Value("\\W+"),
+                        models.Value(" "),
+                        models.Value("g"),
+                        function="regexp_replace",
+                        output_field=models.TextField(),
+                    ),
+                    config="simple",
+                ),
+                output_field=django.contrib.postgres.search.SearchVectorField(),
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="split",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["content_tsv"],
+                name="split_content_tsv_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.1.2 on 2026-10-18 18:10
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import (
+    AddIndexConcurrently,
+    TrigramExtension,
+)
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # Build the index without locking files against writes
+    atomic = False
+
+    dependencies = [
+        ("corpora", "0015_split_content_tsv"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        AddIndexConcurrently(
+            model_name="corpustextfile",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Lower("path"),
+                    name="gin_trgm_ops",
+                ),
+                name="file_path_trgm_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.1.2 on 2026-10-18 18:16
+
+import pgvector.django.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # Build the index without locking files against writes
+    atomic = False
+
+    dependencies = [
+        ("corpora", "0016_corpustextfile_path_trgm"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="corpustextfile",
+            index=pgvector.django.indexes.HnswIndex(
+                ef_construction=64,
+                fields=["vector_of_summary"],
+                m=16,
+                name="file_summary_vector_hnsw_idx",
+                opclasses=["vector_cosine_ops"],
+            ),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.1.2 on 2026-10-18 18:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("corpora", "0017_file_summary_vector_hnsw_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="corpustextfile",
+            name="summary_checksum",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                help_text="Checksum of the content `ai_summary` was generated from",
+                max_length=40,
+            ),
+        ),
+    ]
@@ -1,19 +1,48 @@
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
+import re
+import tempfile
 import uuid
-from typing import TYPE_CHECKING
+from datetime import timedelta
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
+from asgiref.sync import sync_to_async
+from corpora_ai.count_tokens import truncate_to_tokens
 from corpora_ai.split import get_text_splitter
+from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.db import models
+from django.contrib.postgres.aggregates import StringAgg
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    SearchVectorField,
+    TrigramWordSimilarity,
+)
+from django.core.files import File
+from django.db import connection, models, transaction
+from django.db.models.functions import MD5, Concat, Length, Lower, RowNumber
 from django.utils import timezone
-from pgvector.django import CosineDistance, VectorField
+from pgvector.django import CosineDistance, HnswIndex, VectorField
+
+from .lib.dj.query_embeddings import (
+    aget_query_embedding,
+    get_query_embedding,
+)
+from .lib.dj.rate_limits import acquire_tokens
+from .lib.dj.uploads import (
+    InvalidUploadError,
+    delete_staged_upload,
+    get_upload_storage,
+    stage_upload,
+)
 
 if TYPE_CHECKING:
     from corpora_ai.llm_interface import LLMBaseInterface
-    from django.db.models.manager import BaseManager
 
 
 # TODO: This loads too early and makes it hard to mock
@@ -23,6 +52,137 @@ User = get_user_model()
 
 logger = logging.getLogger(__name__)
 
+# HNSW build parameters for the split vector index. Changing these
+# needs a new migration, which rebuilds the index.
+HNSW_M = 16
+HNSW_EF_CONSTRUCTION = 64
+# pgvector rejects hnsw.ef_search values above this
+HNSW_MAX_EF_SEARCH = 1000
+# Splits are inserted this many per INSERT
+SPLIT_BATCH_SIZE = 500
+# Text search configuration for the split full-text index. "simple"
+# neither stems nor drops stop words, which suits code. Changing it
+# needs a new migration, which regenerates the column.
+SEARCH_CONFIG = "simple"
+SEARCH_MODES = ("vector", "hybrid", "lexical", "summary")
+# Reciprocal rank fusion: a split's hybrid score is the sum of
+# 1 / (RRF_K + rank) over the rankings it appears in
+RRF_K = 60
+# Each ranking contributes at least this many candidates to the fusion
+RRF_CANDIDATES = 50
+PATH_SEARCH_MODES = ("prefix", "substring", "trigram")
+# Summary inputs are counted with this tokenizer; the completion model
+# (gpt-4.1) shares gpt-4o's, which tiktoken knows by name
+SUMMARY_TOKENIZER_MODEL = "gpt-4o"
+# Tokens each summary request is assumed to generate, for rate limiting
+SUMMARY_OUTPUT_TOKENS = 500
+
+
+def format_splits_context(splits: List[Split]) -> str:
+    """Render splits as fenced blocks under their file paths, for prompts."""
+    split_context = ""
+    for split in splits:
+        split_context += f"\n\n{split.file_path}:\n```\n{split.content}\n```\n\n"
+    return split_context
+
+
+def get_lexical_query(text: str) -> Optional[SearchQuery]:
+    """Match splits containing any word of `text`, or None if it has none.
+
+    Words are split on punctuation and underscores the same way
+    `Split.content_tsv` is, so `get_relevant_splits` finds
+    `corpus.get_relevant_splits(...)`.
+    """
+    words = dict.fromkeys(re.findall(r"[^\W_]+", text.lower()))
+    if not words:
+        return None
+    return SearchQuery(" | ".join(words), config=SEARCH_CONFIG, search_type="raw")
+
+
+def fuse_rankings(
+    rankings: List[List[Split]],
+    limit: int,
+    per_corpus_limit: Optional[int] = None,
+) -> List[Split]:
+    """Merge rankings of splits by reciprocal rank fusion, which only
+    needs the ranks, so cosine distances and text ranks needn't share
+    a scale. Ties keep the order of the first ranking.
+    """
+    scores: Dict[uuid.UUID, float] = {}
+    splits: Dict[uuid.UUID, Split] = {}
+    for ranking in rankings:
+        for rank, split in enumerate(ranking, 1):
+            scores[split.id] = scores.get(split.id, 0) + 1 / (RRF_K + rank)
+            splits.setdefault(split.id, split)
+    fused = []
+    per_corpus: Dict[uuid.UUID, int] = {}
+    for split_id in sorted(scores, key=scores.__getitem__, reverse=True):
+        split = splits[split_id]
+        if per_corpus_limit is not None:
+            if per_corpus.get(split.corpus_id, 0) >= per_corpus_limit:
+                continue
+            per_corpus[split.corpus_id] = per_corpus.get(split.corpus_id, 0) + 1
+        fused.append(split)
+        if len(fused) == limit:
+            break
+    return fused
+
+
+def get_ef_search(ef_search: Optional[int], limit: int) -> int:
+    """The `hnsw.ef_search` for a search returning `limit` rows. It
+    defaults to `CORPORA_HNSW_EF_SEARCH` and is never lower than `limit`,
+    since the index returns at most that many rows.
+    """
+    if ef_search is None:
+        ef_search = getattr(settings, "CORPORA_HNSW_EF_SEARCH", 40)
+    return min(max(ef_search, limit), HNSW_MAX_EF_SEARCH)
+
+
+def set_hnsw_search(cursor, ef_search: int) -> None:
+    """Set `hnsw.ef_search` for the current transaction, and let the index
+    scan keep going past `ef_search` candidates until enough rows pass the
+    query's filters. Without the iterative scan, the corpus filter runs
+    only on the `ef_search` nearest splits of *all* corpora, and searches
+    come back short. Rows may come back slightly out of distance order.
+    """
+    cursor.execute("SET LOCAL hnsw.ef_search = %s", [ef_search])
+    cursor.execute("SET LOCAL hnsw.iterative_scan = relaxed_order")
+
+
+def limit_per_corpus(
+    splits: models.QuerySet,
+    order_by: List[models.Expression],
+    per_corpus_limit: int,
+) -> models.QuerySet:
+    """Keep only each corpus's first `per_corpus_limit` splits by `order_by`.
+    The cap is a window function, so it runs in the same query.
+    """
+    return splits.annotate(
+        corpus_rank=models.Window(
+            RowNumber(),
+            partition_by=models.F("corpus_id"),
+            order_by=order_by,
+        ),
+    ).filter(corpus_rank__lte=per_corpus_limit)
+
+
+def nearest_per_corpus(
+    queryset: models.QuerySet,
+    corpus_ids: List[uuid.UUID],
+    order_by: models.Expression | str,
+    per_corpus: int,
+) -> models.QuerySet:
+    """The first `per_corpus` rows of `queryset` by `order_by` in each
+    corpus, merged with one UNION ALL. Each corpus is ranked by a scan of
+    its own, so other corpora can't crowd it out of an index scan's
+    candidates. `corpus_ids` must not be empty.
+    """
+    nearest = [
+        queryset.filter(corpus_id=corpus_id).order_by(order_by)[:per_corpus]
+        for corpus_id in corpus_ids
+    ]
+    return nearest[0].union(*nearest[1:], all=True)
+
 
 class Corpus(models.Model):
     """Represents a unique corpus, often corresponding to a specific repository
@@ -63,42 +223,341 @@ class Corpus(models.Model):
         self,
         text: str,
         limit: int = 10,
-    ) -> BaseManager["Split"]:
-        """Given a text query, return the most relevant splits from this corpus."""
+        ef_search: Optional[int] = None,
+        mode: str = "vector",
+    ) -> List[Split]:
+        """Given a text query, return the most relevant splits from this corpus.
+
+        `mode` is one of `SEARCH_MODES`: "vector" ranks by embedding
+        similarity, "lexical" by full-text match (without embedding the
+        query), and "hybrid" fuses both rankings. "summary" first picks
+        the files whose summaries are nearest, then ranks only their
+        splits; see `_summary_search_splits`.
+
+        `ef_search` sets how many candidates the HNSW index visits, trading
+        speed for recall. It defaults to `CORPORA_HNSW_EF_SEARCH` and is
+        never lower than `limit`, since the index returns at most that many rows.
+        """
+        return Corpus.search_splits([self.id], text, limit, ef_search, mode)
+
+    async def aget_relevant_splits(
+        self,
+        text: str,
+        limit: int = 10,
+        ef_search: Optional[int] = None,
+        mode: str = "vector",
+    ) -> List[Split]:
+        """Async `get_relevant_splits`; the embedding request is awaited
+        rather than blocking a thread.
+        """
+        return await Corpus.asearch_splits([self.id], text, limit, ef_search, mode)
+
+    @classmethod
+    def search_splits(
+        cls,
+        corpus_ids: List[uuid.UUID],
+        text: str,
+        limit: int = 10,
+        ef_search: Optional[int] = None,
+        mode: str = "vector",
+        per_corpus_limit: Optional[int] = None,
+    ) -> List[Split]:
+        """`get_relevant_splits` across several corpora, embedding the query
+        once and ranking all their splits together.
+
+        `per_corpus_limit` caps how many splits any one corpus contributes,
+        so a large corpus can't crowd out the rest. Each corpus's nearest
+        splits are ranked by a scan of their own and then merged, which
+        keeps each scan on the HNSW index; hybrid mode caps both of its
+        rankings this way, and summary mode picks each corpus's files.
+        """
         from corpora_ai.provider_loader import load_llm_provider
 
-        llm: LLMBaseInterface = load_llm_provider("openai")
-        vector = llm.get_embedding(text)
-        return (
-            Split.objects.filter(
-                vector__isnull=False,
-                file__corpus_id=self.id,
+        vector = None
+        if cls._needs_embedding(mode):
+            llm: LLMBaseInterface = load_llm_provider("openai")
+            vector = get_query_embedding(llm, text)
+        return cls._search(
+            corpus_ids, text, vector, limit, ef_search, mode, per_corpus_limit,
+        )
+
+    @classmethod
+    async def asearch_splits(
+        cls,
+        corpus_ids: List[uuid.UUID],
+        text: str,
+        limit: int = 10,
+        ef_search: Optional[int] = None,
+        mode: str = "vector",
+        per_corpus_limit: Optional[int] = None,
+    ) -> List[Split]:
+        """Async `search_splits`."""
+        from corpora_ai.provider_loader import load_llm_provider
+
+        vector = None
+        if cls._needs_embedding(mode):
+            llm: LLMBaseInterface = load_llm_provider("openai")
+            vector = await aget_query_embedding(llm, text)
+        return await sync_to_async(cls._search)(
+            corpus_ids, text, vector, limit, ef_search, mode, per_corpus_limit,
+        )
+
+    @staticmethod
+    def _needs_embedding(mode: str) -> bool:
+        if mode not in SEARCH_MODES:
+            raise ValueError(f"Unknown search mode {mode!r}.")
+        return mode != "lexical"
+
+    @classmethod
+    def _search(
+        cls,
+        corpus_ids: List[uuid.UUID],
+        text: str,
+        vector: Optional[List[float]],
+        limit: int,
+        ef_search: Optional[int],
+        mode: str,
+        per_corpus_limit: Optional[int],
+    ) -> List[Split]:
+        if mode == "lexical":
+            return cls._lexical_search_splits(
+                corpus_ids, text, limit, per_corpus_limit,
+            )
+        if mode == "hybrid":
+            candidates = max(limit, RRF_CANDIDATES)
+            # Both rankings are capped per corpus, so one corpus can't
+            # fill every candidate slot before the fusion
+            return fuse_rankings(
+                [
+                    cls._search_splits(
+                        corpus_ids, vector, candidates, ef_search, per_corpus_limit,
+                    ),
+                    cls._lexical_search_splits(
+                        corpus_ids, text, candidates, per_corpus_limit,
+                    ),
+                ],
+                limit,
+                per_corpus_limit,
+            )
+        if mode == "summary":
+            return cls._summary_search_splits(
+                corpus_ids, vector, limit, ef_search, per_corpus_limit,
+            )
+        return cls._search_splits(
+            corpus_ids, vector, limit, ef_search, per_corpus_limit,
+        )
+
+    @staticmethod
+    def _search_splits(
+        corpus_ids: List[uuid.UUID],
+        vector: List[float],
+        limit: int,
+        ef_search: Optional[int],
+        per_corpus_limit: Optional[int] = None,
+        file_ids: Optional[List[uuid.UUID]] = None,
+    ) -> List[Split]:
+        ef_search = get_ef_search(ef_search, limit)
+        distance = CosineDistance("vector", vector)
+        splits = Split.objects.filter(
+            vector__isnull=False,
+            corpus_id__in=corpus_ids,
+        )
+        if file_ids is not None:
+            # A literal list gives the planner row estimates low enough
+            # to rank these files' splits exactly, not post-filter the index
+            splits = splits.filter(file_id__in=file_ids)
+        splits = (
+            # Leave the vector itself behind; callers only need the text
+            splits.only("id", "corpus", "file", "order", "content")
+            .annotate(
+                similarity=distance,
+                file_path=models.F("file__path"),
             )
-            .annotate(similarity=CosineDistance("vector", vector))
-            .order_by("similarity")[:limit]
         )
+        if per_corpus_limit is None:
+            splits = splits.order_by("similarity")[:limit]
+        elif file_ids is not None:
+            # Few enough splits to rank and cap them all in one query
+            splits = limit_per_corpus(
+                splits, [distance], per_corpus_limit,
+            ).order_by("similarity")[:limit]
+        elif not corpus_ids:
+            return []
+        else:
+            splits = nearest_per_corpus(
+                splits, corpus_ids, "similarity", min(per_corpus_limit, limit),
+            ).order_by("similarity")[:limit]
+        # SET LOCAL only lasts until the end of the transaction,
+        # so the query has to run inside it
+        with transaction.atomic(), connection.cursor() as cursor:
+            set_hnsw_search(cursor, ef_search)
+            # relaxed_order can return rows slightly out of distance order
+            return sorted(splits, key=lambda split: split.similarity)
+
+    @classmethod
+    def _summary_search_splits(
+        cls,
+        corpus_ids: List[uuid.UUID],
+        vector: List[float],
+        limit: int,
+        ef_search: Optional[int],
+        per_corpus_limit: Optional[int] = None,
+        files: Optional[int] = None,
+    ) -> List[Split]:
+        """Two-stage search: rank files by `vector_of_summary`, an index
+        with one row per file rather than one per split, then rank the
+        splits of the nearest `files` (`CORPORA_SUMMARY_SEARCH_FILES`).
+
+        With `per_corpus_limit`, each corpus gets its own nearest `files`,
+        so one corpus can't take every file before the cap applies.
+
+        Files without a summary vector can't be picked. If none of the
+        corpora have any, this falls back to ranking all splits.
+        """
+        if files is None:
+            files = getattr(settings, "CORPORA_SUMMARY_SEARCH_FILES", 20)
+        ef_search = get_ef_search(ef_search, files)
+        summarized = CorpusTextFile.objects.filter(
+            corpus_id__in=corpus_ids,
+            vector_of_summary__isnull=False,
+        ).only("id")
+        distance = CosineDistance("vector_of_summary", vector)
+        if per_corpus_limit is None or not corpus_ids:
+            nearest = summarized.order_by(distance)[:files]
+        else:
+            nearest = nearest_per_corpus(summarized, corpus_ids, distance, files)
+        with transaction.atomic(), connection.cursor() as cursor:
+            set_hnsw_search(cursor, ef_search)
+            file_ids = [file.id for file in nearest]
+        return cls._search_splits(
+            corpus_ids,
+            vector,
+            limit,
+            ef_search,
+            per_corpus_limit,
+            # Nothing summarized yet: rank all splits instead
+            file_ids or None,
+        )
+
+    @staticmethod
+    def _lexical_search_splits(
+        corpus_ids: List[uuid.UUID],
+        text: str,
+        limit: int,
+        per_corpus_limit: Optional[int] = None,
+    ) -> List[Split]:
+        query = get_lexical_query(text)
+        if query is None:
+            return []
+        # Normalized by log length, so long splits don't win on
+        # repetition alone
+        rank = SearchRank(models.F("content_tsv"), query, normalization=1)
+        splits = (
+            # Splits are searchable before their vectors are generated
+            Split.objects.filter(corpus_id__in=corpus_ids, content_tsv=query)
+            .only("id", "corpus", "file", "order", "content")
+            .annotate(rank=rank, file_path=models.F("file__path"))
+        )
+        if per_corpus_limit is not None:
+            splits = limit_per_corpus(
+                splits, [rank.desc(), models.F("id").asc()], per_corpus_limit,
+            )
+        return list(splits.order_by("-rank", "id")[:limit])
 
     def get_relevant_splits_context(self, text: str, limit: int = 5) -> str:
         """Given a text query, return the most relevant splits from this corpus
         along with the context of the split.
         """
-        splits = self.get_relevant_splits(text, limit)
-        split_context = ""
-        for split in splits:
-            split_context += (
-                f"\n\n{split.file.path}:\n```\n{split.content}\n```\n\n"
+        return format_splits_context(self.get_relevant_splits(text, limit))
+
+    async def aget_relevant_splits_context(
+        self,
+        text: str,
+        limit: int = 5,
+    ) -> str:
+        """Async `get_relevant_splits_context`."""
+        splits = await self.aget_relevant_splits(text, limit)
+        return format_splits_context(splits)
+
+    def find_files(
+        self,
+        text: str,
+        mode: str = "trigram",
+        limit: int = 20,
+    ) -> List[CorpusTextFile]:
+        """Find files by path, ignoring case, without loading their content.
+
+        `mode` is one of `PATH_SEARCH_MODES`: "prefix" and "substring"
+        match literally, shortest paths first; "trigram" also forgives
+        typos and ranks by pg_trgm word similarity, so `modles` finds
+        `corpora/models.py`. All three are served by the path trigram index.
+        """
+        if mode not in PATH_SEARCH_MODES:
+            raise ValueError(f"Unknown path search mode {mode!r}.")
+        text = text.lower()
+        files = self.files.alias(lower_path=Lower("path")).only("id", "path")
+        if mode == "prefix":
+            files = files.filter(lower_path__startswith=text)
+        elif mode == "substring":
+            files = files.filter(lower_path__contains=text)
+        else:
+            files = files.filter(lower_path__trigram_word_similar=text).annotate(
+                similarity=TrigramWordSimilarity(text, "lower_path"),
             )
-        return split_context
+        order = ["-similarity"] if mode == "trigram" else []
+        return list(files.order_by(*order, Length("path"), "path")[:limit])
 
     def get_file_hashes(self) -> dict:
         """Retrieve a map of file paths to their hashes for this Corpus."""
         # TODO: types?
-        return {file.path: file.checksum for file in self.files.all()}
+        return dict(self.files.values_list("path", "checksum"))
+
+    def get_file_hashes_etag(self) -> str:
+        """An ETag for `get_file_hashes`, changing whenever any path or
+        checksum does. Digested in Postgres, so no rows come back.
+        """
+        digest = self.files.aggregate(
+            digest=MD5(
+                StringAgg(
+                    Concat("path", models.Value(" "), "checksum"),
+                    delimiter="\n",
+                    ordering="path",
+                ),
+            ),
+        )["digest"]
+        return f'"{digest or "empty"}"'
 
     def delete_files(self, files: list) -> None:
         """Delete files from this Corpus by path."""
         self.files.filter(path__in=files).delete()
 
+    def upsert_files(
+        self,
+        files: List["CorpusTextFile"],
+    ) -> List["CorpusTextFile"]:
+        """Create or update a batch of files by path in a single INSERT ..
+        ON CONFLICT. Returns the saved files with their primary keys set.
+
+        Existing splits are left for `CorpusTextFile.split_files` to diff
+        against, so unchanged ones keep their vectors.
+        """
+        # ON CONFLICT can't touch the same row twice in one statement
+        by_path = {file.path: file for file in files}
+        # bulk_create doesn't overwrite client-side UUIDs on conflict,
+        # so reuse the ids of rows that already exist
+        existing_ids = dict(
+            self.files.filter(path__in=by_path).values_list("path", "id"),
+        )
+        for path, file in by_path.items():
+            file.corpus = self
+            file.id = existing_ids.get(path, file.id)
+        return CorpusTextFile.objects.bulk_create(
+            by_path.values(),
+            update_conflicts=True,
+            unique_fields=["corpus", "path"],
+            update_fields=["content", "checksum", "updated_at"],
+        )
+
 
 class CorpusTextFile(models.Model):
     """A file with UTF-8 text content associated with a Corpus."""
@@ -124,12 +583,33 @@ class CorpusTextFile(models.Model):
         editable=False,
         help_text="SHA1 checksum of the file content as in `git hash-object`",
     )
+    summary_checksum = models.CharField(
+        max_length=40,
+        blank=True,
+        editable=False,
+        help_text="Checksum of the content `ai_summary` was generated from",
+    )
     created_at = models.DateTimeField(default=timezone.now, editable=False)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         unique_together = ("corpus", "path")
         ordering = ["path"]
+        indexes = [
+            # Serves prefix, substring and fuzzy path search (`find_files`)
+            GinIndex(
+                OpClass(Lower("path"), name="gin_trgm_ops"),
+                name="file_path_trgm_idx",
+            ),
+            # First stage of the "summary" search mode
+            HnswIndex(
+                name="file_summary_vector_hnsw_idx",
+                fields=["vector_of_summary"],
+                m=HNSW_M,
+                ef_construction=HNSW_EF_CONSTRUCTION,
+                opclasses=["vector_cosine_ops"],
+            ),
+        ]
 
     def __str__(self):
         return f"{self.corpus.name}:{self.path}"
@@ -145,6 +625,73 @@ class CorpusTextFile(models.Model):
     def _get_text_representation(self):
         return f"{self.corpus.name}:{self.path}\n\n{self.content}"
 
+    @classmethod
+    def summarize_files(cls, files: List[CorpusTextFile]) -> int:
+        """Summarize the files whose content changed since their last
+        summary, then embed the new summaries, and any earlier ones left
+        without a vector, in one batch. Returns the number of files summarized.
+
+        Each summary is saved as soon as it comes back, so a failed
+        request or embedding doesn't lose the completions already paid
+        for. A file whose request fails is logged and left for a later run.
+
+        Inputs are cut to `CORPORA_SUMMARY_INPUT_TOKENS` and each request
+        waits its turn in the shared "summaries" tokens-per-minute budget.
+        The files need their corpus loaded.
+        """
+        from corpora_ai.provider_loader import load_llm_provider
+
+        to_summarize = [
+            file
+            for file in files
+            if file.content and file.summary_checksum != file.checksum
+        ]
+        # Summarized before, but the embedding request failed
+        to_embed = [
+            file
+            for file in files
+            if file.ai_summary
+            and file.summary_checksum == file.checksum
+            and file.vector_of_summary is None
+        ]
+        if not to_summarize and not to_embed:
+            return 0
+        llm = load_llm_provider()
+        summarized = 0
+        for file in to_summarize:
+            text, tokens = truncate_to_tokens(
+                file._get_text_representation(),
+                settings.CORPORA_SUMMARY_INPUT_TOKENS,
+                SUMMARY_TOKENIZER_MODEL,
+            )
+            acquire_tokens(
+                "summaries",
+                tokens + SUMMARY_OUTPUT_TOKENS,
+                settings.CORPORA_SUMMARY_TOKENS_PER_MINUTE,
+            )
+            try:
+                file.ai_summary = llm.get_summary(text)
+            except Exception:
+                logger.exception(f"{file.corpus.name}: failed to summarize {file.path}")
+                continue
+            file.summary_checksum = file.checksum
+            # The old vector is of the old summary
+            file.vector_of_summary = None
+            file.save(
+                update_fields=["ai_summary", "vector_of_summary", "summary_checksum"],
+            )
+            summarized += 1
+            if file.ai_summary:
+                to_embed.append(file)
+        if to_embed:
+            vectors, _ = EmbeddingCache.get_embeddings(
+                llm, [file.ai_summary for file in to_embed],
+            )
+            for file, vector in zip(to_embed, vectors):
+                file.vector_of_summary = vector
+            cls.objects.bulk_update(to_embed, ["vector_of_summary"])
+        return summarized
+
     def get_and_save_vector_of_summary(self):
         from corpora_ai.provider_loader import load_llm_provider
 
@@ -153,27 +700,75 @@ class CorpusTextFile(models.Model):
         self.vector_of_summary = vector
         self.save(update_fields=["vector_of_summary"])
 
-    def split_content(self):
-        """Splits the content of the file into smaller parts using an appropriate text splitter.
-        Returns a list of Split instances.
+    def build_splits(self) -> List[Split]:
+        """Split the content with the text splitter for the file's type,
+        returning unsaved Split instances in order.
         """
         file_name = os.path.basename(self.path)
         splitter = get_text_splitter(file_name)
+        return [
+            Split(corpus_id=self.corpus_id, file=self, order=order, content=part)
+            for order, part in enumerate(splitter.split_text(self.content))
+        ]
 
-        # Split content into parts
-        parts = splitter.split_text(self.content)
-        splits = []
+    def split_content(
+        self,
+        *,
+        batch_size: int = SPLIT_BATCH_SIZE,
+        diff: bool = False,
+    ) -> List[Split]:
+        """Split the content and replace the file's splits with the new ones,
+        inserted `batch_size` at a time. Returns the created splits.
+
+        With `diff`, existing splits with the same order and content are
+        kept, vectors and all, and only the others are replaced.
+        """
+        return self.split_files([self], batch_size=batch_size, diff=diff)
 
-        # Create Split instances for each part
-        for order, part in enumerate(parts):
-            split = Split.objects.create(file=self, order=order, content=part)
-            splits.append(split)
+    @classmethod
+    def split_files(
+        cls,
+        files: List[CorpusTextFile],
+        *,
+        batch_size: int = SPLIT_BATCH_SIZE,
+        diff: bool = False,
+    ) -> List[Split]:
+        """`split_content` for many files, with one query for their
+        existing splits, one DELETE and bulk INSERTs.
+        """
+        splits = [split for file in files for split in file.build_splits()]
+        existing = Split.objects.filter(file__in=files)
+        if not diff:
+            existing.delete()
+            return Split.objects.bulk_create(splits, batch_size=batch_size)
 
-        return splits
+        # (file, order, content hash) -> id of each existing split; the
+        # ones no new split matches are stale
+        stale = {
+            (file_id, order, EmbeddingCache.hash_content(content)): split_id
+            for split_id, file_id, order, content in existing.values_list(
+                "id", "file_id", "order", "content",
+            )
+        }
+        created = []
+        for split in splits:
+            content_hash = EmbeddingCache.hash_content(split.content)
+            if stale.pop((split.file_id, split.order, content_hash), None) is None:
+                created.append(split)
+        if stale:
+            Split.objects.filter(id__in=stale.values()).delete()
+        return Split.objects.bulk_create(created, batch_size=batch_size)
 
 
 class Split(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    # Denormalized from file.corpus so vector search can filter without a join
+    corpus = models.ForeignKey(
+        Corpus,
+        on_delete=models.CASCADE,
+        related_name="splits",
+        editable=False,
+    )
     file = models.ForeignKey(
         CorpusTextFile,
         on_delete=models.CASCADE,
@@ -196,14 +791,53 @@ class Split(models.Model):
     #     size=None,  # Set to None for variable-length arrays
     # )
     metadata = models.JSONField(default=dict, blank=True)
+    # Punctuation is blanked out first so that dotted names and paths
+    # index as their parts, which Postgres's parser would otherwise keep whole
+    content_tsv = models.GeneratedField(
+        expression=SearchVector(
+            models.Func(
+                "content",
+                models.Value(r"\W+"),
+                models.Value(" "),
+                models.Value("g"),
+                function="regexp_replace",
+                output_field=models.TextField(),
+            ),
+            config=SEARCH_CONFIG,
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
 
     class Meta:
         unique_together = ("file", "order")
         ordering = ["file", "order"]
+        indexes = [
+            HnswIndex(
+                name="split_vector_hnsw_idx",
+                fields=["vector"],
+                m=HNSW_M,
+                ef_construction=HNSW_EF_CONSTRUCTION,
+                opclasses=["vector_cosine_ops"],
+            ),
+            # Lets the planner rank a small corpus's splits exactly
+            # instead of post-filtering the HNSW scan
+            models.Index(
+                name="split_corpus_vector_idx",
+                fields=["corpus"],
+                condition=models.Q(vector__isnull=False),
+            ),
+            GinIndex(name="split_content_tsv_idx", fields=["content_tsv"]),
+        ]
 
     def __str__(self):
         return f"{self.file.corpus.name}:{self.file.path}:{self.order}"
 
+    def save(self, *args, **kwargs):
+        if self.corpus_id is None:
+            self.corpus_id = self.file.corpus_id
+        super().save(*args, **kwargs)
+
     def get_and_save_vector(self):
         logger.info(
             f"{self.file.path}: {self.content[:10]} ... {self.content[-10:]}",
@@ -211,12 +845,357 @@ class Split(models.Model):
         from corpora_ai.provider_loader import load_llm_provider
 
         llm = load_llm_provider()
-        vector = llm.get_embedding(self.content)
+        vector = EmbeddingCache.get_embedding(llm, self.content)
         self.vector = vector
         self.save(update_fields=["vector"])
 
+    @classmethod
+    def get_and_save_vectors(cls, splits: List[Split]) -> Dict[str, int]:
+        """Embed many splits with batched provider calls and write all of
+        the vectors back with a single bulk update.
+        Returns the embedding cache hit/miss counts.
+        """
+        splits = [split for split in splits if split.content]
+        if not splits:
+            return {"hits": 0, "misses": 0}
+        from corpora_ai.provider_loader import load_llm_provider
+
+        llm = load_llm_provider()
+        vectors, stats = EmbeddingCache.get_embeddings(
+            llm,
+            [split.content for split in splits],
+        )
+        for split, vector in zip(splits, vectors):
+            split.vector = vector
+        cls.objects.bulk_update(splits, ["vector"], batch_size=500)
+        return stats
+
     # # Optionally, for multi-vector storage
     # def get_and_save_colbert_vectors(self):
     #     colbert_vectors = generate_colbert_vectors(self.content)  # e.g., a list of 128-dim vectors
     #     self.colbert_embeddings = colbert_vectors
     #     self.save(update_fields=["colbert_embeddings"])
+
+
+class EmbeddingCache(models.Model):
+    """A previously computed embedding, keyed by the embedding model and a
+    SHA-256 of the embedded text. Identical content (license headers,
+    vendored files, the same file in another corpus) is embedded only once.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    model = models.CharField(max_length=255)
+    content_hash = models.CharField(
+        max_length=64,
+        help_text="SHA-256 hex digest of the embedded text",
+    )
+    vector = VectorField(dimensions=1536, editable=False)
+    created_at = models.DateTimeField(default=timezone.now, editable=False)
+
+    class Meta:
+        unique_together = ("model", "content_hash")
+
+    def __str__(self):
+        return f"{self.model}:{self.content_hash}"
+
+    @staticmethod
+    def hash_content(text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def get_embedding(cls, llm: LLMBaseInterface, text: str) -> List[float]:
+        """Return the cached embedding of `text`, embedding and caching it
+        on a miss.
+        """
+        content_hash = cls.hash_content(text)
+        cached = (
+            cls.objects.filter(model=llm.embedding_model, content_hash=content_hash)
+            .values_list("vector", flat=True)
+            .first()
+        )
+        if cached is not None:
+            logger.info("embedding cache: 1 hits, 0 misses")
+            return cached
+        vector = llm.get_embedding(text)
+        cls.objects.bulk_create(
+            [
+                cls(
+                    model=llm.embedding_model,
+                    content_hash=content_hash,
+                    vector=vector,
+                ),
+            ],
+            ignore_conflicts=True,
+        )
+        logger.info("embedding cache: 0 hits, 1 misses")
+        return vector
+
+    @classmethod
+    def get_embeddings(
+        cls,
+        llm: LLMBaseInterface,
+        texts: List[str],
+    ) -> Tuple[List[List[float]], Dict[str, int]]:
+        """Return embeddings for `texts` in order, only sending texts that
+        aren't cached yet to the provider, once each.
+        Also returns the hit/miss counts.
+        """
+        hashes = [cls.hash_content(text) for text in texts]
+        vectors = dict(
+            cls.objects.filter(
+                model=llm.embedding_model,
+                content_hash__in=set(hashes),
+            ).values_list("content_hash", "vector"),
+        )
+        text_by_hash = dict(zip(hashes, texts))
+        missing = [h for h in text_by_hash if h not in vectors]
+        if missing:
+            embedded = llm.get_embeddings([text_by_hash[h] for h in missing])
+            cls.objects.bulk_create(
+                [
+                    cls(model=llm.embedding_model, content_hash=h, vector=vector)
+                    for h, vector in zip(missing, embedded)
+                ],
+                ignore_conflicts=True,
+            )
+            vectors.update(zip(missing, embedded))
+        stats = {"hits": len(texts) - len(missing), "misses": len(missing)}
+        logger.info(
+            f"embedding cache: {stats['hits']} hits, {stats['misses']} misses",
+        )
+        return [vectors[h] for h in hashes], stats
+
+
+class Upload(models.Model):
+    """A tarball uploaded in parts, so an interrupted upload resumes where
+    it stopped instead of starting over. Parts are kept in the staging
+    store until `complete` joins them into a regular staged upload, which
+    `create_corpus` or `update_files` then hand to `process_tarball`.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    owner = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="uploads",
+    )
+    size = models.PositiveBigIntegerField(help_text="Total size in bytes.")
+    sha256 = models.CharField(
+        max_length=64,
+        blank=True,
+        help_text="Optional SHA-256 hex digest of the whole tarball, "
+        "checked on completion.",
+    )
+    staged_name = models.CharField(
+        max_length=255,
+        blank=True,
+        help_text="Name of the joined tarball in the staging store.",
+    )
+    created_at = models.DateTimeField(default=timezone.now, editable=False)
+    completed_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"{self.id} ({self.size} bytes)"
+
+    @property
+    def parts_dir(self) -> str:
+        return f"parts/{self.id}"
+
+    def save_part(self, offset: int, part: File, sha256: str) -> UploadPart:
+        """Store the bytes at `offset`, replacing any earlier attempt.
+
+        Raises `InvalidUploadError` if the part doesn't fit or its
+        checksum doesn't match.
+        """
+        if self.completed_at:
+            raise InvalidUploadError("Upload is already complete.")
+        if part.size == 0 or offset < 0 or offset + part.size > self.size:
+            raise InvalidUploadError(
+                f"Part of {part.size} bytes at offset {offset} doesn't fit "
+                f"an upload of {self.size} bytes.",
+            )
+        digest = hashlib.sha256()
+        for chunk in part.chunks():
+            digest.update(chunk)
+        if digest.hexdigest() != sha256:
+            raise InvalidUploadError(f"Checksum mismatch for part at {offset}.")
+
+        storage = get_upload_storage()
+        name = f"{self.parts_dir}/{offset:015d}"
+        storage.delete(name)
+        storage.save(name, part)
+        upload_part, _ = UploadPart.objects.update_or_create(
+            upload=self,
+            offset=offset,
+            defaults={"size": part.size, "sha256": sha256},
+        )
+        return upload_part
+
+    def complete(self) -> None:
+        """Join the parts into a staged tarball.
+
+        Raises `InvalidUploadError` if parts are missing or overlap, or if
+        the joined tarball doesn't match `sha256`.
+        """
+        if self.completed_at:
+            return
+        parts = list(self.parts.order_by("offset"))
+        end = 0
+        for part in parts:
+            if part.offset != end:
+                raise InvalidUploadError(
+                    f"Expected a part at offset {end}, got {part.offset}.",
+                )
+            end += part.size
+        if end != self.size:
+            raise InvalidUploadError(
+                f"Received {end} of {self.size} bytes.",
+            )
+
+        storage = get_upload_storage()
+        digest = hashlib.sha256()
+        with tempfile.TemporaryFile() as joined:
+            for part in parts:
+                with storage.open(f"{self.parts_dir}/{part.offset:015d}") as f:
+                    while chunk := f.read(1024 * 1024):
+                        digest.update(chunk)
+                        joined.write(chunk)
+            if self.sha256 and digest.hexdigest() != self.sha256:
+                raise InvalidUploadError("Checksum mismatch for the upload.")
+            joined.seek(0)
+            self.staged_name = stage_upload(File(joined))
+
+        self.delete_parts()
+        self.completed_at = timezone.now()
+        self.save(update_fields=["staged_name", "completed_at"])
+
+    def delete_parts(self) -> None:
+        storage = get_upload_storage()
+        try:
+            _, names = storage.listdir(self.parts_dir)
+        except FileNotFoundError:
+            names = []
+        for name in names:
+            storage.delete(f"{self.parts_dir}/{name}")
+        self.parts.all().delete()
+
+    @classmethod
+    def claim(cls, upload_ids: List[uuid.UUID], owner: User) -> List[str]:
+        """Take completed uploads for ingestion and return their staged
+        names, in the same order.
+
+        The uploads are deleted, so they can't be ingested twice; the staged
+        tarballs are now `process_tarball`'s to delete. Raises
+        `DoesNotExist`, claiming none of them, if any isn't a completed
+        upload of `owner`'s or is listed twice.
+        """
+        with transaction.atomic():
+            uploads = {
+                upload.id: upload
+                for upload in cls.objects.select_for_update().filter(
+                    id__in=upload_ids,
+                    owner=owner,
+                    completed_at__isnull=False,
+                )
+            }
+            if len(uploads) != len(upload_ids):
+                raise cls.DoesNotExist
+            cls.objects.filter(id__in=uploads).delete()
+        return [uploads[upload_id].staged_name for upload_id in upload_ids]
+
+    @classmethod
+    def delete_expired(cls) -> int:
+        """Delete uploads older than `CORPORA_UPLOAD_TTL`, with their parts
+        and any staged tarball nobody claimed. Returns the count.
+        """
+        cutoff = timezone.now() - timedelta(seconds=settings.CORPORA_UPLOAD_TTL)
+        expired = list(cls.objects.filter(created_at__lt=cutoff))
+        for upload in expired:
+            upload.delete_parts()
+            if upload.staged_name:
+                delete_staged_upload(upload.staged_name)
+            upload.delete()
+        return len(expired)
+
+
+class UploadPart(models.Model):
+    """One received piece of an `Upload`."""
+
+    upload = models.ForeignKey(
+        Upload,
+        on_delete=models.CASCADE,
+        related_name="parts",
+    )
+    offset = models.PositiveBigIntegerField()
+    size = models.PositiveIntegerField()
+    sha256 = models.CharField(max_length=64)
+
+    class Meta:
+        unique_together = ("upload", "offset")
+
+    def __str__(self):
+        return f"{self.upload_id}@{self.offset}"
+
+
+class IngestionJob(models.Model):
+    """Progress of one `create_corpus` or `update_files` ingestion, from
+    the uploaded tarballs through splitting and embedding every changed
+    file. Tasks add to the counters as they go, with `record`.
+
+    The job is finished once every shard is done and every updated file
+    has been embedded or has failed.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    corpus = models.ForeignKey(
+        Corpus,
+        on_delete=models.CASCADE,
+        related_name="ingestion_jobs",
+    )
+    shards = models.PositiveIntegerField(
+        default=1,
+        help_text="Number of tarballs being ingested.",
+    )
+    shards_done = models.PositiveIntegerField(default=0)
+    files_seen = models.PositiveIntegerField(default=0)
+    files_updated = models.PositiveIntegerField(
+        default=0,
+        help_text="Files that changed and were queued for splitting.",
+    )
+    files_split = models.PositiveIntegerField(default=0)
+    splits_created = models.PositiveIntegerField(default=0)
+    files_embedded = models.PositiveIntegerField(default=0)
+    vectors_done = models.PositiveIntegerField(default=0)
+    shards_failed = models.PositiveIntegerField(default=0)
+    files_failed = models.PositiveIntegerField(
+        default=0,
+        help_text="Files that failed to split or embed.",
+    )
+    # Seconds spent in each stage, summed over workers
+    ingest_seconds = models.FloatField(default=0)
+    split_seconds = models.FloatField(default=0)
+    embed_seconds = models.FloatField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"{self.corpus_id}:{self.id}"
+
+    @classmethod
+    def record(cls, job_id: Optional[str], **counts: float) -> None:
+        """Add to the job's counters and timings, and mark it finished if
+        that was the last of its work. Does nothing without a `job_id`,
+        for tasks queued outside of a job.
+        """
+        if job_id is None:
+            return
+        with transaction.atomic():
+            cls.objects.filter(id=job_id).update(
+                **{field: models.F(field) + value for field, value in counts.items()},
+            )
+            cls.objects.filter(
+                id=job_id,
+                finished_at__isnull=True,
+                shards_done__gte=models.F("shards"),
+                files_updated__lte=models.F("files_embedded") + models.F("files_failed"),
+            ).update(finished_at=timezone.now())
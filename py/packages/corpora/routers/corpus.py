@@ -5,9 +5,11 @@ from asgiref.sync import sync_to_async
 from corpora_ai.llm_interface import ChatCompletionTextMessage
 from corpora_ai.prompts import CHAT_SYSTEM_MESSAGE
 from corpora_ai.provider_loader import load_llm_provider
+from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.db import IntegrityError
-from django.http import HttpRequest
+from django.http import HttpRequest, HttpResponse, HttpResponseNotModified
+from django.utils.http import parse_etags
 from ninja import File, Form, Router
 from ninja.errors import HttpError
 from ninja.files import UploadedFile
@@ -17,9 +19,24 @@ from corpora.schema.chat import CorpusChatSchema, get_additional_context
 
 from ..auth import BearerAuth
 from ..lib.dj.decorators import async_raise_not_found
-from ..models import Corpus
-from ..schema.core import CorpusResponseSchema, CorpusSchema
-from ..tasks.sync import process_tarball
+from ..lib.dj.responses import text_stream_response
+from ..lib.dj.uploads import (
+    InvalidUploadError,
+    UploadTooLargeError,
+    check_upload_size,
+    delete_staged_upload,
+    stage_upload,
+)
+from ..models import Corpus, IngestionJob, Upload
+from ..schema.core import (
+    CorpusResponseSchema,
+    CorpusSchema,
+    IngestionJobResponseSchema,
+    UploadPartResponseSchema,
+    UploadResponseSchema,
+    UploadSchema,
+)
+from ..tasks.sync import ingest_uploads
 
 corpus_router = Router(tags=["corpus"], auth=BearerAuth())
 
@@ -30,16 +47,19 @@ class CorpusUpdateFilesSchema(BaseModel):
 
 @corpus_router.post(
     "",
-    response={201: CorpusResponseSchema, 400: str, 409: str},
+    response={201: CorpusResponseSchema, 400: str, 404: str, 409: str, 413: str},
     operation_id="create_corpus",
 )
 async def create_corpus(
     request,
     corpus: CorpusSchema = Form(...),
-    tarball: UploadedFile = File(...),
+    tarball: Optional[UploadedFile] = File(None),
+    upload_ids: Optional[List[str]] = Form(None),
 ):
-    """Create a new Corpus with an uploaded tarball."""
-    tarball_content: bytes = await sync_to_async(tarball.read)()
+    """Create a new Corpus with an uploaded tarball, or the tarballs of
+    completed resumable uploads, ingested in parallel.
+    """
+    upload_names = await stage_tarballs(request, tarball, upload_ids)
     try:
         corpus_instance = await Corpus.objects.acreate(
             name=corpus.name,
@@ -47,14 +67,47 @@ async def create_corpus(
             owner=request.user,
         )
     except IntegrityError:
+        await delete_staged_uploads(upload_names)
         raise HttpError(409, "A corpus with this name already exists for this owner.")
     except ValidationError:
+        await delete_staged_uploads(upload_names)
         raise HttpError(400, "Invalid data provided.")
 
-    process_tarball.delay(str(corpus_instance.id), tarball_content)
+    await sync_to_async(ingest_uploads)(str(corpus_instance.id), upload_names)
     return 201, corpus_instance
 
 
+async def stage_tarballs(
+    request: HttpRequest,
+    tarball: Optional[UploadedFile],
+    upload_ids: Optional[List[str]],
+) -> List[str]:
+    """Return the staged names of the tarballs for `ingest_uploads`,
+    saving the tarball if it was uploaded with this request.
+    """
+    if (tarball is None) == (not upload_ids):
+        raise HttpError(400, "Send either a tarball or upload_ids.")
+    if upload_ids:
+        try:
+            # Generated clients send form lists comma-separated
+            ids = [uuid.UUID(i) for value in upload_ids for i in value.split(",")]
+        except ValueError:
+            raise HttpError(400, "upload_ids must be UUIDs.")
+        try:
+            return await sync_to_async(Upload.claim)(ids, request.user)
+        except Upload.DoesNotExist:
+            raise HttpError(404, "Not all upload_ids are completed uploads.")
+    try:
+        return [await sync_to_async(stage_upload)(tarball)]
+    except UploadTooLargeError as e:
+        raise HttpError(413, str(e))
+
+
+async def delete_staged_uploads(upload_names: List[str]) -> None:
+    for upload_name in upload_names:
+        await sync_to_async(delete_staged_upload)(upload_name)
+
+
 @corpus_router.post(
     "/chat",
     response={200: str, 404: str},
@@ -64,18 +117,42 @@ async def create_corpus(
 async def chat(request, payload: CorpusChatSchema):
     """Chat with the Corpus."""
     corpus = await Corpus.objects.aget(id=payload.corpus_id)
+    all_messages = await get_chat_messages(corpus, payload)
+    llm = load_llm_provider()
+    resp = await llm.aget_text_completion(all_messages)
+    return resp
+
+
+@corpus_router.post(
+    "/chat/stream",
+    response={200: str, 404: str},
+    operation_id="chat_stream",
+)
+@async_raise_not_found
+async def chat_stream(request, payload: CorpusChatSchema):
+    """Chat with the Corpus, streaming the reply as plain text while it is generated."""
+    corpus = await Corpus.objects.aget(id=payload.corpus_id)
+    all_messages = await get_chat_messages(corpus, payload)
+    llm = load_llm_provider()
+    return text_stream_response(llm.astream_text_completion(all_messages))
+
+
+async def get_chat_messages(
+    corpus: Corpus,
+    payload: CorpusChatSchema,
+) -> List[ChatCompletionTextMessage]:
     # TODO: last 2 messages? Eventually we need to worry about
     # token count limits.
     # Ideally we might roll-up a summary of the entire conversation.
     # But, in the current design, we let the client decide the messages.
     # A separate endpoint could be used by the client to "compress conversation"
-    split_context = await sync_to_async(corpus.get_relevant_splits_context)(
+    split_context = await corpus.aget_relevant_splits_context(
         "\n".join(message.text for message in payload.messages[-2:]),
     )
 
     print(payload.messages[-1].text)
 
-    all_messages = [
+    return [
         ChatCompletionTextMessage(
             role="system",
             text=f"You are helping the user understand or evolve the **{corpus.name}** project. "
@@ -101,15 +178,11 @@ async def chat(request, payload: CorpusChatSchema):
         ],
     ]
 
-    llm = load_llm_provider()
-    resp = llm.get_text_completion(all_messages)
-    return resp
-
 
 # update_files takes a corpus_id and a tarball upload with the files to add or update
 @corpus_router.post(
     "/{corpus_id}/files",
-    response={200: str, 404: str},
+    response={200: IngestionJobResponseSchema, 400: str, 404: str, 413: str},
     operation_id="update_files",
 )
 @async_raise_not_found
@@ -117,30 +190,139 @@ async def update_files(
     request: HttpRequest,
     corpus_id: uuid.UUID,
     update: CorpusUpdateFilesSchema = Form(...),
-    tarball: UploadedFile = File(...),
+    tarball: Optional[UploadedFile] = File(None),
+    upload_ids: Optional[List[str]] = Form(None),
 ):
-    """Update a Corpus with an uploaded tarball for additions/updates
-    and a list of files to delete
+    """Update a Corpus with an uploaded tarball (or the tarballs of
+    completed resumable uploads) for additions/updates
+    and a list of files to delete.
+    Returns the job tracking the ingestion.
     """
     corpus = await Corpus.objects.aget(id=corpus_id)
-    tarball_content: bytes = await sync_to_async(tarball.read)()
-    process_tarball.delay(str(corpus.id), tarball_content)
+    upload_names = await stage_tarballs(request, tarball, upload_ids)
+    job = await sync_to_async(ingest_uploads)(str(corpus.id), upload_names)
     if update.delete_files:
         # print(f"Deleting files: {update.delete_files}")
         # print(type(update.delete_files))
         # TODO there is a bug or inconsistency here
         delete_files = update.delete_files[0].split(",")
         await sync_to_async(corpus.delete_files)(delete_files)
-    return 200, "Tarball processing started."
+    return 200, job
+
+
+@corpus_router.get(
+    "/{corpus_id}/jobs/{job_id}",
+    response={200: IngestionJobResponseSchema, 404: str},
+    operation_id="get_ingestion_job",
+)
+@async_raise_not_found
+async def get_ingestion_job(request, corpus_id: uuid.UUID, job_id: uuid.UUID):
+    """Get the progress of an ingestion job."""
+    return await IngestionJob.objects.aget(id=job_id, corpus_id=corpus_id)
+
+
+# Resumable uploads: create an upload, send its parts (in any order, in
+# parallel, retrying as needed), then complete it and pass its id to
+# create_corpus or update_files instead of a tarball. Passing several
+# ids ingests them as shards, in parallel.
+def get_upload_status(upload: Upload) -> dict:
+    return {
+        "id": upload.id,
+        "size": upload.size,
+        "part_size": settings.CORPORA_UPLOAD_PART_SIZE,
+        "parts": list(upload.parts.order_by("offset")),
+        "completed": upload.completed_at is not None,
+    }
+
+
+@corpus_router.post(
+    "/uploads",
+    response={201: UploadResponseSchema, 413: str},
+    operation_id="create_upload",
+)
+async def create_upload(request, payload: UploadSchema):
+    """Start a resumable tarball upload."""
+    try:
+        check_upload_size(payload.size)
+    except UploadTooLargeError as e:
+        raise HttpError(413, str(e))
+    upload = await Upload.objects.acreate(
+        owner=request.user,
+        size=payload.size,
+        sha256=payload.sha256 or "",
+    )
+    return 201, await sync_to_async(get_upload_status)(upload)
+
+
+@corpus_router.get(
+    "/uploads/{upload_id}",
+    response={200: UploadResponseSchema, 404: str},
+    operation_id="get_upload",
+)
+@async_raise_not_found
+async def get_upload(request, upload_id: uuid.UUID):
+    """Get a resumable upload and the parts received so far."""
+    upload = await Upload.objects.aget(id=upload_id, owner=request.user)
+    return await sync_to_async(get_upload_status)(upload)
+
+
+@corpus_router.post(
+    "/uploads/{upload_id}/parts",
+    response={200: UploadPartResponseSchema, 400: str, 404: str},
+    operation_id="upload_part",
+)
+@async_raise_not_found
+async def upload_part(
+    request,
+    upload_id: uuid.UUID,
+    offset: int = Form(...),
+    sha256: str = Form(...),
+    part: UploadedFile = File(...),
+):
+    """Upload the bytes at `offset`, replacing an earlier attempt."""
+    upload = await Upload.objects.aget(id=upload_id, owner=request.user)
+    try:
+        return await sync_to_async(upload.save_part)(offset, part, sha256)
+    except InvalidUploadError as e:
+        raise HttpError(400, str(e))
+
+
+@corpus_router.post(
+    "/uploads/{upload_id}/complete",
+    response={200: UploadResponseSchema, 400: str, 404: str},
+    operation_id="complete_upload",
+)
+@async_raise_not_found
+async def complete_upload(request, upload_id: uuid.UUID):
+    """Join the received parts, once they cover the whole upload."""
+    upload = await Upload.objects.aget(id=upload_id, owner=request.user)
+    try:
+        await sync_to_async(upload.complete)()
+    except InvalidUploadError as e:
+        raise HttpError(400, str(e))
+    return await sync_to_async(get_upload_status)(upload)
 
 
 # get_file_hashes will return a map of file paths to their hashes from the database
 @corpus_router.get(
-    "/{corpus_id}/files", response=Dict[str, str], operation_id="get_file_hashes",
+    "/{corpus_id}/files",
+    response={200: Dict[str, str], 304: None},
+    operation_id="get_file_hashes",
 )
-async def get_file_hashes(request, corpus_id: uuid.UUID):
-    """Retrieve a map of file paths to their hashes for a Corpus."""
+async def get_file_hashes(request, corpus_id: uuid.UUID, response: HttpResponse):
+    """Retrieve a map of file paths to their hashes for a Corpus.
+
+    Sends an ETag; a matching If-None-Match gets an empty 304 instead.
+    """
     corpus = await Corpus.objects.aget(id=corpus_id)
+    # Taken before the hashes: if a write lands in between, the client
+    # just refetches next time
+    etag = await sync_to_async(corpus.get_file_hashes_etag)()
+    if etag in parse_etags(request.headers.get("If-None-Match", "")):
+        not_modified = HttpResponseNotModified()
+        not_modified["ETag"] = etag
+        return not_modified
+    response["ETag"] = etag
     return await sync_to_async(corpus.get_file_hashes)()
 
 
@@ -1,5 +1,7 @@
 import uuid
+from typing import List, Literal
 
+from asgiref.sync import sync_to_async
 from django.db import IntegrityError
 from ninja import Query, Router
 from ninja.errors import HttpError
@@ -8,7 +10,7 @@ from ..auth import BearerAuth
 from ..lib.dj.decorators import async_raise_not_found
 from ..lib.files import compute_checksum
 from ..models import Corpus, CorpusTextFile
-from ..schema.core import FileResponseSchema, FileSchema
+from ..schema.core import FilePathResponseSchema, FileResponseSchema, FileSchema
 
 file_router = Router(tags=["file"], auth=BearerAuth())
 
@@ -30,6 +32,26 @@ async def get_file_by_path(
     return ctf
 
 
+@file_router.get(
+    "/corpus/{corpus_id}/search",
+    response={200: List[FilePathResponseSchema], 404: str},
+    operation_id="search_file_paths",
+)
+@async_raise_not_found
+async def search_file_paths(
+    request,
+    corpus_id: uuid.UUID,
+    q: str = Query(..., min_length=1, description="Path, or part of one, to look for"),
+    mode: Literal["prefix", "substring", "trigram"] = "trigram",
+    limit: int = Query(20, ge=1, le=100),
+):
+    """Find files in a Corpus by path, best matches first. "trigram"
+    also matches misspelled paths; no embedding is involved.
+    """
+    corpus = await Corpus.objects.aget(id=corpus_id)
+    return await sync_to_async(corpus.find_files)(q, mode=mode, limit=limit)
+
+
 @file_router.get("/{file_id}", response=FileResponseSchema, operation_id="get_file")
 @async_raise_not_found
 async def get_file(request, file_id: uuid.UUID):
@@ -1,4 +1,3 @@
-from asgiref.sync import sync_to_async
 from corpora_ai.llm_interface import ChatCompletionTextMessage
 from corpora_ai.provider_loader import load_llm_provider
 from ninja import Router, Schema
@@ -33,7 +32,7 @@ async def get_issue(request, payload: CorpusChatSchema):
     corpus = await Corpus.objects.aget(id=payload.corpus_id)
 
     # TODO: split context could be ... ?
-    split_context = await sync_to_async(corpus.get_relevant_splits_context)(
+    split_context = await corpus.aget_relevant_splits_context(
         "\n".join(message.text for message in payload.messages[-2:]),
     )
 
@@ -58,5 +57,5 @@ async def get_issue(request, payload: CorpusChatSchema):
     ]
 
     llm = load_llm_provider()
-    resp = llm.get_data_completion(all_messages, IssueSchema)
+    resp = await llm.aget_data_completion(all_messages, IssueSchema)
     return resp
@@ -58,7 +58,7 @@ async def get_matplotlib_plot(
     ]
 
     llm = load_llm_provider()
-    pycode = llm.get_data_completion(messages, PythonCodeSchema).code
+    pycode = (await llm.aget_data_completion(messages, PythonCodeSchema)).code
 
     plot_path = "plot.png"
     exec(pycode, {"np": np, "plt": plt, "sp": sp})
@@ -2,7 +2,9 @@ import uuid
 from typing import List
 
 from asgiref.sync import sync_to_async
+from django.db.models import F
 from ninja import Router
+from ninja.errors import HttpError
 
 from ..auth import BearerAuth
 from ..models import Corpus, Split
@@ -12,24 +14,49 @@ split_router = Router(tags=["split"], auth=BearerAuth())
 
 
 @split_router.post(
-    "/search", response=List[SplitResponseSchema], operation_id="vector_search",
+    "/search",
+    response={200: List[SplitResponseSchema], 400: str, 404: str},
+    operation_id="vector_search",
 )
 async def vector_search(request, payload: SplitVectorSearchSchema):
-    """Perform a vector similarity search for splits using a provided query vector."""
-    query = payload.text
-    corpus_id = payload.corpus_id
-    corpus = await Corpus.objects.aget(id=corpus_id)
-
-    similar_splits = await sync_to_async(list)(
-        corpus.get_relevant_splits(query, limit=payload.limit),
+    """Search for splits by vector similarity to the text, by full-text
+    match, or by both fused (`mode`), in one corpus or across several.
+    """
+    corpus_ids = await get_search_corpus_ids(request, payload)
+    similar_splits = await Corpus.asearch_splits(
+        corpus_ids,
+        payload.text,
+        limit=payload.limit,
+        ef_search=payload.ef_search,
+        mode=payload.mode,
+        per_corpus_limit=payload.per_corpus_limit,
     )
     return similar_splits
 
 
+async def get_search_corpus_ids(
+    request,
+    payload: SplitVectorSearchSchema,
+) -> List[uuid.UUID]:
+    if payload.all_corpora:
+        corpora = Corpus.objects.filter(owner=request.user)
+    elif payload.corpus_ids or payload.corpus_id:
+        requested = set(payload.corpus_ids or []) | (
+            {payload.corpus_id} if payload.corpus_id else set()
+        )
+        corpora = Corpus.objects.filter(id__in=requested)
+    else:
+        raise HttpError(400, "Send corpus_id, corpus_ids or all_corpora.")
+    corpus_ids = [corpus_id async for corpus_id in corpora.values_list("id", flat=True)]
+    if not payload.all_corpora and len(corpus_ids) < len(requested):
+        raise HttpError(404, "Corpus not found.")
+    return corpus_ids
+
+
 @split_router.get("/{split_id}", response=SplitResponseSchema, operation_id="get_split")
 async def get_split(request, split_id: uuid.UUID):
     """Retrieve a Split by ID."""
-    split = await Split.objects.select_related("file", "file__corpus").aget(id=split_id)
+    split = await Split.objects.annotate(file_path=F("file__path")).aget(id=split_id)
     return split
 
 
@@ -41,6 +68,8 @@ async def get_split(request, split_id: uuid.UUID):
 async def list_splits_for_file(request, file_id: uuid.UUID):
     """List all Splits for a specific CorpusTextFile."""
     splits = await sync_to_async(list)(
-        Split.objects.filter(file_id=file_id).order_by("order"),
+        Split.objects.filter(file_id=file_id)
+        .annotate(file_path=F("file__path"))
+        .order_by("order"),
     )
     return splits
@@ -1,19 +1,55 @@
-from unittest.mock import patch
+import asyncio
+import hashlib
+import time
+import uuid
+from unittest import mock
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from asgiref.sync import sync_to_async
 from django.contrib.auth import get_user_model
 from django.core.files.uploadedfile import SimpleUploadedFile
-from django.test import TestCase
+from django.test import RequestFactory, TestCase, override_settings
 from ninja.testing import TestAsyncClient
 
-from .corpus import corpus_router
+from ..lib.dj.uploads import get_upload_storage, open_staged_upload
+from ..models import CorpusTextFile
+from ..schema.chat import CorpusChatSchema
+from .corpus import chat_stream, corpus_router
 from .test_lib import create_corpus, create_user_and_token
 
 User = get_user_model()
 client = TestAsyncClient(corpus_router)
 
 
+@sync_to_async
+def read_staged_upload(name: str) -> bytes:
+    with open_staged_upload(name) as f:
+        return f.read()
+
+
+def sha256(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+async def post_part(upload_id, offset, content, headers, checksum=None):
+    return await client.post(
+        f"/uploads/{upload_id}/parts",
+        data={"offset": offset, "sha256": checksum or sha256(content)},
+        FILES={"part": SimpleUploadedFile("part", content)},
+        headers=headers,
+    )
+
+
+async def make_upload(content, headers):
+    """Upload `content` in one part and complete it."""
+    response = await client.post("/uploads", json={"size": len(content)}, headers=headers)
+    upload_id = response.json()["id"]
+    await post_part(upload_id, 0, content, headers)
+    await client.post(f"/uploads/{upload_id}/complete", headers=headers)
+    return upload_id
+
+
 class CorpusAPITestCase(TestCase):
     @pytest.mark.django_db
     async def test_create_corpus(self):
@@ -30,8 +66,11 @@ class CorpusAPITestCase(TestCase):
                 "", data=data, FILES={"tarball": file}, headers=headers,
             )
             response_data = response.json()
-            mock_delay.assert_called_once_with(response_data["id"], file_content)
+            mock_delay.assert_called_once_with(response_data["id"], mock.ANY, mock.ANY)
             assert response.status_code == 201
+            assert await read_staged_upload(mock_delay.call_args.args[1]) == (
+                file_content
+            )
             assert response_data["name"] == "Test Corpus"
             assert response_data["url"] == "https://example.com/repo"
 
@@ -64,10 +103,149 @@ class CorpusAPITestCase(TestCase):
             # raise Exception
             # Check the response
             assert response.status_code == 200
-            assert response.json() == "Tarball processing started."
+            job = response.json()
+            assert job["corpus_id"] == str(corpus.id)
+            assert job["finished_at"] is None
+
+            # Ensure the task was called with the staged upload and the job
+            mock_delay.assert_called_once_with(str(corpus.id), mock.ANY, job["id"])
+            assert await read_staged_upload(mock_delay.call_args.args[1]) == (
+                file_content
+            )
+
+        response = await client.get(
+            f"/{corpus.id}/jobs/{job['id']}", headers=headers,
+        )
+        assert response.status_code == 200
+        assert response.json() == job
+        response = await client.get(
+            f"/{corpus.id}/jobs/{uuid.uuid4()}", headers=headers,
+        )
+        assert response.status_code == 404
+
+    @pytest.mark.django_db
+    async def test_update_files_too_large(self):
+        """Test that uploads over CORPORA_MAX_UPLOAD_SIZE are rejected."""
+        user, headers = await create_user_and_token()
+        corpus = await create_corpus("Big Corpus", "https://example.com", user)
+        file = SimpleUploadedFile(
+            "big.tar.gz", b"x" * 11, content_type="application/gzip",
+        )
+
+        with (
+            override_settings(CORPORA_MAX_UPLOAD_SIZE=10),
+            patch("corpora.tasks.sync.process_tarball.delay") as mock_delay,
+        ):
+            response = await client.post(
+                f"/{corpus.id}/files", FILES={"tarball": file}, headers=headers,
+            )
+
+        assert response.status_code == 413
+        mock_delay.assert_not_called()
+        # nothing was staged
+        assert not await sync_to_async(get_upload_storage().exists)("")
+
+    @pytest.mark.django_db
+    async def test_resumable_upload(self):
+        """Test uploading parts out of order, completing, and syncing."""
+        user, headers = await create_user_and_token()
+        corpus = await create_corpus("Resumable Corpus", "https://example.com", user)
+        content = b"0123456789abcdefghij"
+
+        response = await client.post(
+            "/uploads",
+            json={"size": len(content), "sha256": sha256(content)},
+            headers=headers,
+        )
+        assert response.status_code == 201
+        upload_id = response.json()["id"]
+        assert response.json()["parts"] == []
+
+        # Second part first, then a failed and a retried first part
+        assert (await post_part(upload_id, 8, content[8:], headers)).status_code == 200
+        bad = await post_part(upload_id, 0, b"corrupted", headers, sha256(b"x"))
+        assert bad.status_code == 400
+        # Incomplete uploads can't be completed
+        response = await client.post(f"/uploads/{upload_id}/complete", headers=headers)
+        assert response.status_code == 400
+        assert (await post_part(upload_id, 0, content[:8], headers)).status_code == 200
+
+        response = await client.get(f"/uploads/{upload_id}", headers=headers)
+        assert [(p["offset"], p["size"]) for p in response.json()["parts"]] == [
+            (0, 8),
+            (8, 12),
+        ]
+
+        response = await client.post(f"/uploads/{upload_id}/complete", headers=headers)
+        assert response.status_code == 200
+        assert response.json()["completed"]
+
+        with patch("corpora.tasks.sync.process_tarball.delay") as mock_delay:
+            response = await client.post(
+                f"/{corpus.id}/files", data={"upload_ids": upload_id}, headers=headers,
+            )
+            assert response.status_code == 200
+            mock_delay.assert_called_once_with(str(corpus.id), mock.ANY, mock.ANY)
+            assert await read_staged_upload(mock_delay.call_args.args[1]) == content
 
-            # Ensure the task was called with the correct arguments
-            mock_delay.assert_called_once_with(str(corpus.id), file_content)
+            # An upload is only ingested once
+            response = await client.post(
+                f"/{corpus.id}/files", data={"upload_ids": upload_id}, headers=headers,
+            )
+            assert response.status_code == 404
+
+    @pytest.mark.django_db
+    async def test_resumable_upload_checksum_mismatch(self):
+        """Test that completing checks the whole upload's checksum."""
+        _, headers = await create_user_and_token()
+        response = await client.post(
+            "/uploads", json={"size": 3, "sha256": sha256(b"abc")}, headers=headers,
+        )
+        upload_id = response.json()["id"]
+        await post_part(upload_id, 0, b"abd", headers)
+
+        response = await client.post(f"/uploads/{upload_id}/complete", headers=headers)
+        assert response.status_code == 400
+
+    @pytest.mark.django_db
+    async def test_create_corpus_from_shards(self):
+        """Test that several uploads are claimed together and fanned out."""
+        _, headers = await create_user_and_token()
+        first = await make_upload(b"shard one", headers)
+        second = await make_upload(b"shard two", headers)
+        data = {
+            "name": "Sharded Corpus",
+            "url": "https://example.com/repo",
+            "upload_ids": f"{first},{uuid.uuid4()}",
+        }
+
+        with patch("corpora.tasks.sync.chord") as mock_chord:
+            # One bad id fails the request and leaves the others unclaimed
+            response = await client.post("", data=data, headers=headers)
+            assert response.status_code == 404
+
+            data["upload_ids"] = f"{first},{second}"
+            response = await client.post("", data=data, headers=headers)
+            assert response.status_code == 201
+
+        corpus_id = response.json()["id"]
+        (header,), _ = mock_chord.call_args
+        shards = [task.args for task in header]
+        assert [shard[0] for shard in shards] == [corpus_id, corpus_id]
+        assert [await read_staged_upload(shard[1]) for shard in shards] == [
+            b"shard one",
+            b"shard two",
+        ]
+        (callback,), _ = mock_chord.return_value.call_args
+        assert callback.task == "corpora.tasks.sync.finish_ingestion"
+        assert callback.args == (corpus_id,)
+
+    @pytest.mark.django_db
+    async def test_update_files_needs_tarball_or_upload(self):
+        user, headers = await create_user_and_token()
+        corpus = await create_corpus("Empty Corpus", "https://example.com", user)
+        response = await client.post(f"/{corpus.id}/files", headers=headers)
+        assert response.status_code == 400
 
     @pytest.mark.django_db
     async def test_create_corpus_conflict(self):
@@ -101,6 +279,35 @@ class CorpusAPITestCase(TestCase):
         assert data["name"] == "Retrieve Corpus"
         assert data["url"] == "https://example.com"
 
+    @pytest.mark.django_db
+    async def test_get_file_hashes_etag(self):
+        """Test that a matching If-None-Match gets a 304 until files change."""
+        user, headers = await create_user_and_token()
+        corpus = await create_corpus("Hashes Corpus", "https://example.com", user)
+        file = await CorpusTextFile.objects.acreate(
+            corpus=corpus, path="a.txt", content="a", checksum="abc123",
+        )
+
+        response = await client.get(f"/{corpus.id}/files", headers=headers)
+        assert response.status_code == 200
+        assert response.json() == {"a.txt": "abc123"}
+        etag = response["ETag"]
+
+        response = await client.get(
+            f"/{corpus.id}/files", headers={**headers, "If-None-Match": etag},
+        )
+        assert response.status_code == 304
+        assert response.content == b""
+
+        file.checksum = "def456"
+        await file.asave()
+        response = await client.get(
+            f"/{corpus.id}/files", headers={**headers, "If-None-Match": etag},
+        )
+        assert response.status_code == 200
+        assert response.json() == {"a.txt": "def456"}
+        assert response["ETag"] != etag
+
     @pytest.mark.django_db
     async def test_get_corpus_not_found(self):
         """Test retrieving a non-existent corpus."""
@@ -145,3 +352,80 @@ class CorpusAPITestCase(TestCase):
         assert len(data) == 2
         assert data[0]["name"] == "Corpus 1"
         assert data[1]["name"] == "Corpus 2"
+
+    @pytest.mark.django_db
+    async def test_chat_requests_run_concurrently(self):
+        """A slow completion must not hold up other chat requests."""
+        user, headers = await create_user_and_token()
+        corpus = await create_corpus("Chat Corpus", "https://example.com", user)
+        payload = {
+            "corpus_id": str(corpus.id),
+            "messages": [{"role": "user", "text": "What is this?"}],
+        }
+
+        async def slow_completion(messages):
+            await asyncio.sleep(0.3)
+            return "An answer."
+
+        with (
+            patch("corpora.routers.corpus.load_llm_provider") as mock_corpus_llm,
+            patch("corpora_ai.provider_loader.load_llm_provider") as mock_search_llm,
+        ):
+            mock_corpus_llm.return_value.aget_text_completion = slow_completion
+            mock_search_llm.return_value.aget_embedding = AsyncMock(
+                return_value=[0.1] * 1536,
+            )
+
+            start = time.monotonic()
+            responses = await asyncio.gather(
+                *(
+                    client.post("/chat", json=payload, headers=headers)
+                    for _ in range(5)
+                ),
+            )
+            elapsed = time.monotonic() - start
+
+        assert [r.status_code for r in responses] == [200] * 5
+        assert all(r.json() == "An answer." for r in responses)
+        # Five serialized completions would take at least 1.5s
+        assert elapsed < 1.0
+
+    @pytest.mark.django_db
+    async def test_chat_stream(self):
+        """Completion deltas are forwarded as they arrive."""
+        user, _ = await create_user_and_token()
+        corpus = await create_corpus("Chat Corpus", "https://example.com", user)
+        payload = {
+            "corpus_id": str(corpus.id),
+            "messages": [{"role": "user", "text": "What is this?"}],
+        }
+        release = asyncio.Event()
+
+        async def stream_completion(messages):
+            yield "An "
+            # Held back until the first chunk has reached the client
+            await release.wait()
+            yield "answer."
+
+        with (
+            patch("corpora.routers.corpus.load_llm_provider") as mock_corpus_llm,
+            patch("corpora_ai.provider_loader.load_llm_provider") as mock_search_llm,
+        ):
+            mock_corpus_llm.return_value.astream_text_completion = (
+                stream_completion
+            )
+            mock_search_llm.return_value.aget_embedding = AsyncMock(
+                return_value=[0.1] * 1536,
+            )
+
+            # ninja's test client drains streaming bodies, so call the view
+            response = await chat_stream(
+                RequestFactory().post("/chat/stream"),
+                CorpusChatSchema(**payload),
+            )
+            assert response.status_code == 200
+            assert response["Content-Type"] == "text/plain; charset=utf-8"
+            chunks = response.streaming_content.__aiter__()
+            assert await chunks.__anext__() == b"An "
+            release.set()
+            assert [chunk async for chunk in chunks] == [b"answer."]
@@ -1,3 +1,5 @@
+import uuid
+
 import pytest
 from django.contrib.auth import get_user_model
 from django.test import TestCase
@@ -55,6 +57,32 @@ class CorpusTextFileAPITestCase(TestCase):
         assert response.json()["detail"][0]["msg"] == "Field required"
         assert response.json()["detail"][0]["loc"] == ["query", "path"]
 
+    @pytest.mark.django_db
+    async def test_search_file_paths(self):
+        """Test finding files by part of their path."""
+        user, headers = await create_user_and_token()
+        corpus = await create_corpus(
+            "Path Search Corpus", "https://example.com/repo", user,
+        )
+        file = await create_file(corpus, "nested/models.py", "Sample content")
+        await create_file(corpus, "nested/views.py", "Sample content")
+
+        response = await client.get(
+            f"/corpus/{corpus.id}/search?q=Models&mode=substring", headers=headers,
+        )
+        assert response.status_code == 200
+        assert response.json() == [{"id": str(file.id), "path": "nested/models.py"}]
+
+        response = await client.get(
+            f"/corpus/{corpus.id}/search?q=models&mode=regex", headers=headers,
+        )
+        assert response.status_code == 422
+
+        response = await client.get(
+            f"/corpus/{uuid.uuid4()}/search?q=models", headers=headers,
+        )
+        assert response.status_code == 404
+
     @pytest.mark.django_db
     async def test_create_file(self):
         """Test creating a file within a corpus."""
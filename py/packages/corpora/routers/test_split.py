@@ -1,4 +1,5 @@
-from unittest.mock import patch
+import uuid
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from django.contrib.auth import get_user_model
@@ -31,6 +32,7 @@ class SplitAPITestCase(TestCase):
         data = response.json()
         assert data["content"] == "Split content"
         assert data["file_id"] == str(file.id)
+        assert data["file_path"] == "file1.txt"
 
     @pytest.mark.django_db
     async def test_list_splits_for_file(self):
@@ -47,6 +49,7 @@ class SplitAPITestCase(TestCase):
         assert len(data) == 2
         assert data[0]["content"] == "Split content 1"
         assert data[1]["content"] == "Split content 2"
+        assert data[0]["file_path"] == "file1.txt"
 
     @pytest.mark.django_db
     async def test_vector_search_splits(self):
@@ -63,12 +66,12 @@ class SplitAPITestCase(TestCase):
             "limit": 2,
         }
 
-        # Mock the load_llm_provider and its get_embedding function
+        # Mock the load_llm_provider and its aget_embedding function
         with patch("corpora_ai.provider_loader.load_llm_provider") as mock_llm_provider:
             mock_llm_instance = mock_llm_provider.return_value
-            mock_llm_instance.get_embedding.return_value = [
-                0.1,
-            ] * 1536  # Mocked embedding
+            mock_llm_instance.aget_embedding = AsyncMock(
+                return_value=[0.1] * 1536,  # Mocked embedding
+            )
 
             # Execute the test request
             response = await client.post("/search", json=payload, headers=headers)
@@ -78,4 +81,96 @@ class SplitAPITestCase(TestCase):
             assert response.status_code == 200
             data = response.json()
             assert len(data) > 0  # Should return at least one similar split
-            mock_llm_instance.get_embedding.assert_called_once_with("foobar")
+            assert data[0]["file_path"] == "file1.txt"
+            mock_llm_instance.aget_embedding.assert_awaited_once_with("foobar")
+
+        with patch(
+            "corpora.routers.split.Corpus.asearch_splits",
+            AsyncMock(return_value=[]),
+        ) as mock_search:
+            response = await client.post(
+                "/search", json={**payload, "ef_search": 200}, headers=headers,
+            )
+            assert response.status_code == 200
+            assert mock_search.await_args.kwargs["ef_search"] == 200
+
+            response = await client.post(
+                "/search", json={**payload, "ef_search": 1001}, headers=headers,
+            )
+            assert response.status_code == 422
+
+    @pytest.mark.django_db
+    async def test_lexical_search_splits(self):
+        """Lexical search matches words without embedding the query."""
+        user, headers = await create_user_and_token()
+        corpus = await create_corpus("Test Corpus", "https://example.com/repo", user)
+        file = await create_file(corpus, "file1.txt", "Sample content")
+        await create_split(file, "def upload_part(offset)", [0.1] * 1536, order=1)
+        await create_split(file, "Split content 2", [0.2] * 1536, order=2)
+
+        payload = {
+            "text": "upload_part",
+            "corpus_id": str(corpus.id),
+            "mode": "lexical",
+        }
+        with patch("corpora_ai.provider_loader.load_llm_provider") as mock_llm_provider:
+            response = await client.post("/search", json=payload, headers=headers)
+            mock_llm_provider.assert_not_called()
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [split["content"] for split in data] == ["def upload_part(offset)"]
+
+        payload["mode"] = "fuzzy"
+        response = await client.post("/search", json=payload, headers=headers)
+        assert response.status_code == 422
+
+    @pytest.mark.django_db
+    async def test_vector_search_across_corpora(self):
+        """Search several corpora, or all of the user's, in one request."""
+        user, headers = await create_user_and_token()
+        first = await create_corpus("First Corpus", "https://example.com/1", user)
+        second = await create_corpus("Second Corpus", "https://example.com/2", user)
+        for corpus in (first, second):
+            file = await create_file(corpus, "file1.txt", "Sample content")
+            await create_split(file, "Split content 1", [0.1] * 1536, order=1)
+            await create_split(file, "Split content 2", [0.2] * 1536, order=2)
+
+        with patch("corpora_ai.provider_loader.load_llm_provider") as mock_llm_provider:
+            mock_llm_instance = mock_llm_provider.return_value
+            mock_llm_instance.aget_embedding = AsyncMock(return_value=[0.1] * 1536)
+
+            response = await client.post(
+                "/search",
+                json={"text": "foobar", "all_corpora": True, "per_corpus_limit": 1},
+                headers=headers,
+            )
+            assert response.status_code == 200
+            assert {split["corpus_id"] for split in response.json()} == {
+                str(first.id),
+                str(second.id),
+            }
+            assert len(response.json()) == 2
+            mock_llm_instance.aget_embedding.assert_awaited_once_with("foobar")
+
+            response = await client.post(
+                "/search",
+                json={"text": "foobar", "corpus_ids": [str(first.id)]},
+                headers=headers,
+            )
+            assert response.status_code == 200
+            assert {split["corpus_id"] for split in response.json()} == {
+                str(first.id),
+            }
+
+            response = await client.post(
+                "/search",
+                json={"text": "foobar", "corpus_ids": [str(uuid.uuid4())]},
+                headers=headers,
+            )
+            assert response.status_code == 404
+
+            response = await client.post(
+                "/search", json={"text": "foobar"}, headers=headers,
+            )
+            assert response.status_code == 400
@@ -1,4 +1,5 @@
-from asgiref.sync import sync_to_async
+from typing import List
+
 from corpora_ai.llm_interface import ChatCompletionTextMessage
 from corpora_ai.provider_loader import load_llm_provider
 from ninja import Router, Schema
@@ -7,6 +8,7 @@ from corpora.models import Corpus
 from corpora.schema.chat import CorpusFileChatSchema, get_additional_context
 
 from ..auth import BearerAuth
+from ..lib.dj.responses import text_stream_response
 
 workon_router = Router(tags=["workon"], auth=BearerAuth())
 
@@ -31,14 +33,34 @@ class FileRevisionResponse(Schema):
 @workon_router.post("/file", response=str, operation_id="file")
 async def file(request, payload: CorpusFileChatSchema):
     corpus = await Corpus.objects.aget(id=payload.corpus_id)
+    all_messages = await get_file_messages(corpus, payload)
+    llm = load_llm_provider()
+    resp = await llm.aget_data_completion(all_messages, FileRevisionResponse)
+    return resp.new_file_revision
 
-    split_context = await sync_to_async(corpus.get_relevant_splits_context)(
+
+@workon_router.post("/file/stream", response=str, operation_id="file_stream")
+async def file_stream(request, payload: CorpusFileChatSchema):
+    """Stream the new revision of the file as plain text while it is generated."""
+    corpus = await Corpus.objects.aget(id=payload.corpus_id)
+    all_messages = await get_file_messages(corpus, payload)
+    llm = load_llm_provider()
+    # Plain text completion: the system message already asks for nothing
+    # but the file, and structured output can't be streamed as text
+    return text_stream_response(llm.astream_text_completion(all_messages))
+
+
+async def get_file_messages(
+    corpus: Corpus,
+    payload: CorpusFileChatSchema,
+) -> List[ChatCompletionTextMessage]:
+    split_context = await corpus.aget_relevant_splits_context(
         "\n".join(message.text for message in payload.messages[-2:]),
     )
 
     print(payload.messages[-1].text)
 
-    all_messages = [
+    return [
         ChatCompletionTextMessage(
             role="system",
             text=f"You are focused on the file: {payload.path} "
@@ -58,7 +80,3 @@ async def file(request, payload: CorpusFileChatSchema):
             for msg in payload.messages
         ],
     ]
-
-    llm = load_llm_provider()
-    resp = llm.get_data_completion(all_messages, FileRevisionResponse)
-    return resp.new_file_revision
@@ -1,8 +1,11 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Literal, Optional
 from uuid import UUID
 
 from ninja import Schema
+from pydantic import Field
+
+from ..models import HNSW_MAX_EF_SEARCH
 
 
 class CorpusSchema(Schema):
@@ -34,15 +37,72 @@ class FileResponseSchema(Schema):
     updated_at: datetime
 
 
+class FilePathResponseSchema(Schema):
+    id: UUID
+    path: str
+
+
 class SplitVectorSearchSchema(Schema):
-    corpus_id: UUID
+    # One corpus, several, or all of the user's (`all_corpora`)
+    corpus_id: Optional[UUID] = None
+    corpus_ids: Optional[List[UUID]] = None
+    all_corpora: bool = False
     text: str
-    limit: int = 10
+    limit: int = Field(10, ge=1)
+    # At most this many splits from any one corpus
+    per_corpus_limit: Optional[int] = Field(None, ge=1)
+    # HNSW candidates visited per query; defaults to CORPORA_HNSW_EF_SEARCH
+    ef_search: Optional[int] = Field(None, ge=1, le=HNSW_MAX_EF_SEARCH)
+    # "lexical" matches words only and skips embedding the query;
+    # "hybrid" fuses the lexical and vector rankings; "summary" ranks
+    # only the splits of the files with the nearest summaries
+    mode: Literal["vector", "hybrid", "lexical", "summary"] = "vector"
 
 
 class SplitResponseSchema(Schema):
     id: UUID
+    corpus_id: UUID
     content: str
     order: int
     file_id: UUID
+    file_path: str
     # vector: List[float] = None
+
+
+class UploadSchema(Schema):
+    size: int = Field(..., gt=0)
+    sha256: Optional[str] = None
+
+
+class UploadPartResponseSchema(Schema):
+    offset: int
+    size: int
+    sha256: str
+
+
+class UploadResponseSchema(Schema):
+    id: UUID
+    size: int
+    part_size: int
+    parts: List[UploadPartResponseSchema]
+    completed: bool
+
+
+class IngestionJobResponseSchema(Schema):
+    id: UUID
+    corpus_id: UUID
+    shards: int
+    shards_done: int
+    shards_failed: int
+    files_seen: int
+    files_updated: int
+    files_split: int
+    splits_created: int
+    files_embedded: int
+    vectors_done: int
+    files_failed: int
+    ingest_seconds: float
+    split_seconds: float
+    embed_seconds: float
+    created_at: datetime
+    finished_at: Optional[datetime] = None
@@ -0,0 +1,57 @@
+import logging
+from itertools import batched
+from typing import List
+
+from celery import shared_task
+from django.conf import settings
+from django.db.models import F, Q
+
+from ..models import CorpusTextFile
+
+# Files are summarized, and their summaries embedded, this many to a task
+SUMMARY_BATCH_SIZE = 20
+# Files without a summary of their current content, or whose summary
+# was never embedded
+NEEDS_SUMMARY = ~Q(summary_checksum=F("checksum")) | (
+    Q(vector_of_summary__isnull=True) & ~Q(ai_summary="")
+)
+
+logger = logging.getLogger(__name__)
+
+
+def queue_summaries(corpus_file_ids: List[str]) -> None:
+    """Queue summaries of files on the low priority "summaries" queue,
+    unless `CORPORA_SUMMARIZE_FILES` is off.
+    """
+    if not settings.CORPORA_SUMMARIZE_FILES:
+        return
+    for batch in batched(corpus_file_ids, SUMMARY_BATCH_SIZE):
+        summarize_files_task.delay(list(batch))
+
+
+@shared_task
+def summarize_files_task(corpus_file_ids: List[str]) -> int:
+    """Summarize a batch of files, skipping any whose content hasn't
+    changed since its summary; see `CorpusTextFile.summarize_files`.
+    """
+    corpus_files = list(
+        CorpusTextFile.objects.filter(NEEDS_SUMMARY, id__in=corpus_file_ids)
+        .select_related("corpus"),
+    )
+    return CorpusTextFile.summarize_files(corpus_files)
+
+
+@shared_task
+def summarize_corpus_task(corpus_id: str) -> int:
+    """Queue summaries of every file of a corpus that has none, an
+    outdated one, or one that was never embedded. Returns the number of
+    files queued.
+    """
+    corpus_file_ids = [
+        str(file_id)
+        for file_id in CorpusTextFile.objects.filter(NEEDS_SUMMARY, corpus_id=corpus_id)
+        .values_list("id", flat=True)
+    ]
+    queue_summaries(corpus_file_ids)
+    logger.info(f"Corpus {corpus_id}: {len(corpus_file_ids)} files to summarize")
+    return len(corpus_file_ids)
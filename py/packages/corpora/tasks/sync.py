@@ -1,58 +1,235 @@
-import io
-import tarfile
+import logging
+import time
+from itertools import batched
+from typing import BinaryIO, Dict, List, Optional
 
-from celery import shared_task
+from celery import chord, shared_task
 
-from ..lib.files import compute_checksum
-from ..models import Corpus, CorpusTextFile, Split
+from ..lib.dj.uploads import (
+    cleanup_staged_uploads,
+    delete_staged_upload,
+    open_staged_upload,
+)
+from ..lib.files import compute_checksum, iter_tarball_files
+from ..models import Corpus, CorpusTextFile, IngestionJob, Split, Upload
+from .summaries import queue_summaries
+
+# Files are upserted in chunks of this many per INSERT .. ON CONFLICT
+INGEST_BATCH_SIZE = 500
+# Splits are loaded and embedded this many at a time for a whole corpus
+EMBED_BATCH_SIZE = 1000
+# Changed files are split and embedded this many to an `ingest_file_batch`
+FILE_BATCH_SIZE = 50
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def process_tarball(
+    corpus_id: str,
+    upload_name: str,
+    job_id: Optional[str] = None,
+) -> Dict[str, int]:
+    """Ingest a staged tarball upload, then delete it.
+
+    If ingestion fails, the upload is left for `cleanup_staged_uploads_task`.
+    """
+    start = time.monotonic()
+    try:
+        with open_staged_upload(upload_name) as tarball:
+            stats = ingest_tarball(corpus_id, tarball, job_id)
+    except Exception:
+        IngestionJob.record(
+            job_id,
+            shards_done=1,
+            shards_failed=1,
+            ingest_seconds=time.monotonic() - start,
+        )
+        raise
+    delete_staged_upload(upload_name)
+    IngestionJob.record(
+        job_id,
+        shards_done=1,
+        files_seen=stats["updated"] + stats["skipped"],
+        files_updated=stats["updated"],
+        ingest_seconds=time.monotonic() - start,
+    )
+    return stats
+
+
+def ingest_uploads(corpus_id: str, upload_names: List[str]) -> IngestionJob:
+    """Queue ingestion of staged uploads, tracked by the returned job.
+
+    Several uploads are shards of one change set, with no file in two of
+    them: each gets its own `process_tarball` so they run on as many
+    workers as are free, and `finish_ingestion` totals them up after.
+    """
+    job = IngestionJob.objects.create(corpus_id=corpus_id, shards=len(upload_names))
+    job_id = str(job.id)
+    if len(upload_names) == 1:
+        process_tarball.delay(corpus_id, upload_names[0], job_id)
+        return job
+    chord(
+        process_tarball.s(corpus_id, upload_name, job_id)
+        for upload_name in upload_names
+    )(finish_ingestion.s(corpus_id))
+    return job
 
 
 @shared_task
-def process_tarball(corpus_id: str, tarball: bytes) -> None:
+def finish_ingestion(
+    shard_stats: List[Dict[str, int]],
+    corpus_id: str,
+) -> Dict[str, int]:
+    """Total the stats of a sharded ingestion once every shard is done."""
+    stats = {"updated": 0, "skipped": 0}
+    for shard in shard_stats:
+        for key, count in shard.items():
+            stats[key] += count
+    logger.info(
+        f"Corpus {corpus_id}: {len(shard_stats)} shards ingested, "
+        f"{stats['updated']} files updated, {stats['skipped']} unchanged",
+    )
+    return stats
+
+
+def ingest_tarball(
+    corpus_id: str,
+    tarball: BinaryIO,
+    job_id: Optional[str] = None,
+) -> Dict[str, int]:
     corpus = Corpus.objects.get(id=corpus_id)
     corpus.save(update_fields=["updated_at"])
-    with tarfile.open(fileobj=io.BytesIO(tarball), mode="r:gz") as tar:
-        for member in tar.getmembers():
-            if member.isfile():
-                file_content = (
-                    tar.extractfile(member)
-                    .read()
-                    .decode("utf-8", errors="replace")
-                )
-
-                checksum = compute_checksum(file_content)
+    known_checksums = corpus.get_file_hashes()
+    skipped = updated = 0
+    members = iter_tarball_files(tarball)
+    for batch in batched(members, INGEST_BATCH_SIZE):
+        changed = []
+        for path, raw in batch:
+            checksum = compute_checksum(raw)
+            if known_checksums.get(path) == checksum:
+                skipped += 1
+                continue
+            changed.append(
+                CorpusTextFile(
+                    path=path,
+                    content=raw.decode("utf-8", errors="replace"),
+                    checksum=checksum,
+                ),
+            )
+        if not changed:
+            continue
+        corpus_files = corpus.upsert_files(changed)
+        updated += len(corpus_files)
+        queue_summaries([f.id for f in corpus_files])
+        for file_batch in batched(corpus_files, FILE_BATCH_SIZE):
+            ingest_file_batch.delay([f.id for f in file_batch], job_id)
+    logger.info(f"{corpus.name}: {updated} files updated, {skipped} unchanged")
+    return {"updated": updated, "skipped": skipped}
 
-                corpus_file, _ = CorpusTextFile.objects.get_or_create(
-                    corpus=corpus,
-                    path=member.name,
-                )
-                corpus_file.content = file_content
-                corpus_file.checksum = checksum
-                corpus_file.save()
-                corpus_file.splits.all().delete()
 
-                # generate_summary_task.delay(corpus_file.id)
-                split_file_task.delay(corpus_file.id)
+@shared_task
+def cleanup_staged_uploads_task() -> int:
+    return Upload.delete_expired() + cleanup_staged_uploads()
 
 
 @shared_task
-def generate_summary_task(corpus_file_id: str) -> None:
-    corpus_file = CorpusTextFile.objects.get(id=corpus_file_id)
-    corpus_file.get_and_save_summary()
-    corpus_file.get_and_save_vector_of_summary()
+def ingest_file_batch(
+    corpus_file_ids: List[str],
+    job_id: Optional[str] = None,
+) -> Dict[str, int]:
+    """Split a batch of files and embed all of their splits without a vector.
+
+    One query loads the files and a diff against their existing splits
+    keeps the unchanged ones, with their vectors; the rest are saved with
+    a bulk INSERT. Then every split of the files still missing a vector,
+    new or left unembedded by an earlier failure, is embedded with
+    batched provider calls and written back with one bulk UPDATE.
+    """
+    start = time.monotonic()
+    try:
+        corpus_files = list(CorpusTextFile.objects.filter(id__in=corpus_file_ids))
+        created = CorpusTextFile.split_files(corpus_files, diff=True)
+        split_done = time.monotonic()
+        splits = list(
+            Split.objects.filter(file__in=corpus_files, vector__isnull=True)
+            .only("id", "content"),
+        )
+        stats = Split.get_and_save_vectors(splits)
+    except Exception:
+        IngestionJob.record(job_id, files_failed=len(corpus_file_ids))
+        raise
+    IngestionJob.record(
+        job_id,
+        files_split=len(corpus_files),
+        splits_created=len(created),
+        # Files deleted since they were queued have nothing left to do
+        files_embedded=len(corpus_file_ids),
+        vectors_done=sum(1 for split in splits if split.content),
+        split_seconds=split_done - start,
+        embed_seconds=time.monotonic() - split_done,
+    )
+    # generate_colbert_vectors_task.delay(split.id)
+    return {"files": len(corpus_files), "splits": len(created), **stats}
 
 
 @shared_task
-def split_file_task(corpus_file_id: str) -> None:
-    corpus_file = CorpusTextFile.objects.get(id=corpus_file_id)
-    splits = corpus_file.split_content()
-    for split in splits:
-        # no need to chain
-        generate_vector_task.delay(split.id)
-        # generate_colbert_vectors_task.delay(split.id)
+def split_file_task(
+    corpus_file_id: str,
+    job_id: Optional[str] = None,
+) -> Dict[str, int]:
+    """Split and embed one file; see `ingest_file_batch`."""
+    return ingest_file_batch([corpus_file_id], job_id)
 
 
 @shared_task
-def generate_vector_task(split_id: str) -> None:
+def generate_vector_task(split_id: str, job_id: Optional[str] = None) -> None:
+    """Embed one split; `ingest_file_batch` embeds splits in batches."""
+    start = time.monotonic()
     split = Split.objects.get(id=split_id)
-    split.get_and_save_vector()
+    Split.get_and_save_vectors([split])
+    IngestionJob.record(
+        job_id,
+        vectors_done=1,
+        embed_seconds=time.monotonic() - start,
+    )
+
+
+@shared_task
+def generate_vectors_task(
+    corpus_file_id: str,
+    job_id: Optional[str] = None,
+) -> Dict[str, int]:
+    """Embed every split of a file that doesn't have a vector yet."""
+    start = time.monotonic()
+    splits = Split.objects.filter(
+        file_id=corpus_file_id,
+        vector__isnull=True,
+    ).only("id", "content")
+    try:
+        splits = list(splits)
+        stats = Split.get_and_save_vectors(splits)
+    except Exception:
+        IngestionJob.record(job_id, files_failed=1)
+        raise
+    IngestionJob.record(
+        job_id,
+        files_embedded=1,
+        vectors_done=sum(1 for split in splits if split.content),
+        embed_seconds=time.monotonic() - start,
+    )
+    return stats
+
+
+@shared_task
+def generate_corpus_vectors_task(corpus_id: str) -> Dict[str, int]:
+    """Embed every split of a corpus that doesn't have a vector yet."""
+    splits = Split.objects.filter(
+        file__corpus_id=corpus_id,
+        vector__isnull=True,
+    ).only("id", "content")
+    stats = {"hits": 0, "misses": 0}
+    for batch in batched(splits.iterator(EMBED_BATCH_SIZE), EMBED_BATCH_SIZE):
+        for key, count in Split.get_and_save_vectors(list(batch)).items():
+            stats[key] += count
+    return stats
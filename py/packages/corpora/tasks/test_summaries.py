@@ -0,0 +1,217 @@
+from unittest import mock
+
+import pytest
+from django.contrib.auth import get_user_model
+
+from ..models import Corpus, CorpusTextFile
+from .summaries import (
+    queue_summaries,
+    summarize_corpus_task,
+    summarize_files_task,
+)
+
+User = get_user_model()
+
+
+def truncate(text, max_tokens, model):
+    # one token per character; tiktoken can't be relied on in tests
+    return text[:max_tokens], min(len(text), max_tokens)
+
+
+@pytest.mark.django_db
+class TestSummaryTasks:
+    @pytest.fixture
+    def corpus(self):
+        user = User.objects.create_user(username="testuser", password="password")
+        return Corpus.objects.create(name="Test Corpus", owner=user)
+
+    @pytest.fixture
+    def llm(self):
+        with mock.patch("corpora_ai.provider_loader.load_llm_provider") as loader:
+            llm = loader.return_value
+            llm.embedding_model = "text-embedding-3-small"
+            llm.get_summary.side_effect = lambda text: f"summary of {text[-3:]}"
+            llm.get_embeddings.side_effect = lambda texts: [
+                [0.1 * (i + 1)] * 1536 for i in range(len(texts))
+            ]
+            yield llm
+
+    @pytest.fixture
+    def acquire_tokens(self):
+        with (
+            mock.patch("corpora.models.truncate_to_tokens", side_effect=truncate),
+            mock.patch("corpora.models.acquire_tokens") as acquire_tokens,
+        ):
+            yield acquire_tokens
+
+    def test_summarize_files_task(self, corpus, llm, acquire_tokens, settings):
+        settings.CORPORA_SUMMARY_INPUT_TOKENS = 100
+        settings.CORPORA_SUMMARY_TOKENS_PER_MINUTE = 1000
+        files = [
+            CorpusTextFile.objects.create(
+                corpus=corpus,
+                path=f"{name}.txt",
+                content=f"content {name}",
+                checksum=f"sha-{name}",
+            )
+            for name in ("abc", "def")
+        ]
+        unchanged = CorpusTextFile.objects.create(
+            corpus=corpus,
+            path="same.txt",
+            content="same",
+            checksum="sha-same",
+            ai_summary="old summary",
+            summary_checksum="sha-same",
+            vector_of_summary=[0.5] * 1536,
+        )
+        empty = CorpusTextFile.objects.create(
+            corpus=corpus, path="empty.txt", checksum="sha-empty",
+        )
+
+        count = summarize_files_task([f.id for f in [*files, unchanged, empty]])
+
+        assert count == 2
+        assert llm.get_summary.call_count == 2
+        # each request is taken from the TPM limit
+        llm.get_summary.assert_any_call("Test Corpus:abc.txt\n\ncontent abc")
+        for call in acquire_tokens.call_args_list:
+            assert call.args[0] == "summaries"
+            assert call.args[2] == 1000
+        # one batched embedding request for every new summary
+        llm.get_embeddings.assert_called_once_with(
+            ["summary of abc", "summary of def"],
+        )
+        for file, scale in zip(files, (0.1, 0.2)):
+            file.refresh_from_db()
+            assert file.ai_summary.startswith("summary of")
+            assert file.summary_checksum == file.checksum
+            assert file.vector_of_summary[0] == pytest.approx(scale)
+        unchanged.refresh_from_db()
+        assert unchanged.ai_summary == "old summary"
+        empty.refresh_from_db()
+        assert empty.summary_checksum == ""
+
+    def test_summarize_files_task_truncates(self, corpus, llm, settings):
+        settings.CORPORA_SUMMARY_INPUT_TOKENS = 10
+        settings.CORPORA_SUMMARY_TOKENS_PER_MINUTE = 1000
+        file = CorpusTextFile.objects.create(
+            corpus=corpus, path="long.txt", content="x" * 100, checksum="sha",
+        )
+
+        with (
+            mock.patch("corpora.models.truncate_to_tokens", side_effect=truncate),
+            mock.patch("corpora.models.acquire_tokens") as acquire_tokens,
+        ):
+            summarize_files_task([file.id])
+
+        llm.get_summary.assert_called_once_with("Test Corpu")
+        # the input plus the expected size of the summary
+        acquire_tokens.assert_called_once_with("summaries", 510, 1000)
+
+    def test_summarize_files_task_resummarizes_changed_files(
+        self, corpus, llm, acquire_tokens,
+    ):
+        file = CorpusTextFile.objects.create(
+            corpus=corpus,
+            path="changed.txt",
+            content="new",
+            checksum="sha-new",
+            ai_summary="old summary",
+            summary_checksum="sha-old",
+        )
+
+        assert summarize_files_task([file.id]) == 1
+        assert summarize_files_task([file.id]) == 0
+
+        llm.get_summary.assert_called_once()
+        file.refresh_from_db()
+        assert file.ai_summary == "summary of new"
+        assert file.summary_checksum == "sha-new"
+
+    def test_summarize_files_task_keeps_finished_summaries(
+        self, corpus, llm, acquire_tokens,
+    ):
+        """A failed request skips only its file, and summaries are saved
+        before embedding, so a failed embedding doesn't lose them.
+        """
+        files = [
+            CorpusTextFile.objects.create(
+                corpus=corpus,
+                path=f"{name}.txt",
+                content=f"content {name}",
+                checksum=f"sha-{name}",
+            )
+            for name in ("abc", "bad", "def")
+        ]
+
+        def get_summary(text):
+            if text.endswith("bad"):
+                raise TimeoutError
+            return f"summary of {text[-3:]}"
+
+        llm.get_summary.side_effect = get_summary
+        llm.get_embeddings.side_effect = ConnectionError
+
+        with pytest.raises(ConnectionError):
+            summarize_files_task([f.id for f in files])
+
+        ok, bad, also_ok = files
+        for file in files:
+            file.refresh_from_db()
+        assert ok.ai_summary == "summary of abc"
+        assert also_ok.summary_checksum == "sha-def"
+        assert (bad.ai_summary, bad.summary_checksum) == ("", "")
+        assert ok.vector_of_summary is None
+
+        # The retry only embeds the saved summaries and summarizes the rest
+        llm.get_summary.reset_mock()
+        llm.get_summary.side_effect = lambda text: f"summary of {text[-3:]}"
+        llm.get_embeddings.side_effect = lambda texts: [[0.1] * 1536] * len(texts)
+
+        assert summarize_files_task([f.id for f in files]) == 1
+
+        llm.get_summary.assert_called_once_with("Test Corpus:bad.txt\n\ncontent bad")
+        embedded = llm.get_embeddings.call_args.args[0]
+        assert sorted(embedded) == [
+            "summary of abc", "summary of bad", "summary of def",
+        ]
+        for file in files:
+            file.refresh_from_db()
+            assert file.vector_of_summary is not None
+
+    @mock.patch("corpora.tasks.summaries.SUMMARY_BATCH_SIZE", 2)
+    @mock.patch("corpora.tasks.summaries.summarize_files_task.delay")
+    def test_queue_summaries(self, mock_summarize, settings):
+        queue_summaries(["a", "b", "c"])
+        mock_summarize.assert_not_called()
+
+        settings.CORPORA_SUMMARIZE_FILES = True
+        queue_summaries(["a", "b", "c"])
+        assert [call.args[0] for call in mock_summarize.call_args_list] == [
+            ["a", "b"],
+            ["c"],
+        ]
+
+    @mock.patch("corpora.tasks.summaries.summarize_files_task.delay")
+    def test_summarize_corpus_task(self, mock_summarize, corpus, settings):
+        settings.CORPORA_SUMMARIZE_FILES = True
+        stale = CorpusTextFile.objects.create(
+            corpus=corpus, path="stale.txt", checksum="new", summary_checksum="old",
+        )
+        CorpusTextFile.objects.create(
+            corpus=corpus, path="done.txt", checksum="same", summary_checksum="same",
+        )
+        unembedded = CorpusTextFile.objects.create(
+            corpus=corpus,
+            path="unembedded.txt",
+            checksum="same",
+            summary_checksum="same",
+            ai_summary="summary",
+        )
+
+        assert summarize_corpus_task(str(corpus.id)) == 2
+        mock_summarize.assert_called_once()
+        assert sorted(mock_summarize.call_args.args[0]) == sorted(
+            [str(stale.id), str(unembedded.id)],
+        )
@@ -3,99 +3,285 @@ import tarfile
 from unittest import mock
 
 import pytest
+from celery import current_app
+from django.contrib.auth import get_user_model
+from django.core.files.base import ContentFile
 
+from ..lib.dj.uploads import get_upload_storage, stage_upload
+from ..lib.files import compute_checksum
+from ..models import Corpus, CorpusTextFile, IngestionJob, Split
 from .sync import (
-    generate_summary_task,
+    generate_corpus_vectors_task,
     generate_vector_task,
+    generate_vectors_task,
+    ingest_file_batch,
+    ingest_uploads,
     process_tarball,
     split_file_task,
 )
 
+User = get_user_model()
+
+
+def make_tarball(files: dict) -> str:
+    """Build a tarball and stage it like the upload routers do."""
+    tarball_content = io.BytesIO()
+    with tarfile.open(fileobj=tarball_content, mode="w:gz") as tar:
+        for name, file_data in files.items():
+            tarinfo = tarfile.TarInfo(name=name)
+            tarinfo.size = len(file_data)
+            tar.addfile(tarinfo, io.BytesIO(file_data))
+    return stage_upload(ContentFile(tarball_content.getvalue()))
+
 
 @pytest.mark.django_db
 class TestCeleryTasks:
-    @mock.patch("corpora.models.Corpus.objects.get")
-    @mock.patch("corpora.models.CorpusTextFile.objects.get_or_create")
-    @mock.patch("corpora.lib.files.compute_checksum")
-    @mock.patch("corpora.tasks.sync.generate_summary_task.delay")
-    @mock.patch("corpora.tasks.sync.split_file_task.delay")
-    def test_process_tarball(
+    @pytest.fixture
+    def corpus(self):
+        user = User.objects.create_user(username="testuser", password="password")
+        return Corpus.objects.create(name="Test Corpus", owner=user)
+
+    @mock.patch("corpora.tasks.sync.ingest_file_batch.delay")
+    def test_process_tarball(self, mock_split_task, corpus):
+        existing = CorpusTextFile.objects.create(
+            corpus=corpus, path="existing.txt", content="old content",
+        )
+        Split.objects.create(file=existing, order=0, content="old content")
+        tarball = make_tarball(
+            {
+                "test_file.txt": b"test file content",
+                "existing.txt": b"new content",
+            },
+        )
+
+        process_tarball(str(corpus.id), tarball)
+
+        # the staged upload is cleaned up once ingested
+        assert not get_upload_storage().exists(tarball)
+        files = {f.path: f for f in corpus.files.all()}
+        assert set(files) == {"test_file.txt", "existing.txt"}
+        assert files["test_file.txt"].content == "test file content"
+        assert files["test_file.txt"].checksum == compute_checksum(
+            b"test file content",
+        )
+        # updated in place, splits left for ingest_file_batch to diff
+        assert files["existing.txt"].id == existing.id
+        assert files["existing.txt"].content == "new content"
+        assert Split.objects.filter(file=existing).exists()
+        # one message for the whole batch of changed files
+        mock_split_task.assert_called_once_with(mock.ANY, None)
+        assert set(mock_split_task.call_args.args[0]) == {
+            f.id for f in files.values()
+        }
+
+    @mock.patch("corpora.tasks.sync.INGEST_BATCH_SIZE", 10)
+    @mock.patch("corpora.tasks.sync.ingest_file_batch.delay")
+    def test_process_tarball_query_count(
         self,
         mock_split_task,
-        mock_summary_task,
-        mock_compute_checksum,
-        mock_get_or_create,
-        mock_corpus_get,
+        corpus,
+        django_assert_max_num_queries,
     ):
-        # Mock corpus and tarball
-        mock_corpus = mock.Mock()
-        mock_corpus_get.return_value = mock_corpus
-
-        tarball_content = io.BytesIO()
-        with tarfile.open(fileobj=tarball_content, mode="w:gz") as tar:
-            file_data = b"test file content"
-            tarinfo = tarfile.TarInfo(name="test_file.txt")
-            tarinfo.size = len(file_data)
-            tar.addfile(tarinfo, io.BytesIO(file_data))
-        tarball_content.seek(0)
+        """Queries scale with the number of batches, not the number of files."""
+        tarball = make_tarball(
+            {f"file_{i}.txt": f"content {i}".encode() for i in range(30)},
+        )
 
-        # Mock file content processing
-        mock_compute_checksum.return_value = "mock_checksum"
-        mock_file = mock.Mock()
-        mock_get_or_create.return_value = (mock_file, False)
+        # fetch + touch + hashes + 3 batches * (ids + upsert)
+        with django_assert_max_num_queries(9):
+            process_tarball(str(corpus.id), tarball)
 
-        # Run the task
-        process_tarball("mock_corpus_id", tarball_content.getvalue())
+        assert corpus.files.count() == 30
+        queued = [i for call in mock_split_task.call_args_list for i in call.args[0]]
+        assert len(queued) == 30
 
-        # Assertions
-        mock_corpus_get.assert_called_once_with(id="mock_corpus_id")
-        mock_corpus.save.assert_called_once_with(update_fields=["updated_at"])
-        mock_get_or_create.assert_called_once_with(
-            corpus=mock_corpus, path="test_file.txt",
-        )
-        assert mock_file.content == "test file content"
-        # assert mock_file.checksum == "mock_checksum"
-        mock_file.save.assert_called_once()
-        mock_file.splits.all().delete.assert_called_once()
-        # over-specified - we don't even use the summary in the app yet
-        # mock_summary_task.assert_called_once_with(mock_file.id)
-        mock_split_task.assert_called_once_with(mock_file.id)
-
-    @mock.patch("corpora.models.CorpusTextFile.objects.get")
-    def test_generate_summary_task(self, mock_corpus_file_get):
-        # Mock corpus file
-        mock_corpus_file = mock.Mock()
-        mock_corpus_file_get.return_value = mock_corpus_file
+    @mock.patch("corpora.tasks.summaries.summarize_files_task.delay")
+    @mock.patch("corpora.tasks.sync.ingest_file_batch.delay")
+    def test_process_tarball_skips_unchanged(
+        self,
+        mock_split_task,
+        mock_summarize,
+        corpus,
+        settings,
+    ):
+        settings.CORPORA_SUMMARIZE_FILES = True
+        unchanged = CorpusTextFile.objects.create(
+            corpus=corpus,
+            path="unchanged.txt",
+            content="same",
+            checksum=compute_checksum(b"same"),
+        )
+        split = Split.objects.create(file=unchanged, order=0, content="same")
+        tarball = make_tarball(
+            {"unchanged.txt": b"same", "changed.txt": b"different"},
+        )
 
-        # Run the task
-        generate_summary_task("mock_corpus_file_id")
+        result = process_tarball(str(corpus.id), tarball)
 
-        # Assertions
-        mock_corpus_file_get.assert_called_once_with(id="mock_corpus_file_id")
-        mock_corpus_file.get_and_save_summary.assert_called_once()
-        mock_corpus_file.get_and_save_vector_of_summary.assert_called_once()
-
-    @mock.patch("corpora.models.CorpusTextFile.objects.get")
-    @mock.patch("corpora.tasks.sync.generate_vector_task.delay")
-    def test_split_file_task(self, mock_generate_vector_task, mock_corpus_file_get):
-        # Mock corpus file
-        mock_corpus_file = mock.Mock()
-        mock_corpus_file_get.return_value = mock_corpus_file
-
-        # Mock split content
-        mock_split = mock.Mock()
-        mock_corpus_file.split_content.return_value = [mock_split]
+        assert result == {"updated": 1, "skipped": 1}
+        # the unchanged file keeps its splits and is not re-split
+        assert Split.objects.filter(id=split.id).exists()
+        changed = corpus.files.get(path="changed.txt")
+        mock_split_task.assert_called_once_with([changed.id], None)
+        # only changed files are summarized, on the summaries queue
+        mock_summarize.assert_called_once_with([changed.id])
 
-        # Run the task
-        split_file_task("mock_corpus_file_id")
+    @mock.patch("corpora.tasks.sync.logger")
+    @mock.patch("corpora.tasks.sync.ingest_file_batch.delay")
+    def test_ingest_uploads_shards(self, mock_split_task, mock_logger, corpus):
+        CorpusTextFile.objects.create(
+            corpus=corpus,
+            path="unchanged.txt",
+            content="same",
+            checksum=compute_checksum(b"same"),
+        )
+        shards = [
+            make_tarball({"a.txt": b"a", "unchanged.txt": b"same"}),
+            make_tarball({"b.txt": b"b", "c.txt": b"c"}),
+        ]
 
-        # Assertions
-        mock_corpus_file_get.assert_called_once_with(id="mock_corpus_file_id")
-        mock_corpus_file.split_content.assert_called_once()
-        mock_generate_vector_task.assert_called_once_with(mock_split.id)
+        # Run the chord in-process, as a worker would
+        current_app.conf.task_always_eager = True
+        try:
+            ingest_uploads(str(corpus.id), shards)
+        finally:
+            current_app.conf.task_always_eager = False
+
+        assert set(corpus.files.values_list("path", flat=True)) == {
+            "a.txt",
+            "b.txt",
+            "c.txt",
+            "unchanged.txt",
+        }
+        queued = [i for call in mock_split_task.call_args_list for i in call.args[0]]
+        assert len(queued) == 3
+        assert not any(get_upload_storage().exists(shard) for shard in shards)
+        mock_logger.info.assert_called_with(
+            f"Corpus {corpus.id}: 2 shards ingested, 3 files updated, 1 unchanged",
+        )
+
+    @mock.patch("corpora_ai.provider_loader.load_llm_provider")
+    def test_ingestion_job_tracks_progress(self, mock_llm_provider, corpus):
+        mock_llm = mock_llm_provider.return_value
+        mock_llm.embedding_model = "text-embedding-3-small"
+        mock_llm.get_embeddings.side_effect = lambda texts: [[0.5] * 1536] * len(
+            texts,
+        )
+        CorpusTextFile.objects.create(
+            corpus=corpus,
+            path="unchanged.txt",
+            content="same",
+            checksum=compute_checksum(b"same"),
+        )
+        shards = [
+            make_tarball({"a.txt": b"a", "unchanged.txt": b"same"}),
+            make_tarball({"b.txt": b"b"}),
+        ]
+
+        # Run the whole pipeline in-process, as workers would
+        current_app.conf.task_always_eager = True
+        try:
+            job = ingest_uploads(str(corpus.id), shards)
+        finally:
+            current_app.conf.task_always_eager = False
+
+        job.refresh_from_db()
+        assert job.finished_at is not None
+        assert (job.shards, job.shards_done, job.shards_failed) == (2, 2, 0)
+        assert (job.files_seen, job.files_updated) == (3, 2)
+        assert (job.files_split, job.splits_created) == (2, 2)
+        assert (job.files_embedded, job.vectors_done, job.files_failed) == (2, 2, 0)
+        assert job.ingest_seconds > 0
+        assert job.split_seconds > 0
+        assert job.embed_seconds > 0
+
+    def test_ingestion_job_finishes_with_failures(self, corpus):
+        job = IngestionJob.objects.create(corpus=corpus)
+        IngestionJob.record(str(job.id), shards_done=1, files_updated=2)
+        IngestionJob.record(str(job.id), files_embedded=1)
+        job.refresh_from_db()
+        assert job.finished_at is None
+
+        IngestionJob.record(str(job.id), files_failed=1)
+        job.refresh_from_db()
+        assert job.finished_at is not None
+
+    @mock.patch("corpora_ai.provider_loader.load_llm_provider")
+    def test_ingest_file_batch(
+        self,
+        mock_llm_provider,
+        corpus,
+        django_assert_max_num_queries,
+    ):
+        mock_llm = mock_llm_provider.return_value
+        mock_llm.embedding_model = "text-embedding-3-small"
+        mock_llm.get_embeddings.side_effect = lambda texts: [[0.5] * 1536] * len(
+            texts,
+        )
+        files = [
+            CorpusTextFile.objects.create(
+                corpus=corpus,
+                path=f"file_{i}.md",
+                content="\n\n".join(f"paragraph {j} " * 200 for j in range(3)),
+            )
+            for i in range(10)
+        ]
+        job = IngestionJob.objects.create(corpus=corpus, shards_done=1, files_updated=10)
+
+        # files, existing splits, splits insert, unembedded splits, cache
+        # lookup and insert, vectors update and job counters, however many
+        # files and splits
+        with django_assert_max_num_queries(11):
+            stats = ingest_file_batch([f.id for f in files], str(job.id))
+
+        splits = Split.objects.filter(corpus=corpus)
+        assert stats["files"] == 10
+        assert stats["splits"] == splits.count() > 10
+        assert not splits.filter(vector__isnull=True).exists()
+        # every split of every file in a single provider call
+        mock_llm.get_embeddings.assert_called_once()
+        job.refresh_from_db()
+        assert (job.files_split, job.files_embedded) == (10, 10)
+        assert job.splits_created == stats["splits"]
+        assert job.finished_at is not None
 
+    @mock.patch("corpora_ai.provider_loader.load_llm_provider")
+    def test_ingest_file_batch_embeds_unchanged_splits_left_without_vectors(
+        self,
+        mock_llm_provider,
+        corpus,
+    ):
+        """A split kept by the diff is embedded again if an earlier
+        embedding call failed and left it without a vector.
+        """
+        mock_llm = mock_llm_provider.return_value
+        mock_llm.embedding_model = "text-embedding-3-small"
+        mock_llm.get_embeddings.side_effect = lambda texts: [[0.5] * 1536] * len(
+            texts,
+        )
+        file = CorpusTextFile.objects.create(
+            corpus=corpus, path="a.md", content="unchanged paragraph",
+        )
+        # Split, but the embedding call never happened
+        CorpusTextFile.split_files([file], diff=True)
+
+        stats = ingest_file_batch([file.id])
+
+        assert stats["splits"] == 0
+        mock_llm.get_embeddings.assert_called_once_with(["unchanged paragraph"])
+        assert not Split.objects.filter(file=file, vector__isnull=True).exists()
+
+    @mock.patch("corpora.tasks.sync.ingest_file_batch")
+    def test_split_file_task(self, mock_ingest_file_batch):
+        split_file_task("mock_corpus_file_id", "job-1")
+
+        mock_ingest_file_batch.assert_called_once_with(
+            ["mock_corpus_file_id"], "job-1",
+        )
+
+    @mock.patch("corpora.models.Split.get_and_save_vectors")
     @mock.patch("corpora.models.Split.objects.get")
-    def test_generate_vector_task(self, mock_split_get):
+    def test_generate_vector_task(self, mock_split_get, mock_get_and_save_vectors):
         # Mock split
         mock_split = mock.Mock()
         mock_split_get.return_value = mock_split
@@ -105,4 +291,47 @@ class TestCeleryTasks:
 
         # Assertions
         mock_split_get.assert_called_once_with(id="mock_split_id")
-        mock_split.get_and_save_vector.assert_called_once()
+        mock_get_and_save_vectors.assert_called_once_with([mock_split])
+
+    @mock.patch("corpora_ai.provider_loader.load_llm_provider")
+    def test_generate_vectors_task(self, mock_llm_provider, corpus):
+        mock_llm = mock_llm_provider.return_value
+        mock_llm.embedding_model = "text-embedding-3-small"
+        mock_llm.get_embeddings.side_effect = lambda texts: [[0.5] * 1536] * len(
+            texts,
+        )
+        file = CorpusTextFile.objects.create(corpus=corpus, path="a.txt")
+        done = Split.objects.create(
+            file=file, order=0, content="done", vector=[0.1] * 1536,
+        )
+        Split.objects.create(file=file, order=1, content="one")
+        Split.objects.create(file=file, order=2, content="two")
+
+        generate_vectors_task(file.id)
+
+        # only splits without a vector, in a single provider call
+        mock_llm.get_embeddings.assert_called_once_with(["one", "two"])
+        assert not Split.objects.filter(file=file, vector__isnull=True).exists()
+        done.refresh_from_db()
+        assert done.vector[0] == pytest.approx(0.1)
+
+    @mock.patch("corpora.tasks.sync.EMBED_BATCH_SIZE", 2)
+    @mock.patch("corpora_ai.provider_loader.load_llm_provider")
+    def test_generate_corpus_vectors_task(self, mock_llm_provider, corpus):
+        mock_llm = mock_llm_provider.return_value
+        mock_llm.embedding_model = "text-embedding-3-small"
+        mock_llm.get_embeddings.side_effect = lambda texts: [[0.5] * 1536] * len(
+            texts,
+        )
+        for path in ["a.txt", "b.txt"]:
+            file = CorpusTextFile.objects.create(corpus=corpus, path=path)
+            Split.objects.create(file=file, order=0, content=f"{path} 0")
+            Split.objects.create(file=file, order=1, content=f"{path} 1")
+
+        stats = generate_corpus_vectors_task(corpus.id)
+
+        assert mock_llm.get_embeddings.call_count == 2
+        assert stats == {"hits": 0, "misses": 4}
+        assert not Split.objects.filter(
+            file__corpus=corpus, vector__isnull=True,
+        ).exists()
@@ -1,10 +1,23 @@
-from unittest.mock import patch
+import hashlib
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
 
 import pytest
 from django.contrib.auth import get_user_model
+from django.core.files.base import ContentFile
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
-from corpora.models import Corpus, CorpusTextFile, Split
+from corpora.lib.dj.uploads import get_upload_storage
+from corpora.models import (
+    Corpus,
+    CorpusTextFile,
+    EmbeddingCache,
+    Split,
+    Upload,
+    UploadPart,
+)
 
 User = get_user_model()
 
@@ -38,14 +51,21 @@ def test_get_relevant_splits(mock_llm_provider):
     file = CorpusTextFile.objects.create(
         corpus=corpus, path="test.txt", content="Content of the file.",
     )
+    # Cosine distance ignores magnitude, so vary direction to rank them
     split_1 = Split.objects.create(
         file=file, order=1, content="First split content", vector=[0.1] * 1536,
     )
     split_2 = Split.objects.create(
-        file=file, order=2, content="Second split content", vector=[0.2] * 1536,
+        file=file,
+        order=2,
+        content="Second split content",
+        vector=[0.1] * 1024 + [0.2] * 512,
     )
     split_3 = Split.objects.create(
-        file=file, order=3, content="Third split content", vector=[0.3] * 1536,
+        file=file,
+        order=3,
+        content="Third split content",
+        vector=[0.1] * 512 + [0.3] * 1024,
     )
 
     # Call the method
@@ -93,11 +113,100 @@ def test_split_creation():
     split = Split.objects.create(file=file, order=1, content="First split part")
 
     assert split.file == file
+    assert split.corpus_id == corpus.id
     assert split.order == 1
     assert split.content == "First split part"
     assert str(split) == f"{file.corpus.name}:{file.path}:{split.order}"
 
 
+@pytest.mark.django_db
+def test_split_content_sets_corpus():
+    """Splits created from a file carry the file's corpus."""
+    user = User.objects.create(username="testuser", password="password123")
+    corpus = Corpus.objects.create(name="Test Corpus", owner=user)
+    file = CorpusTextFile.objects.create(
+        corpus=corpus, path="test.txt", content="Split content.",
+    )
+
+    splits = file.split_content()
+
+    assert splits
+    assert all(split.corpus_id == corpus.id for split in splits)
+
+
+@pytest.mark.django_db
+def test_split_content_bulk_creates(django_assert_num_queries):
+    user = User.objects.create(username="testuser", password="password123")
+    corpus = Corpus.objects.create(name="Test Corpus", owner=user)
+    file = CorpusTextFile.objects.create(
+        corpus=corpus,
+        path="notes.md",
+        content="\n\n".join(f"paragraph {i} " * 200 for i in range(12)),
+    )
+    Split.objects.create(file=file, order=0, content="stale")
+
+    # delete + 2 INSERTs of at most 4 splits
+    with django_assert_num_queries(3):
+        splits = file.split_content(batch_size=4)
+
+    assert 4 < len(splits) <= 8
+    assert [split.order for split in splits] == list(range(len(splits)))
+    assert all(split.pk for split in splits)
+    assert list(file.splits.order_by("order")) == splits
+
+
+@pytest.mark.django_db
+def test_split_content_diff_keeps_unchanged_splits():
+    """Editing one part of a file only replaces the splits that changed."""
+    user = User.objects.create(username="testuser", password="password123")
+    corpus = Corpus.objects.create(name="Test Corpus", owner=user)
+    paragraphs = [f"paragraph {i} " * 200 for i in range(6)]
+    file = CorpusTextFile.objects.create(
+        corpus=corpus, path="notes.md", content="\n\n".join(paragraphs),
+    )
+    before = file.split_content()
+    Split.objects.filter(file=file).update(vector=[0.1] * 1536)
+
+    paragraphs[2] = "edited " * 200
+    file.content = "\n\n".join(paragraphs)
+    created = file.split_content(diff=True)
+
+    after = list(file.splits.order_by("order"))
+    assert len(after) == len(before)
+    assert [split.content for split in created] == [
+        split.content for split in after if "edited" in split.content
+    ]
+    # Everything else is the same row, still embedded
+    unchanged = [split for split in after if split not in created]
+    assert len(unchanged) == len(after) - len(created) > 0
+    assert {split.id for split in unchanged} <= {split.id for split in before}
+    assert all(split.vector is not None for split in unchanged)
+    assert all(split.vector is None for split in created)
+
+
+@patch("corpora_ai.provider_loader.load_llm_provider")
+@pytest.mark.django_db
+def test_get_relevant_splits_filters_by_corpus(mock_llm_provider):
+    """Search only ranks the corpus's own splits and carries the file path."""
+    mock_llm_provider.return_value.get_embedding.return_value = [0.1] * 1536
+    user = User.objects.create(username="testuser", password="password123")
+    corpus = Corpus.objects.create(name="Test Corpus", owner=user)
+    other = Corpus.objects.create(name="Other Corpus", owner=user)
+    file = CorpusTextFile.objects.create(corpus=corpus, path="mine.txt")
+    other_file = CorpusTextFile.objects.create(corpus=other, path="theirs.txt")
+    split = Split.objects.create(
+        file=file, order=0, content="mine", vector=[0.1] * 1536,
+    )
+    Split.objects.create(
+        file=other_file, order=0, content="theirs", vector=[0.1] * 1536,
+    )
+
+    relevant_splits = corpus.get_relevant_splits("query text")
+
+    assert relevant_splits == [split]
+    assert relevant_splits[0].file_path == "mine.txt"
+
+
 @patch("corpora_ai.provider_loader.load_llm_provider")
 @pytest.mark.django_db
 def test_get_and_save_summary(mock_llm_provider):
@@ -139,6 +248,7 @@ def test_get_and_save_vector_of_summary(mock_llm_provider):
 def test_get_and_save_vector_on_split(mock_llm_provider):
     """Test Split `get_and_save_vector` method."""
     mock_llm_provider.return_value.get_embedding.return_value = [0.2] * 1536
+    mock_llm_provider.return_value.embedding_model = "text-embedding-3-small"
     user = User.objects.create(username="testuser", password="password123")
     corpus = Corpus.objects.create(name="Test Corpus", owner=user)
     file = CorpusTextFile.objects.create(corpus=corpus, path="test.txt")
@@ -149,3 +259,395 @@ def test_get_and_save_vector_on_split(mock_llm_provider):
     assert all(a == b for a, b in zip(split.vector, [0.2] * 1536))
     split.refresh_from_db()
     assert all(a == b for a, b in zip(split.vector, [0.2] * 1536))
+
+
+@patch("corpora_ai.provider_loader.load_llm_provider")
+@pytest.mark.django_db
+def test_get_and_save_vectors_on_splits(mock_llm_provider):
+    """Test Split `get_and_save_vectors` embeds in one call and skips empty splits."""
+    mock_llm_provider.return_value.get_embeddings.return_value = [
+        [0.2] * 1536,
+        [0.3] * 1536,
+    ]
+    mock_llm_provider.return_value.embedding_model = "text-embedding-3-small"
+    user = User.objects.create(username="testuser", password="password123")
+    corpus = Corpus.objects.create(name="Test Corpus", owner=user)
+    file = CorpusTextFile.objects.create(corpus=corpus, path="test.txt")
+    splits = [
+        Split.objects.create(file=file, order=0, content="First"),
+        Split.objects.create(file=file, order=1, content=""),
+        Split.objects.create(file=file, order=2, content="Third"),
+    ]
+
+    Split.get_and_save_vectors(splits)
+
+    mock_llm_provider.return_value.get_embeddings.assert_called_once_with(
+        ["First", "Third"],
+    )
+    for split in splits:
+        split.refresh_from_db()
+    assert splits[0].vector[0] == pytest.approx(0.2)
+    assert splits[1].vector is None
+    assert splits[2].vector[0] == pytest.approx(0.3)
+
+
+@pytest.mark.django_db
+def test_embedding_cache_get_embeddings():
+    """Test `EmbeddingCache.get_embeddings` only embeds uncached, unique texts."""
+    llm = MagicMock(embedding_model="text-embedding-3-small")
+    llm.get_embeddings.side_effect = lambda texts: [
+        [float(len(text))] * 1536 for text in texts
+    ]
+
+    vectors, stats = EmbeddingCache.get_embeddings(llm, ["a", "bb", "a"])
+
+    llm.get_embeddings.assert_called_once_with(["a", "bb"])
+    assert [v[0] for v in vectors] == [1.0, 2.0, 1.0]
+    assert stats == {"hits": 1, "misses": 2}
+
+    llm.get_embeddings.reset_mock()
+    vectors, stats = EmbeddingCache.get_embeddings(llm, ["bb", "a"])
+
+    llm.get_embeddings.assert_not_called()
+    assert [v[0] for v in vectors] == [2.0, 1.0]
+    assert stats == {"hits": 2, "misses": 0}
+
+
+@pytest.mark.django_db
+def test_embedding_cache_is_keyed_by_model():
+    """Test that vectors from one embedding model are not served for another."""
+    small = MagicMock(embedding_model="text-embedding-3-small")
+    small.get_embedding.return_value = [0.1] * 1536
+    large = MagicMock(embedding_model="text-embedding-3-large")
+    large.get_embedding.return_value = [0.9] * 1536
+
+    EmbeddingCache.get_embedding(small, "same text")
+    vector = EmbeddingCache.get_embedding(large, "same text")
+
+    large.get_embedding.assert_called_once_with("same text")
+    assert vector[0] == pytest.approx(0.9)
+    assert EmbeddingCache.objects.count() == 2
+
+
+@patch("corpora_ai.provider_loader.load_llm_provider")
+@pytest.mark.django_db
+def test_get_relevant_splits_sets_ef_search(mock_llm_provider, settings):
+    """`ef_search` is applied to the search transaction, never below `limit`."""
+    mock_llm_provider.return_value.get_embedding.return_value = [0.1] * 1536
+    settings.CORPORA_HNSW_EF_SEARCH = 20
+    user = User.objects.create(username="testuser", password="password123")
+    corpus = Corpus.objects.create(name="Test Corpus", owner=user)
+
+    def ef_search_values():
+        return [
+            q["sql"]
+            for q in queries.captured_queries
+            if "hnsw.ef_search" in q["sql"]
+        ]
+
+    with CaptureQueriesContext(connection) as queries:
+        corpus.get_relevant_splits("query text", limit=5)
+    assert ef_search_values() == ["SET LOCAL hnsw.ef_search = 20"]
+
+    with CaptureQueriesContext(connection) as queries:
+        corpus.get_relevant_splits("query text", limit=50)
+    assert ef_search_values() == ["SET LOCAL hnsw.ef_search = 50"]
+
+    with CaptureQueriesContext(connection) as queries:
+        corpus.get_relevant_splits("query text", limit=5, ef_search=200)
+    assert ef_search_values() == ["SET LOCAL hnsw.ef_search = 200"]
+    assert any(
+        q["sql"] == "SET LOCAL hnsw.iterative_scan = relaxed_order"
+        for q in queries.captured_queries
+    )
+
+
+@patch("corpora_ai.provider_loader.load_llm_provider")
+@pytest.mark.django_db
+def test_get_relevant_splits_lexical(mock_llm_provider):
+    """Lexical search matches words of code without embedding the query,
+    ranks denser matches first, and finds splits with no vector yet.
+    """
+    user = User.objects.create(username="testuser", password="password123")
+    corpus = Corpus.objects.create(name="Test Corpus", owner=user)
+    file = CorpusTextFile.objects.create(corpus=corpus, path="models.py")
+    both = Split.objects.create(
+        file=file, order=0, content="return corpus.get_relevant_splits(text)",
+    )
+    one = Split.objects.create(
+        file=file, order=1, content="def get_file_hashes(self):", vector=[0.1] * 1536,
+    )
+    Split.objects.create(file=file, order=2, content="unrelated")
+
+    relevant_splits = corpus.get_relevant_splits(
+        "Where is relevant_splits? get", mode="lexical",
+    )
+
+    assert relevant_splits == [both, one]
+    assert relevant_splits[0].file_path == "models.py"
+    mock_llm_provider.assert_not_called()
+    assert corpus.get_relevant_splits("?!", mode="lexical") == []
+
+
+@patch("corpora_ai.provider_loader.load_llm_provider")
+@pytest.mark.django_db
+def test_get_relevant_splits_hybrid(mock_llm_provider):
+    """Hybrid search fuses the vector and lexical rankings, so a split
+    near the top of both beats one that leads only one of them.
+    """
+    mock_llm_provider.return_value.get_embedding.return_value = [0.1] * 1536
+    user = User.objects.create(username="testuser", password="password123")
+    corpus = Corpus.objects.create(name="Test Corpus", owner=user)
+    file = CorpusTextFile.objects.create(corpus=corpus, path="test.txt")
+    nearest = Split.objects.create(
+        file=file, order=0, content="nothing in common", vector=[0.1] * 1536,
+    )
+    both = Split.objects.create(
+        file=file,
+        order=1,
+        content="tarball upload tarball",
+        vector=[0.1] * 1024 + [0.2] * 512,
+    )
+    # Not embedded yet, so only the lexical ranking has it
+    lexical = Split.objects.create(file=file, order=2, content="tarball upload")
+
+    relevant_splits = corpus.get_relevant_splits(
+        "tarball upload", limit=3, mode="hybrid",
+    )
+
+    # Ties keep the vector ranking's order
+    assert relevant_splits == [both, nearest, lexical]
+    mock_llm_provider.return_value.get_embedding.assert_called_once_with(
+        "tarball upload",
+    )
+    with pytest.raises(ValueError):
+        corpus.get_relevant_splits("tarball", mode="fuzzy")
+
+
+@patch("corpora_ai.provider_loader.load_llm_provider")
+@pytest.mark.django_db
+def test_search_splits_across_corpora(mock_llm_provider):
+    """One embedding and one ranking cover every corpus searched, and
+    `per_corpus_limit` stops one corpus from filling the results.
+    """
+    mock_llm_provider.return_value.get_embedding.return_value = [0.1] * 1536
+    user = User.objects.create(username="testuser", password="password123")
+    big = Corpus.objects.create(name="Big Corpus", owner=user)
+    small = Corpus.objects.create(name="Small Corpus", owner=user)
+    ignored = Corpus.objects.create(name="Ignored Corpus", owner=user)
+    big_file = CorpusTextFile.objects.create(corpus=big, path="big.txt")
+    small_file = CorpusTextFile.objects.create(corpus=small, path="small.txt")
+    ignored_file = CorpusTextFile.objects.create(corpus=ignored, path="x.txt")
+    big_splits = [
+        Split.objects.create(
+            file=big_file,
+            order=i,
+            content=f"tarball {i}",
+            vector=[0.1] * (1536 - 256 * i) + [0.2] * (256 * i),
+        )
+        for i in range(3)
+    ]
+    small_split = Split.objects.create(
+        file=small_file, order=0, content="tarball", vector=[0.1] * 512 + [0.3] * 1024,
+    )
+    Split.objects.create(
+        file=ignored_file, order=0, content="tarball", vector=[0.1] * 1536,
+    )
+    corpus_ids = [big.id, small.id]
+
+    # Rank every split exactly, so the asserted order doesn't depend on
+    # whether the planner picks the approximate HNSW index
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute("SET LOCAL enable_indexscan = off")
+        with CaptureQueriesContext(connection) as queries:
+            splits = Corpus.search_splits(corpus_ids, "query text", limit=10)
+        capped = Corpus.search_splits(
+            corpus_ids, "query text", limit=10, per_corpus_limit=2,
+        )
+        # The two nearest splits are both the big corpus's; the small
+        # corpus still gets its share
+        one_each = Corpus.search_splits(
+            corpus_ids, "query text", limit=2, per_corpus_limit=1,
+        )
+
+    assert splits == [*big_splits, small_split]
+    # SAVEPOINT, SET LOCAL ef_search and iterative_scan, SELECT, RELEASE
+    assert len(queries) == 5
+    assert capped == [*big_splits[:2], small_split]
+    assert capped[-1].corpus_id == small.id
+    assert one_each == [big_splits[0], small_split]
+    # The second search reuses the cached query embedding
+    mock_llm_provider.return_value.get_embedding.assert_called_once_with(
+        "query text",
+    )
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute("SET LOCAL enable_indexscan = off")
+        lexical = Corpus.search_splits(
+            corpus_ids, "tarball", mode="lexical", per_corpus_limit=1,
+        )
+        # "0" breaks the lexical tie between the big corpus's splits
+        hybrid = Corpus.search_splits(
+            corpus_ids, "tarball 0", mode="hybrid", per_corpus_limit=1,
+        )
+
+    assert sorted(split.corpus_id for split in lexical) == sorted(corpus_ids)
+    assert hybrid == [big_splits[0], small_split]
+
+
+@patch("corpora_ai.provider_loader.load_llm_provider")
+@pytest.mark.django_db
+def test_per_corpus_limit_with_a_crowding_corpus(mock_llm_provider, settings):
+    """A corpus with more than `ef_search` splits nearer than any of a
+    small corpus's can't push the small corpus out of capped results, in
+    any mode that ranks by vector.
+    """
+    mock_llm_provider.return_value.get_embedding.return_value = [0.1] * 1536
+    settings.CORPORA_HNSW_EF_SEARCH = 40
+    settings.CORPORA_SUMMARY_SEARCH_FILES = 1
+    user = User.objects.create(username="testuser", password="password123")
+    big = Corpus.objects.create(name="Big Corpus", owner=user)
+    small = Corpus.objects.create(name="Small Corpus", owner=user)
+    big_file = CorpusTextFile.objects.create(
+        corpus=big, path="big.txt", vector_of_summary=[0.1] * 1536,
+    )
+    small_file = CorpusTextFile.objects.create(
+        corpus=small,
+        path="small.txt",
+        vector_of_summary=[0.1] * 512 + [0.3] * 1024,
+    )
+    # More than both ef_search and the hybrid candidates, all nearer and
+    # denser lexical matches than the small corpus's splits
+    Split.objects.bulk_create(
+        Split(
+            corpus=big,
+            file=big_file,
+            order=i,
+            content="tarball tarball",
+            vector=[0.1] * 1536,
+        )
+        for i in range(60)
+    )
+    Split.objects.bulk_create(
+        Split(
+            corpus=small,
+            file=small_file,
+            order=i,
+            content=f"tarball and {i} other words",
+            vector=[0.1] * 512 + [0.3] * 1024,
+        )
+        for i in range(3)
+    )
+
+    for mode in ("vector", "hybrid", "summary"):
+        splits = Corpus.search_splits(
+            [big.id, small.id], "tarball", limit=4, mode=mode, per_corpus_limit=2,
+        )
+
+        assert len(splits) == 4, mode
+        assert sorted(split.corpus_id == small.id for split in splits) == [
+            False, False, True, True,
+        ], mode
+
+
+@patch("corpora_ai.provider_loader.load_llm_provider")
+@pytest.mark.django_db
+def test_get_relevant_splits_summary(mock_llm_provider, settings):
+    """Summary search only ranks splits of the files with the nearest
+    summaries, and ranks them all before any summaries exist.
+    """
+    mock_llm_provider.return_value.get_embedding.return_value = [0.1] * 1536
+    settings.CORPORA_SUMMARY_SEARCH_FILES = 1
+    user = User.objects.create(username="testuser", password="password123")
+    corpus = Corpus.objects.create(name="Test Corpus", owner=user)
+    near_file = CorpusTextFile.objects.create(corpus=corpus, path="near.txt")
+    far_file = CorpusTextFile.objects.create(corpus=corpus, path="far.txt")
+    # Nearest split overall, but in the file with the farther summary
+    far_split = Split.objects.create(
+        file=far_file, order=0, content="far", vector=[0.1] * 1536,
+    )
+    near_split = Split.objects.create(
+        file=near_file, order=0, content="near", vector=[0.1] * 512 + [0.3] * 1024,
+    )
+
+    assert corpus.get_relevant_splits("query text", mode="summary") == [
+        far_split,
+        near_split,
+    ]
+
+    CorpusTextFile.objects.filter(id=near_file.id).update(
+        vector_of_summary=[0.1] * 1536,
+    )
+    CorpusTextFile.objects.filter(id=far_file.id).update(
+        vector_of_summary=[0.1] * 512 + [0.3] * 1024,
+    )
+    relevant_splits = corpus.get_relevant_splits("query text", mode="summary")
+
+    assert relevant_splits == [near_split]
+    assert relevant_splits[0].file_path == "near.txt"
+
+
+@pytest.mark.django_db
+def test_find_files_prefix_and_substring():
+    """Literal path modes ignore case, skip other corpora, rank shorter
+    paths first, and leave file content behind.
+    """
+    user = User.objects.create(username="testuser", password="password123")
+    corpus = Corpus.objects.create(name="Test Corpus", owner=user)
+    other = Corpus.objects.create(name="Other Corpus", owner=user)
+    for path in ["py/corpora/models.py", "py/corpora/test_models.py", "Models.md"]:
+        CorpusTextFile.objects.create(corpus=corpus, path=path, content="...")
+    CorpusTextFile.objects.create(corpus=other, path="models.py")
+
+    prefix = corpus.find_files("MODEL", mode="prefix")
+    substring = corpus.find_files("models", mode="substring")
+
+    assert [f.path for f in prefix] == ["Models.md"]
+    assert [f.path for f in substring] == [
+        "Models.md",
+        "py/corpora/models.py",
+        "py/corpora/test_models.py",
+    ]
+    assert "content" in substring[0].get_deferred_fields()
+    assert [f.path for f in corpus.find_files("models", mode="substring", limit=1)] == [
+        "Models.md",
+    ]
+    # LIKE wildcards are matched literally
+    assert corpus.find_files("%", mode="substring") == []
+    with pytest.raises(ValueError):
+        corpus.find_files("models", mode="regex")
+
+
+@pytest.mark.django_db
+def test_find_files_trigram():
+    """Trigram mode finds misspelled paths, most similar first."""
+    user = User.objects.create(username="testuser", password="password123")
+    corpus = Corpus.objects.create(name="Test Corpus", owner=user)
+    for path in ["py/corpora/models.py", "py/corpora/routers/split.py", "README.md"]:
+        CorpusTextFile.objects.create(corpus=corpus, path=path)
+
+    files = corpus.find_files("corpora/modles.py")
+
+    assert files[0].path == "py/corpora/models.py"
+    similarities = [f.similarity for f in files]
+    assert similarities == sorted(similarities, reverse=True)
+    assert "README.md" not in [f.path for f in files]
+
+
+@pytest.mark.django_db
+def test_upload_delete_expired(settings):
+    """Expired uploads are deleted with their parts; recent ones are kept."""
+    settings.CORPORA_UPLOAD_TTL = 60
+    user = User.objects.create(username="testuser", password="password123")
+    expired = Upload.objects.create(
+        owner=user,
+        size=3,
+        created_at=timezone.now() - timedelta(hours=1),
+    )
+    expired.save_part(0, ContentFile(b"abc"), hashlib.sha256(b"abc").hexdigest())
+    recent = Upload.objects.create(owner=user, size=3)
+
+    assert Upload.delete_expired() == 1
+    assert list(Upload.objects.all()) == [recent]
+    assert not UploadPart.objects.exists()
+    assert not get_upload_storage().exists(expired.parts_dir + "/" + "0" * 15)
@@ -2,6 +2,8 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from corpora.models import (
     Corpus,
@@ -43,7 +45,7 @@ class TestCorpusModelMethods:
         split2 = Split.objects.create(
             file=file,
             content="Content 2",
-            vector=[0.2] * 1536,
+            vector=[0.1] * 768 + [0.2] * 768,
             order=2,
         )
         return [split1, split2]
@@ -78,6 +80,33 @@ class TestCorpusModelMethods:
             assert "```\n" in context
             mock_llm.get_embedding.assert_called_once_with("Test query")
 
+    def test_get_relevant_splits_context_single_select(self, corpus, file):
+        for order in range(20):
+            Split.objects.create(
+                file=file,
+                content=f"Content {order}",
+                vector=[0.1] * 1536,
+                order=order,
+            )
+        with patch(
+            "corpora_ai.provider_loader.load_llm_provider",
+        ) as mock_load_llm_provider:
+            mock_load_llm_provider.return_value.get_embedding.return_value = [
+                0.1,
+            ] * 1536
+
+            for limit in (1, 20):
+                with CaptureQueriesContext(connection) as queries:
+                    context = corpus.get_relevant_splits_context(
+                        "Test query", limit=limit,
+                    )
+                selects = [
+                    q for q in queries.captured_queries
+                    if q["sql"].startswith("SELECT")
+                ]
+                assert len(selects) == 1
+                assert context.count("test.txt:") == limit
+
     def test_get_file_hashes(self, corpus, file):
         # Test that the file hashes are retrieved correctly
         file_hashes = corpus.get_file_hashes()
@@ -85,8 +114,49 @@ class TestCorpusModelMethods:
         assert len(file_hashes) == 1
         assert file_hashes["test.txt"] == "abc123"
 
+    def test_get_file_hashes_etag(self, corpus, file):
+        etag = corpus.get_file_hashes_etag()
+        assert etag.startswith('"')
+        assert corpus.get_file_hashes_etag() == etag
+
+        file.checksum = "def456"
+        file.save()
+        changed = corpus.get_file_hashes_etag()
+        assert changed != etag
+
+        file.delete()
+        assert corpus.get_file_hashes_etag() not in (etag, changed)
+
     def test_delete_files(self, corpus, file):
         # Test deleting files by path
         corpus.delete_files(["test.txt"])
         remaining_files = corpus.files.all()
         assert remaining_files.count() == 0
+
+    def test_upsert_files(self, corpus, file, mock_splits):
+        saved = corpus.upsert_files(
+            [
+                CorpusTextFile(path="test.txt", content="Updated", checksum="def"),
+                CorpusTextFile(path="new.txt", content="New", checksum="ghi"),
+            ],
+        )
+
+        assert {f.path for f in saved} == {"test.txt", "new.txt"}
+        assert next(f for f in saved if f.path == "test.txt").id == file.id
+        file.refresh_from_db()
+        assert file.content == "Updated"
+        assert file.checksum == "def"
+        assert corpus.files.count() == 2
+        # splits are kept for split_files to diff against
+        assert Split.objects.filter(file=file).count() == len(mock_splits)
+
+    def test_upsert_files_duplicate_paths(self, corpus):
+        saved = corpus.upsert_files(
+            [
+                CorpusTextFile(path="dup.txt", content="first"),
+                CorpusTextFile(path="dup.txt", content="second"),
+            ],
+        )
+
+        assert len(saved) == 1
+        assert corpus.files.get(path="dup.txt").content == "second"
@@ -1,3 +1,5 @@
+from typing import Tuple
+
 import tiktoken
 
 
@@ -18,3 +20,26 @@ def count_tokens(text: str, model: str = "gpt-3.5-turbo") -> int:
     # Encode the text and count the tokens
     tokens = encoding.encode(text)
     return len(tokens)
+
+
+def truncate_to_tokens(
+    text: str,
+    max_tokens: int,
+    model: str = "gpt-3.5-turbo",
+) -> Tuple[str, int]:
+    """Cut a text down to at most `max_tokens` tokens for a specific model.
+
+    Args:
+        text (str): The text to truncate.
+        max_tokens (int): The most tokens to keep.
+        model (str): The model to base the tokenization on. Default is "gpt-3.5-turbo".
+
+    Returns:
+        Tuple[str, int]: The (possibly) truncated text and its token count.
+
+    """
+    encoding = tiktoken.encoding_for_model(model)
+    tokens = encoding.encode(text)
+    if len(tokens) <= max_tokens:
+        return text, len(tokens)
+    return encoding.decode(tokens[:max_tokens]), max_tokens
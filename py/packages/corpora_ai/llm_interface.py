@@ -1,6 +1,7 @@
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List, Optional, Type, TypeVar
+from typing import AsyncIterator, Iterator, List, Optional, Type, TypeVar
 
 from pydantic import BaseModel
 
@@ -31,6 +32,9 @@ class GeneratedImage:
 class LLMBaseInterface(ABC):
     """Abstract base class for LLM providers, defining methods for text generation and embeddings."""
 
+    # Model behind get_embedding(s); cached vectors are keyed by it
+    embedding_model: str = ""
+
     @abstractmethod
     def get_text_completion(
         self,
@@ -91,6 +95,62 @@ class LLMBaseInterface(ABC):
 
         """
 
+    def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Generates embedding vectors for many texts, in input order.
+
+        Providers that accept batched input should override this to make
+        as few requests as possible.
+
+        Args:
+            texts (List[str]): The texts to embed.
+
+        Returns:
+            List[List[float]]: One embedding vector per input text.
+
+        """
+        return [self.get_embedding(text) for text in texts]
+
+    async def aget_text_completion(
+        self,
+        messages: List[ChatCompletionTextMessage],
+    ) -> str:
+        """Async counterpart of `get_text_completion`.
+
+        The default runs the blocking call in a worker thread so it doesn't
+        stall the event loop. Providers with an async client should override it.
+        """
+        return await asyncio.to_thread(self.get_text_completion, messages)
+
+    def stream_text_completion(
+        self,
+        messages: List[ChatCompletionTextMessage],
+    ) -> Iterator[str]:
+        """Yields the completion text in pieces as the provider produces them.
+
+        The default yields the whole completion at once. Providers that can
+        stream should override it so the first tokens arrive early.
+        """
+        yield self.get_text_completion(messages)
+
+    async def astream_text_completion(
+        self,
+        messages: List[ChatCompletionTextMessage],
+    ) -> AsyncIterator[str]:
+        """Async counterpart of `stream_text_completion`."""
+        yield await self.aget_text_completion(messages)
+
+    async def aget_data_completion(
+        self,
+        messages: List[ChatCompletionTextMessage],
+        model: Type[T],
+    ) -> T:
+        """Async counterpart of `get_data_completion`."""
+        return await asyncio.to_thread(self.get_data_completion, messages, model)
+
+    async def aget_embedding(self, text: str) -> List[float]:
+        """Async counterpart of `get_embedding`."""
+        return await asyncio.to_thread(self.get_embedding, text)
+
     def get_summary(self, text: str) -> str:
         """Generates a summary of the input text.
 
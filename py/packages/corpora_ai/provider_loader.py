@@ -1,5 +1,6 @@
 import os
-from typing import Optional
+import threading
+from typing import Callable, Dict, Optional, Tuple
 
 from corpora_ai_openai.llm_client import OpenAIClient
 from corpora_ai_xai.llm_client import XAIClient
@@ -9,10 +10,50 @@ from corpora_ai.llm_interface import LLMBaseInterface
 # Future imports for other providers,
 # e.g., Anthropic or Cohere, would follow the same pattern
 
+# Clients are thread-safe and hold a keep-alive connection pool,
+# so one per configuration is shared by the whole process
+_providers: Dict[Tuple, LLMBaseInterface] = {}
+_providers_lock = threading.Lock()
+
+
+def clear_llm_provider_cache() -> None:
+    """Forget every memoized provider, e.g. between tests."""
+    with _providers_lock:
+        _providers.clear()
+
+
+def _reset_after_fork() -> None:
+    # A forked child (e.g. a Celery prefork worker) must not share
+    # the parent's sockets. The lock is held across the fork so the
+    # child never inherits a half-written registry.
+    _providers.clear()
+    _providers_lock.release()
+
+
+os.register_at_fork(
+    before=_providers_lock.acquire,
+    after_in_parent=_providers_lock.release,
+    after_in_child=_reset_after_fork,
+)
+
+
+def _get_or_create(
+    key: Tuple,
+    factory: Callable[[], LLMBaseInterface],
+) -> LLMBaseInterface:
+    with _providers_lock:
+        provider = _providers.get(key)
+        if provider is None:
+            provider = _providers[key] = factory()
+        return provider
+
 
 def load_llm_provider(provider_name="", **kwargs) -> Optional[LLMBaseInterface]:
     """Dynamically loads the best LLM provider based on environment variables.
 
+    Providers are memoized per process by provider, credentials, endpoint
+    and model arguments, so repeated calls reuse one HTTP connection pool.
+
     Returns:
         Optional[LLMBaseInterface]: An instance of the best available LLM provider.
 
@@ -29,20 +70,27 @@ def load_llm_provider(provider_name="", **kwargs) -> Optional[LLMBaseInterface]:
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise ValueError("OPENAI_API_KEY environment variable is not set.")
-        return OpenAIClient(
-            api_key=api_key,
-            # completion_model=model_name,
-            azure_endpoint=os.getenv("OPENAI_AZURE_ENDPOINT", None),
-            **kwargs,
+        azure_endpoint = os.getenv("OPENAI_AZURE_ENDPOINT", None)
+        return _get_or_create(
+            (provider_name, api_key, azure_endpoint, *sorted(kwargs.items())),
+            lambda: OpenAIClient(
+                api_key=api_key,
+                # completion_model=model_name,
+                azure_endpoint=azure_endpoint,
+                **kwargs,
+            ),
         )
 
     if provider_name == "xai" and XAIClient:
         api_key = os.getenv("XAI_API_KEY")
         if not api_key:
             raise ValueError("XAI_API_KEY environment variable is not set.")
-        return XAIClient(
-            api_key=api_key,
-            **kwargs,
+        return _get_or_create(
+            (provider_name, api_key, *sorted(kwargs.items())),
+            lambda: XAIClient(
+                api_key=api_key,
+                **kwargs,
+            ),
         )
 
     # Placeholder for additional providers (e.g., Anthropic)
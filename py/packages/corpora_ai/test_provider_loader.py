@@ -3,10 +3,18 @@ import unittest
 from unittest.mock import MagicMock, patch
 
 from corpora_ai.llm_interface import LLMBaseInterface
-from corpora_ai.provider_loader import load_llm_provider
+from corpora_ai.provider_loader import (
+    clear_llm_provider_cache,
+    load_llm_provider,
+)
 
 
 class TestLoadLLMProvider(unittest.TestCase):
+    def setUp(self):
+        clear_llm_provider_cache()
+
+    def tearDown(self):
+        clear_llm_provider_cache()
 
     @patch.dict(
         os.environ, {"LLM_PROVIDER": "openai", "OPENAI_API_KEY": "test_api_key"},
@@ -26,6 +34,48 @@ class TestLoadLLMProvider(unittest.TestCase):
         self.assertIsInstance(provider, LLMBaseInterface)
         self.assertEqual(provider, mock_client_instance)
 
+    @patch.dict(
+        os.environ, {"LLM_PROVIDER": "openai", "OPENAI_API_KEY": "test_api_key"},
+    )
+    @patch("corpora_ai.provider_loader.OpenAIClient")
+    def test_provider_is_memoized(self, MockOpenAIClient):
+        """Test that repeated loads share one client per configuration."""
+        MockOpenAIClient.side_effect = lambda **kwargs: MagicMock()
+
+        provider = load_llm_provider()
+        self.assertIs(load_llm_provider(), provider)
+        self.assertIs(load_llm_provider("openai"), provider)
+        MockOpenAIClient.assert_called_once()
+
+        other = load_llm_provider(completion_model="gpt-4o")
+        self.assertIsNot(other, provider)
+        self.assertIs(load_llm_provider(completion_model="gpt-4o"), other)
+
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "rotated_key"}):
+            self.assertIsNot(load_llm_provider(), provider)
+        self.assertEqual(MockOpenAIClient.call_count, 3)
+
+    @patch.dict(
+        os.environ, {"LLM_PROVIDER": "openai", "OPENAI_API_KEY": "test_api_key"},
+    )
+    @patch("corpora_ai.provider_loader.OpenAIClient")
+    def test_provider_cache_reset_after_fork(self, MockOpenAIClient):
+        """Test that a forked child builds its own client."""
+        MockOpenAIClient.side_effect = lambda **kwargs: MagicMock()
+
+        provider = load_llm_provider()
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            # Child: report whether it got a fresh client, then exit
+            os.write(write_fd, b"1" if load_llm_provider() is not provider else b"0")
+            os._exit(0)
+        os.waitpid(pid, 0)
+        self.assertEqual(os.read(read_fd, 1), b"1")
+        os.close(read_fd)
+        os.close(write_fd)
+        self.assertIs(load_llm_provider(), provider)
+
     @patch.dict(os.environ, {"LLM_PROVIDER": "openai", "OPENAI_API_KEY": ""})
     @patch("corpora_ai.provider_loader.OpenAIClient")
     def test_missing_openai_api_key(self, MockOpenAIClient):
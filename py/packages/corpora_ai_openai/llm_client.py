@@ -1,13 +1,29 @@
 import base64
 import json
-from typing import TYPE_CHECKING, List, Type, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Type,
+    TypeVar,
+)
 
+from corpora_ai.count_tokens import count_tokens
 from corpora_ai.llm_interface import (
     ChatCompletionTextMessage,
     GeneratedImage,
     LLMBaseInterface,
 )
-from openai import AzureOpenAI, OpenAI, OpenAIError
+from openai import (
+    AsyncAzureOpenAI,
+    AsyncOpenAI,
+    AzureOpenAI,
+    OpenAI,
+    OpenAIError,
+)
 from pydantic import BaseModel
 
 if TYPE_CHECKING:
@@ -16,6 +32,10 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", bound=BaseModel)
 
+# Per-request limits of the embeddings endpoint
+EMBEDDING_MAX_BATCH_SIZE = 2048
+EMBEDDING_MAX_BATCH_TOKENS = 300_000
+
 
 class OpenAIClient(LLMBaseInterface):
     def __init__(
@@ -35,14 +55,17 @@ class OpenAIClient(LLMBaseInterface):
         azure_endpoint: str = None,
     ):
         if azure_endpoint:
-            self.client = AzureOpenAI(
-                api_key=api_key,
-                azure_endpoint=azure_endpoint,
+            azure_kwargs = {
+                "api_key": api_key,
+                "azure_endpoint": azure_endpoint,
                 # TODO: we should make this a parameter or what?
-                api_version="2024-10-01-preview",
-            )
+                "api_version": "2024-10-01-preview",
+            }
+            self.client = AzureOpenAI(**azure_kwargs)
+            self.async_client = AsyncAzureOpenAI(**azure_kwargs)
         else:
             self.client = OpenAI(api_key=api_key)
+            self.async_client = AsyncOpenAI(api_key=api_key)
         self.completion_model = completion_model
         self.embedding_model = embedding_model
         self.image_model = image_model
@@ -51,18 +74,44 @@ class OpenAIClient(LLMBaseInterface):
         self,
         messages: List[ChatCompletionTextMessage],
     ) -> str:
-        if not messages:
-            raise ValueError("Input messages must not be empty.")
-        # Convert Message objects to dictionaries for the OpenAI API
-        message_dicts = [
-            {"role": msg.role, "content": msg.text} for msg in messages
-        ]
         response = self.client.chat.completions.create(
-            model=self.completion_model,
-            messages=message_dicts,
+            **self._text_completion_request(messages),
+        )
+        return response.choices[0].message.content
+
+    async def aget_text_completion(
+        self,
+        messages: List[ChatCompletionTextMessage],
+    ) -> str:
+        response = await self.async_client.chat.completions.create(
+            **self._text_completion_request(messages),
         )
         return response.choices[0].message.content
 
+    def stream_text_completion(
+        self,
+        messages: List[ChatCompletionTextMessage],
+    ) -> Iterator[str]:
+        stream = self.client.chat.completions.create(
+            **self._text_completion_request(messages),
+            stream=True,
+        )
+        for chunk in stream:
+            if text := _chunk_text(chunk):
+                yield text
+
+    async def astream_text_completion(
+        self,
+        messages: List[ChatCompletionTextMessage],
+    ) -> AsyncIterator[str]:
+        stream = await self.async_client.chat.completions.create(
+            **self._text_completion_request(messages),
+            stream=True,
+        )
+        async for chunk in stream:
+            if text := _chunk_text(chunk):
+                yield text
+
     def get_data_completion(
         self,
         messages: List[ChatCompletionTextMessage],
@@ -78,16 +127,49 @@ class OpenAIClient(LLMBaseInterface):
             BaseModel: An instance of the provided Pydantic model populated with data.
 
         """
-        if not issubclass(model, BaseModel):
-            raise ValueError("Schema must be a subclass of pydantic.BaseModel.")
+        request = self._data_completion_request(messages, model)
+        try:
+            # Call OpenAI API with function calling
+            response = self.client.chat.completions.create(**request)
+        except OpenAIError as e:
+            raise RuntimeError(f"Failed to generate data completion: {e}")
+        return self._parse_data_completion(response, model)
+
+    async def aget_data_completion(
+        self,
+        messages: List[ChatCompletionTextMessage],
+        model: Type[T],
+    ) -> T:
+        request = self._data_completion_request(messages, model)
+        try:
+            response = await self.async_client.chat.completions.create(
+                **request,
+            )
+        except OpenAIError as e:
+            raise RuntimeError(f"Failed to generate data completion: {e}")
+        return self._parse_data_completion(response, model)
 
+    def _text_completion_request(
+        self,
+        messages: List[ChatCompletionTextMessage],
+    ) -> Dict[str, Any]:
         if not messages:
             raise ValueError("Input messages must not be empty.")
-
-        # Prepare messages for OpenAI API
+        # Convert Message objects to dictionaries for the OpenAI API
         message_dicts = [
             {"role": msg.role, "content": msg.text} for msg in messages
         ]
+        return {"model": self.completion_model, "messages": message_dicts}
+
+    def _data_completion_request(
+        self,
+        messages: List[ChatCompletionTextMessage],
+        model: Type[T],
+    ) -> Dict[str, Any]:
+        if not issubclass(model, BaseModel):
+            raise ValueError("Schema must be a subclass of pydantic.BaseModel.")
+
+        request = self._text_completion_request(messages)
 
         # Generate JSON Schema from the Pydantic model
         json_schema = model.model_json_schema()
@@ -98,24 +180,18 @@ class OpenAIClient(LLMBaseInterface):
             "description": "Generate data based on the provided schema.",
             "parameters": json_schema,
         }
+        request["functions"] = [function]
+        request["function_call"] = {"name": "generate_data"}
+        return request
 
+    def _parse_data_completion(self, response: Any, model: Type[T]) -> T:
+        # Extract and parse function arguments
+        function_args = response.choices[0].message.function_call.arguments
         try:
-            # Call OpenAI API with function calling
-            response = self.client.chat.completions.create(
-                model=self.completion_model,
-                messages=message_dicts,
-                functions=[function],
-                function_call={"name": "generate_data"},
-            )
-
-            # Extract and parse function arguments
-            function_args = response.choices[0].message.function_call.arguments
             data_dict = json.loads(function_args)
-            return model.model_validate(data_dict)
-        except OpenAIError as e:
-            raise RuntimeError(f"Failed to generate data completion: {e}")
         except json.JSONDecodeError as e:
             raise RuntimeError(f"Failed to parse function arguments: {e}")
+        return model.model_validate(data_dict)
 
     def get_image(
         self,
@@ -159,3 +235,51 @@ class OpenAIClient(LLMBaseInterface):
             model=self.embedding_model,
         )
         return response.data[0].embedding
+
+    async def aget_embedding(self, text: str) -> List[float]:
+        if not text:
+            raise ValueError("Input text must not be empty.")
+        response = await self.async_client.embeddings.create(
+            input=text,
+            model=self.embedding_model,
+        )
+        return response.data[0].embedding
+
+    def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Embeds many texts, packing them into as few requests as the
+        endpoint's input count and token limits allow.
+        """
+        if not all(texts):
+            raise ValueError("Input texts must not be empty.")
+        embeddings: List[List[float]] = []
+        for batch in self._batch_embedding_inputs(texts):
+            response = self.client.embeddings.create(
+                input=batch,
+                model=self.embedding_model,
+            )
+            ordered = sorted(response.data, key=lambda item: item.index)
+            embeddings.extend(item.embedding for item in ordered)
+        return embeddings
+
+    def _batch_embedding_inputs(self, texts: List[str]) -> Iterator[List[str]]:
+        batch: List[str] = []
+        batch_tokens = 0
+        for text in texts:
+            tokens = count_tokens(text, self.embedding_model)
+            if batch and (
+                len(batch) >= EMBEDDING_MAX_BATCH_SIZE
+                or batch_tokens + tokens > EMBEDDING_MAX_BATCH_TOKENS
+            ):
+                yield batch
+                batch, batch_tokens = [], 0
+            batch.append(text)
+            batch_tokens += tokens
+        if batch:
+            yield batch
+
+
+def _chunk_text(chunk: Any) -> str:
+    # Some chunks (e.g. Azure content filter results) carry no choices
+    if not chunk.choices:
+        return ""
+    return chunk.choices[0].delta.content or ""
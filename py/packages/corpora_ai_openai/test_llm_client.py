@@ -1,14 +1,18 @@
+import asyncio
+import time
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from corpora_ai.llm_interface import ChatCompletionTextMessage
+from pydantic import BaseModel
 
 from corpora_ai_openai.llm_client import OpenAIClient
 
 
 class TestOpenAIClient(unittest.TestCase):
+    @patch("corpora_ai_openai.llm_client.AsyncOpenAI")
     @patch("corpora_ai_openai.llm_client.OpenAI")
-    def setUp(self, MockOpenAI):
+    def setUp(self, MockOpenAI, MockAsyncOpenAI):
         """Set up the OpenAIClient instance and mock OpenAI API client."""
         self.mock_openai_client = MockOpenAI.return_value
         self.client = OpenAIClient(api_key="test_api_key")
@@ -42,6 +46,32 @@ class TestOpenAIClient(unittest.TestCase):
             messages=[{"role": "user", "content": "Tell me a joke."}],
         )
 
+    def test_stream_text_completion(self):
+        """Test that stream_text_completion yields deltas and skips empty chunks."""
+
+        def chunk(content):
+            c = MagicMock()
+            c.choices = [MagicMock()]
+            c.choices[0].delta.content = content
+            return c
+
+        empty = MagicMock()
+        empty.choices = []
+        self.mock_openai_client.chat.completions.create.return_value = iter(
+            [empty, chunk("Hello"), chunk(None), chunk(" world")],
+        )
+
+        messages = [ChatCompletionTextMessage(role="user", text="Hi")]
+        self.assertEqual(
+            list(self.client.stream_text_completion(messages)),
+            ["Hello", " world"],
+        )
+        self.mock_openai_client.chat.completions.create.assert_called_once_with(
+            model="gpt-4.1",
+            messages=[{"role": "user", "content": "Hi"}],
+            stream=True,
+        )
+
     def test_get_embedding_success(self):
         """Test that get_embedding returns the correct embedding vector."""
         # Mock response from OpenAI API
@@ -60,6 +90,54 @@ class TestOpenAIClient(unittest.TestCase):
             model="text-embedding-3-small",
         )
 
+    @patch("corpora_ai_openai.llm_client.count_tokens", lambda text, model: 1)
+    def test_get_embeddings_success(self):
+        """Test that get_embeddings sends one request and keeps input order."""
+        mock_response = MagicMock()
+        mock_response.data = [
+            MagicMock(index=1, embedding=[0.2]),
+            MagicMock(index=0, embedding=[0.1]),
+        ]
+        self.mock_openai_client.embeddings.create.return_value = mock_response
+
+        response = self.client.get_embeddings(["first", "second"])
+        self.assertEqual(response, [[0.1], [0.2]])
+
+        self.mock_openai_client.embeddings.create.assert_called_once_with(
+            input=["first", "second"],
+            model="text-embedding-3-small",
+        )
+
+    @patch("corpora_ai_openai.llm_client.EMBEDDING_MAX_BATCH_TOKENS", 5)
+    @patch("corpora_ai_openai.llm_client.count_tokens", lambda text, model: 2)
+    def test_get_embeddings_batches_by_token_budget(self):
+        """Test that get_embeddings splits requests to stay under the token budget."""
+
+        def create(input, model):
+            response = MagicMock()
+            response.data = [
+                MagicMock(index=i, embedding=[float(len(text))])
+                for i, text in enumerate(input)
+            ]
+            return response
+
+        self.mock_openai_client.embeddings.create.side_effect = create
+
+        response = self.client.get_embeddings(["a", "bb", "ccc", "dddd", "eeeee"])
+        self.assertEqual(response, [[1.0], [2.0], [3.0], [4.0], [5.0]])
+        self.assertEqual(
+            [
+                call.kwargs["input"]
+                for call in self.mock_openai_client.embeddings.create.call_args_list
+            ],
+            [["a", "bb"], ["ccc", "dddd"], ["eeeee"]],
+        )
+
+    def test_get_embeddings_empty_text(self):
+        """Test that get_embeddings raises an error when any text is empty."""
+        with self.assertRaises(ValueError):
+            self.client.get_embeddings(["text", ""])
+
     def test_get_text_completion_empty_messages(self):
         """Test that get_text_completion raises an error when messages list is empty."""
         with self.assertRaises(ValueError):
@@ -71,5 +149,116 @@ class TestOpenAIClient(unittest.TestCase):
             self.client.get_embedding("")
 
 
+class TestOpenAIClientAsync(unittest.IsolatedAsyncioTestCase):
+    @patch("corpora_ai_openai.llm_client.AsyncOpenAI")
+    @patch("corpora_ai_openai.llm_client.OpenAI")
+    def setUp(self, MockOpenAI, MockAsyncOpenAI):
+        """Set up the OpenAIClient instance with a mocked async API client."""
+        self.mock_sync_client = MockOpenAI.return_value
+        self.mock_async_client = MockAsyncOpenAI.return_value
+        self.mock_async_client.chat.completions.create = AsyncMock()
+        self.mock_async_client.embeddings.create = AsyncMock()
+        self.client = OpenAIClient(api_key="test_api_key")
+
+    async def test_aget_text_completion_uses_async_client(self):
+        """Test that aget_text_completion awaits the async client."""
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = "This is a test response."
+        self.mock_async_client.chat.completions.create.return_value = (
+            mock_response
+        )
+
+        response = await self.client.aget_text_completion(
+            [ChatCompletionTextMessage(role="user", text="Tell me a joke.")],
+        )
+
+        self.assertEqual(response, "This is a test response.")
+        self.mock_async_client.chat.completions.create.assert_awaited_once_with(
+            model="gpt-4.1",
+            messages=[{"role": "user", "content": "Tell me a joke."}],
+        )
+        self.mock_sync_client.chat.completions.create.assert_not_called()
+
+    async def test_aget_data_completion(self):
+        """Test that aget_data_completion parses the function call arguments."""
+
+        class Answer(BaseModel):
+            answer: str
+
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.function_call.arguments = (
+            '{"answer": "42"}'
+        )
+        self.mock_async_client.chat.completions.create.return_value = (
+            mock_response
+        )
+
+        response = await self.client.aget_data_completion(
+            [ChatCompletionTextMessage(role="user", text="The answer?")],
+            Answer,
+        )
+
+        self.assertEqual(response, Answer(answer="42"))
+        kwargs = self.mock_async_client.chat.completions.create.await_args.kwargs
+        self.assertEqual(kwargs["function_call"], {"name": "generate_data"})
+
+    async def test_aget_embedding(self):
+        """Test that aget_embedding awaits the async client."""
+        mock_response = MagicMock()
+        mock_response.data = [MagicMock(embedding=[0.1, 0.2, 0.3])]
+        self.mock_async_client.embeddings.create.return_value = mock_response
+
+        response = await self.client.aget_embedding("Sample text")
+
+        self.assertEqual(response, [0.1, 0.2, 0.3])
+        self.mock_async_client.embeddings.create.assert_awaited_once_with(
+            input="Sample text",
+            model="text-embedding-3-small",
+        )
+
+    async def test_astream_text_completion(self):
+        """Test that astream_text_completion yields deltas from the async stream."""
+
+        async def stream():
+            for content in ["Hello", None, " world"]:
+                c = MagicMock()
+                c.choices = [MagicMock()]
+                c.choices[0].delta.content = content
+                yield c
+
+        self.mock_async_client.chat.completions.create.return_value = stream()
+
+        messages = [ChatCompletionTextMessage(role="user", text="Hi")]
+        chunks = [
+            chunk async for chunk in self.client.astream_text_completion(messages)
+        ]
+        self.assertEqual(chunks, ["Hello", " world"])
+        kwargs = self.mock_async_client.chat.completions.create.await_args.kwargs
+        self.assertTrue(kwargs["stream"])
+
+    async def test_aget_text_completion_runs_concurrently(self):
+        """Test that concurrent completions overlap instead of serializing."""
+
+        async def slow_create(**kwargs):
+            await asyncio.sleep(0.2)
+            response = MagicMock()
+            response.choices = [MagicMock()]
+            response.choices[0].message.content = "done"
+            return response
+
+        self.mock_async_client.chat.completions.create.side_effect = slow_create
+        messages = [ChatCompletionTextMessage(role="user", text="Hi")]
+
+        start = time.monotonic()
+        responses = await asyncio.gather(
+            *(self.client.aget_text_completion(messages) for _ in range(5)),
+        )
+
+        self.assertEqual(responses, ["done"] * 5)
+        self.assertLess(time.monotonic() - start, 0.5)
+
+
 if __name__ == "__main__":
     unittest.main()
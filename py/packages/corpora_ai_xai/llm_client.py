@@ -1,12 +1,21 @@
 import base64
-from typing import TYPE_CHECKING, List, Type, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Type,
+    TypeVar,
+)
 
 from corpora_ai.llm_interface import (
     ChatCompletionTextMessage,
     GeneratedImage,
     LLMBaseInterface,
 )
-from openai import OpenAI, OpenAIError
+from openai import AsyncOpenAI, OpenAI, OpenAIError
 
 # openai.types.images_response.ImagesResponse
 from pydantic import BaseModel
@@ -17,6 +26,10 @@ if TYPE_CHECKING:
 T = TypeVar("T", bound=BaseModel)
 
 
+class _ToolCallError(Exception):
+    """The response didn't contain the expected tool call; worth a retry."""
+
+
 class XAIClient(LLMBaseInterface):
     """
     Grok/XAI client supporting tool-calling (a.k.a. function-calling).
@@ -32,6 +45,7 @@ class XAIClient(LLMBaseInterface):
         # XAI has no embedding model
     ):
         self.client = OpenAI(api_key=api_key, base_url=base_url)
+        self.async_client = AsyncOpenAI(api_key=api_key, base_url=base_url)
         self.completion_model = completion_model
         self.image_model = image_model
 
@@ -39,15 +53,44 @@ class XAIClient(LLMBaseInterface):
         self,
         messages: List[ChatCompletionTextMessage],
     ) -> str:
-        if not messages:
-            raise ValueError("Input messages must not be empty.")
-        payload = [{"role": m.role, "content": m.text} for m in messages]
         resp = self.client.chat.completions.create(
-            model=self.completion_model,
-            messages=payload,
+            **self._text_completion_request(messages),
         )
         return resp.choices[0].message.content
 
+    async def aget_text_completion(
+        self,
+        messages: List[ChatCompletionTextMessage],
+    ) -> str:
+        resp = await self.async_client.chat.completions.create(
+            **self._text_completion_request(messages),
+        )
+        return resp.choices[0].message.content
+
+    def stream_text_completion(
+        self,
+        messages: List[ChatCompletionTextMessage],
+    ) -> Iterator[str]:
+        stream = self.client.chat.completions.create(
+            **self._text_completion_request(messages),
+            stream=True,
+        )
+        for chunk in stream:
+            if text := _chunk_text(chunk):
+                yield text
+
+    async def astream_text_completion(
+        self,
+        messages: List[ChatCompletionTextMessage],
+    ) -> AsyncIterator[str]:
+        stream = await self.async_client.chat.completions.create(
+            **self._text_completion_request(messages),
+            stream=True,
+        )
+        async for chunk in stream:
+            if text := _chunk_text(chunk):
+                yield text
+
     def get_data_completion(
         self,
         messages: List[ChatCompletionTextMessage],
@@ -60,24 +103,66 @@ class XAIClient(LLMBaseInterface):
         Args:
           messages: chat messages
           model: the Pydantic model class for output
-          tool_name: name of the tool/function to invoke
-          tool_description: description for the tool
+          retries: attempts before giving up on a missing/unexpected tool call
 
         Returns:
           An instance of `model` populated from the tool_call arguments.
         """
-        if not issubclass(model, BaseModel):
-            raise ValueError("Schema must subclass pydantic.BaseModel.")
+        request = self._data_completion_request(messages, model)
+        tries = 0
+        while True:
+            tries += 1
+            try:
+                resp = self.client.chat.completions.create(**request)
+                return self._parse_tool_call(resp, model)
+            except (OpenAIError, _ToolCallError) as e:
+                if tries >= retries:
+                    raise RuntimeError(f"XAI request failed: {e}")
+                print(f"XAI request failed: {e}")
+
+    async def aget_data_completion(
+        self,
+        messages: List[ChatCompletionTextMessage],
+        model: Type[T],
+        retries: int = 3,
+    ) -> T:
+        request = self._data_completion_request(messages, model)
+        tries = 0
+        while True:
+            tries += 1
+            try:
+                resp = await self.async_client.chat.completions.create(
+                    **request,
+                )
+                return self._parse_tool_call(resp, model)
+            except (OpenAIError, _ToolCallError) as e:
+                if tries >= retries:
+                    raise RuntimeError(f"XAI request failed: {e}")
+                print(f"XAI request failed: {e}")
+
+    def _text_completion_request(
+        self,
+        messages: List[ChatCompletionTextMessage],
+    ) -> Dict[str, Any]:
         if not messages:
             raise ValueError("Input messages must not be empty.")
+        payload = [{"role": m.role, "content": m.text} for m in messages]
+        return {"model": self.completion_model, "messages": payload}
+
+    def _data_completion_request(
+        self,
+        messages: List[ChatCompletionTextMessage],
+        model: Type[T],
+    ) -> Dict[str, Any]:
+        if not issubclass(model, BaseModel):
+            raise ValueError("Schema must subclass pydantic.BaseModel.")
+        request = self._text_completion_request(messages)
 
         print(f"XAI: {model.__name__} tool-calling")
         tool_name = f"{model.__name__}"
         tool_description = (
             f"Generate data based on the provided parameters {tool_name} schema"
         )
-
-        payload = [{"role": m.role, "content": m.text} for m in messages]
         schema = model.model_json_schema()
         # XAI expects a `tools` list with function definitions:
         tool_def = {
@@ -88,43 +173,22 @@ class XAIClient(LLMBaseInterface):
                 "parameters": schema,
             },
         }
-
-        tries = 0
-        while tries < retries:
-            tries += 1
-            try:
-                resp = self.client.chat.completions.create(
-                    model=self.completion_model,
-                    messages=payload,
-                    tools=[tool_def],
-                    tool_choice={
-                        "type": "function",
-                        "function": {"name": tool_name},
-                    },
-                )
-                msg = resp.choices[0].message
-                if not getattr(msg, "tool_calls", None):
-                    # raise RuntimeError("No tool_call in XAI response")
-                    if tries >= retries:
-                        raise RuntimeError("No tool_call in XAI response")
-                    continue
-                call = msg.tool_calls[0]
-                if call.function.name != tool_name:
-                    if tries >= retries:
-                        raise RuntimeError(
-                            f"Unexpected tool: {call.function.name}",
-                        )
-                    continue
-
-                # The arguments are a JSON string:
-                data = model.model_validate_json(call.function.arguments)
-                return data
-
-            except OpenAIError as e:
-                if tries >= retries:
-                    raise RuntimeError(f"XAI request failed: {e}")
-                print(f"XAI request failed: {e}")
-                continue
+        request["tools"] = [tool_def]
+        request["tool_choice"] = {
+            "type": "function",
+            "function": {"name": tool_name},
+        }
+        return request
+
+    def _parse_tool_call(self, resp: Any, model: Type[T]) -> T:
+        msg = resp.choices[0].message
+        if not getattr(msg, "tool_calls", None):
+            raise _ToolCallError("No tool_call in XAI response")
+        call = msg.tool_calls[0]
+        if call.function.name != model.__name__:
+            raise _ToolCallError(f"Unexpected tool: {call.function.name}")
+        # The arguments are a JSON string:
+        return model.model_validate_json(call.function.arguments)
 
     def get_image(
         self,
@@ -165,3 +229,10 @@ class XAIClient(LLMBaseInterface):
             "XAI does not support embedding generation. "
             "Use OpenAIClient for embedding generation.",
         )
+
+
+def _chunk_text(chunk: Any) -> str:
+    # Some chunks (e.g. Azure content filter results) carry no choices
+    if not chunk.choices:
+        return ""
+    return chunk.choices[0].delta.content or ""
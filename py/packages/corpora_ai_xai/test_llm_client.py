@@ -1,14 +1,16 @@
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from corpora_ai.llm_interface import ChatCompletionTextMessage
+from pydantic import BaseModel
 
 from corpora_ai_xai.llm_client import XAIClient
 
 
 class TestOpenAIClient(unittest.TestCase):
+    @patch("corpora_ai_xai.llm_client.AsyncOpenAI")
     @patch("corpora_ai_xai.llm_client.OpenAI")
-    def setUp(self, MockOpenAI):
+    def setUp(self, MockOpenAI, MockAsyncOpenAI):
         """Set up the OpenAIClient instance and mock OpenAI API client."""
         self.mock_openai_client = MockOpenAI.return_value
         self.client = XAIClient(api_key="test_api_key")
@@ -44,5 +46,63 @@ class TestOpenAIClient(unittest.TestCase):
             self.client.get_text_completion([])
 
 
+class Answer(BaseModel):
+    answer: str
+
+
+class TestXAIClientAsync(unittest.IsolatedAsyncioTestCase):
+    @patch("corpora_ai_xai.llm_client.AsyncOpenAI")
+    @patch("corpora_ai_xai.llm_client.OpenAI")
+    def setUp(self, MockOpenAI, MockAsyncOpenAI):
+        """Set up the XAIClient instance with a mocked async API client."""
+        self.mock_async_client = MockAsyncOpenAI.return_value
+        self.mock_async_client.chat.completions.create = AsyncMock()
+        self.client = XAIClient(api_key="test_api_key")
+
+    async def test_aget_text_completion(self):
+        """Test that aget_text_completion awaits the async client."""
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = "This is a test response."
+        self.mock_async_client.chat.completions.create.return_value = (
+            mock_response
+        )
+
+        response = await self.client.aget_text_completion(
+            [ChatCompletionTextMessage(role="user", text="Tell me a joke.")],
+        )
+
+        self.assertEqual(response, "This is a test response.")
+        self.mock_async_client.chat.completions.create.assert_awaited_once_with(
+            model="grok-3-fast",
+            messages=[{"role": "user", "content": "Tell me a joke."}],
+        )
+
+    async def test_aget_data_completion_retries_missing_tool_call(self):
+        """Test that a response without a tool call is retried."""
+        missing = MagicMock()
+        missing.choices = [MagicMock()]
+        missing.choices[0].message.tool_calls = None
+        found = MagicMock()
+        found.choices = [MagicMock()]
+        call = MagicMock(arguments='{"answer": "42"}')
+        call.name = "Answer"
+        found.choices[0].message.tool_calls = [MagicMock(function=call)]
+        self.mock_async_client.chat.completions.create.side_effect = [
+            missing,
+            found,
+        ]
+
+        response = await self.client.aget_data_completion(
+            [ChatCompletionTextMessage(role="user", text="The answer?")],
+            Answer,
+        )
+
+        self.assertEqual(response, Answer(answer="42"))
+        self.assertEqual(
+            self.mock_async_client.chat.completions.create.await_count, 2,
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
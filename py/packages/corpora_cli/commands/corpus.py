@@ -1,18 +1,39 @@
 import os
+import time
 from pathlib import Path
 from pprint import pformat
+from typing import Annotated, BinaryIO, Dict, List, Optional
 
 import typer
 from corpora_client.exceptions import ApiException
-
-from corpora_cli.config import CONFIG_FILE_PATH, ID_FILE_PATH, save_config
+from corpora_client.models.ingestion_job_response_schema import (
+    IngestionJobResponseSchema,
+)
+
+from corpora_cli.config import (
+    CONFIG_FILE_PATH,
+    ID_FILE_PATH,
+    INDEX_FILE_PATH,
+    UPLOAD_FILE_PATH,
+    save_config,
+)
 from corpora_cli.constants import CORPUS_EXISTS_MESSAGE
 from corpora_cli.context import ContextObject
-from corpora_cli.utils.collectors import get_best_collector
-from corpora_cli.utils.git import get_file_hash
+from corpora_cli.utils import upload
+from corpora_cli.utils.collectors import (
+    CorpusFileCollector,
+    get_best_collector,
+    shard_files,
+)
+from corpora_cli.utils.index import SyncIndex
 
 app = typer.Typer(help="Corpus commands")
 
+# Seconds between ingestion job polls for `sync --wait`
+JOB_POLL_INTERVAL = 1.0
+# Seconds `sync --wait` waits for a job's progress to move before giving up
+JOB_STALL_TIMEOUT = 600.0
+
 
 @app.command()
 def init(ctx: typer.Context):
@@ -30,16 +51,35 @@ def init(ctx: typer.Context):
     c.console.print("Gathering files...")
     files = collector.collect_files()
     c.console.print(f"Collected {len(files)} files.")
-    tarball = collector.create_tarball(files, repo_root).getvalue()
-    c.console.print(f"Tarball created: {len(tarball)} bytes")
-    c.console.print("Uploading corpus tarball to server...")
+    shards = shard_files(files)
 
     try:
-        res = c.corpus_api.create_corpus(
-            name=config["name"],
-            url=config["url"],
-            tarball=tarball,
-        )
+        if len(shards) > 1:
+            res = c.corpus_api.create_corpus(
+                name=config["name"],
+                url=config["url"],
+                upload_ids=send_shards(c, collector, shards, repo_root),
+            )
+        else:
+            tarball = collector.create_tarball(files, repo_root)
+            c.console.print(f"Tarball created: {tarball_size(tarball)} bytes")
+            c.console.print("Uploading corpus tarball to server...")
+            with tarball:
+                upload_id = send_resumable_upload(c, tarball)
+                if upload_id:
+                    res = c.corpus_api.create_corpus(
+                        name=config["name"],
+                        url=config["url"],
+                        upload_ids=[upload_id],
+                    )
+                else:
+                    res = upload.create_corpus(
+                        c.corpus_api,
+                        name=config["name"],
+                        url=config["url"],
+                        tarball=tarball,
+                    )
+        upload.clear_upload_state(UPLOAD_FILE_PATH)
         c.console.print(f"{res.name} created!", style="green")
 
         # Ensure the directory exists
@@ -59,7 +99,24 @@ def init(ctx: typer.Context):
 
 
 @app.command()
-def sync(ctx: typer.Context):
+def sync(
+    ctx: typer.Context,
+    *,
+    wait: Annotated[
+        bool,
+        typer.Option(
+            "--wait",
+            help="Wait until the changes are split and embedded, showing progress.",
+        ),
+    ] = False,
+    timeout: Annotated[
+        float,
+        typer.Option(
+            "--timeout",
+            help="With --wait, give up after this many seconds without progress.",
+        ),
+    ] = JOB_STALL_TIMEOUT,
+):
     """Sync an existing corpus."""
     c: ContextObject = ctx.obj
     repo_root = Path.cwd()
@@ -77,19 +134,18 @@ def sync(ctx: typer.Context):
     corpus_id: str = c.config["id"]
     c.console.print(f"Corpus ID: {corpus_id}")
 
-    # Collect local files and their hashes
+    # Collect local files and their hashes, rehashing only changed files
+    index = SyncIndex.load(INDEX_FILE_PATH)
     collector = get_best_collector(repo_root, c.config)
     local_files = collector.collect_files()
-    local_files_hash_map = {
-        file.relative_to(repo_root): get_file_hash(str(file))
-        for file in local_files
-    }
+    local_files_hash_map = index.get_file_hashes(repo_root, local_files)
     # TODO: debug flag!
     # c.console.print("Local file hash map:")
     # c.console.print(pformat(local_files_hash_map, width=80))
 
     # Fetch remote files and their hashes
-    remote_files = c.corpus_api.get_file_hashes(corpus_id)
+    remote_files = get_remote_file_hashes(c, corpus_id, index)
+    index.save(INDEX_FILE_PATH)
     remote_files_map = {Path(path): hash for path, hash in remote_files.items()}
     # c.console.print("Remote files:")
     # c.console.print(pformat(remote_files_map, width=80))
@@ -116,29 +172,194 @@ def sync(ctx: typer.Context):
         )
         return
 
-    # Create tarball for files to update/add
-    if files_to_update or files_to_delete:
+    # TODO: there is a bug in ninja here, I think
+    # c.console.print("Files to delete:")
+    # c.console.print(pformat(files_to_delete, width=80))
+    delete_files = [str(file) for file in files_to_delete] or None
+    # c.console.print(f"delete_files: {delete_files}")
+
+    # Large change sets go up as several tarballs, ingested in parallel
+    shards = shard_files([repo_root / p for p in files_to_update])
+    if len(shards) > 1:
+        job = c.corpus_api.update_files(
+            corpus_id=corpus_id,
+            delete_files=delete_files,
+            upload_ids=send_shards(c, collector, shards, repo_root),
+        )
+    else:
+        # Create tarball for files to update/add
         c.console.print("Creating tarball for updated/added files... ")
-        tarball = collector.create_tarball(
-            [repo_root / p for p in files_to_update],
-            repo_root,
-        ).getvalue()
-        c.console.print(f"Tarball created: {len(tarball)} bytes")
-
-        # TODO: there is a bug in ninja here, I think
-        # c.console.print("Files to delete:")
-        # c.console.print(pformat(files_to_delete, width=80))
-        delete_files = [str(file) for file in files_to_delete] or None
-        # c.console.print(f"delete_files: {delete_files}")
+        tarball = collector.create_tarball(shards[0], repo_root)
+        c.console.print(f"Tarball created: {tarball_size(tarball)} bytes")
 
         # Upload tarball
         c.console.print("Uploading tarball...")
-        c.corpus_api.update_files(
-            corpus_id=corpus_id,
-            tarball=tarball,
-            delete_files=delete_files,
+        with tarball:
+            upload_id = send_resumable_upload(c, tarball)
+            if upload_id:
+                job = c.corpus_api.update_files(
+                    corpus_id=corpus_id,
+                    delete_files=delete_files,
+                    upload_ids=[upload_id],
+                )
+            else:
+                job = upload.update_files(
+                    c.corpus_api,
+                    corpus_id=corpus_id,
+                    tarball=tarball,
+                    delete_files=delete_files,
+                )
+    upload.clear_upload_state(UPLOAD_FILE_PATH)
+    c.console.print("Update completed!", style="green")
+    if wait:
+        wait_for_job(c, corpus_id, job.id, stall_timeout=timeout)
+
+
+def tarball_size(tarball: BinaryIO) -> int:
+    """Size of a rewound tarball, leaving it rewound."""
+    size = tarball.seek(0, os.SEEK_END)
+    tarball.seek(0)
+    return size
+
+
+def send_resumable_upload(c: ContextObject, tarball: BinaryIO) -> Optional[str]:
+    """Send a large tarball as a resumable upload and return its id, or
+    None if it's small enough to send with the request itself.
+    """
+    size = tarball_size(tarball)
+    if size <= upload.RESUMABLE_UPLOAD_SIZE:
+        return None
+
+    from rich.progress import Progress
+
+    with Progress(console=c.console, transient=True) as progress:
+        task = progress.add_task("Uploading parts...", total=size)
+        return upload.resumable_upload(
+            c.corpus_api,
+            tarball,
+            UPLOAD_FILE_PATH,
+            on_progress=lambda n: progress.advance(task, n),
+        )
+
+
+def send_shards(
+    c: ContextObject,
+    collector: CorpusFileCollector,
+    shards: List[List[Path]],
+    repo_root: Path,
+) -> List[str]:
+    """Tar and upload each shard, several at a time, and return their
+    upload ids.
+    """
+    from rich.progress import Progress
+
+    c.console.print(f"Uploading {len(shards)} tarballs in parallel...")
+    with Progress(console=c.console, transient=True) as progress:
+        task = progress.add_task("Uploading tarballs...", total=len(shards))
+        return upload.upload_shards(
+            c.corpus_api,
+            shards,
+            lambda files: collector.create_tarball(files, repo_root),
+            UPLOAD_FILE_PATH,
+            on_uploaded=lambda: progress.advance(task),
         )
-        c.console.print("Update completed!", style="green")
+
+
+def wait_for_job(
+    c: ContextObject,
+    corpus_id: str,
+    job_id: str,
+    poll_interval: float = JOB_POLL_INTERVAL,
+    stall_timeout: float = JOB_STALL_TIMEOUT,
+) -> IngestionJobResponseSchema:
+    """Poll an ingestion job until it finishes, showing its progress, and
+    print where the time went.
+
+    A job whose counters don't move for `stall_timeout` seconds is taken
+    to be lost, e.g. to a dead worker, and the command exits with an error.
+    """
+    from rich.progress import Progress
+
+    last_progress = None
+    last_progress_at = time.monotonic()
+    with Progress(console=c.console, transient=True) as progress:
+        task = progress.add_task("Unpacking tarballs...", total=None)
+        while True:
+            job = c.corpus_api.get_ingestion_job(corpus_id, job_id)
+            job_progress = (
+                job.shards_done,
+                job.shards_failed,
+                job.files_split,
+                job.files_embedded,
+                job.files_failed,
+                job.vectors_done,
+            )
+            if job_progress != last_progress:
+                last_progress = job_progress
+                last_progress_at = time.monotonic()
+            if job.shards_done < job.shards:
+                progress.update(
+                    task,
+                    description=f"Unpacking tarballs ({job.shards_done}/{job.shards})...",
+                )
+            else:
+                progress.update(
+                    task,
+                    description="Splitting and embedding files...",
+                    total=job.files_updated,
+                    completed=job.files_embedded + job.files_failed,
+                )
+            if job.finished_at:
+                break
+            if time.monotonic() - last_progress_at > stall_timeout:
+                c.console.print(
+                    f"Ingestion job {job_id} made no progress in "
+                    f"{stall_timeout:.0f}s; a worker may have died. "
+                    "Run `corpora corpus sync` again to retry.",
+                    style="red",
+                )
+                raise typer.Exit(code=1)
+            time.sleep(poll_interval)
+
+    elapsed = (job.finished_at - job.created_at).total_seconds()
+    c.console.print(
+        f"Ingested {job.files_updated} changed files "
+        f"({job.files_seen - job.files_updated} unchanged) into "
+        f"{job.splits_created} splits and {job.vectors_done} vectors "
+        f"in {elapsed:.1f}s.",
+        style="green",
+    )
+    c.console.print(
+        f"Worker time: unpacking {job.ingest_seconds:.1f}s, "
+        f"splitting {job.split_seconds:.1f}s, "
+        f"embedding {job.embed_seconds:.1f}s.",
+    )
+    if job.shards_failed or job.files_failed:
+        c.console.print(
+            f"{job.shards_failed} tarballs and {job.files_failed} files failed; "
+            "check the worker logs.",
+            style="red",
+        )
+    return job
+
+
+def get_remote_file_hashes(
+    c: ContextObject, corpus_id: str, index: SyncIndex,
+) -> Dict[str, str]:
+    """Fetch the remote hash map, reusing the cached copy on a 304."""
+    etag = index.get_remote_etag(corpus_id)
+    headers = {"If-None-Match": etag} if etag else None
+    try:
+        res = c.corpus_api.get_file_hashes_with_http_info(
+            corpus_id, _headers=headers,
+        )
+    except ApiException as e:
+        if e.status != 304:
+            raise
+        c.console.print("Remote files unchanged since last sync.")
+        return index.remote_hashes
+    index.set_remote(corpus_id, res.headers.get("ETag"), res.data)
+    return res.data
 
 
 @app.command()
@@ -20,3 +20,23 @@ def remove(ctx: typer.Context, corpus_id: str, file_id: str):
     """Remove a file from a corpus."""
     c: ContextObject = ctx.obj
     c.console.print(f"Removing file {file_id} from corpus {corpus_id}")
+
+
+@app.command()
+def find(
+    ctx: typer.Context,
+    query: str,
+    mode: str = typer.Option(
+        "trigram", help="prefix, substring, or trigram (forgives typos)",
+    ),
+    limit: int = 20,
+):
+    """Find files in the corpus by path."""
+    c: ContextObject = ctx.obj
+    files = c.file_api.search_file_paths(
+        corpus_id=c.config["id"], q=query, mode=mode, limit=limit,
+    )
+    if not files:
+        c.console.print("No matching files.", style="dim")
+    for file in files:
+        c.console.print(file.path)
@@ -1,3 +1,5 @@
+from typing import Annotated, Optional
+
 import typer
 from corpora_client.models.split_vector_search_schema import (
     SplitVectorSearchSchema,
@@ -7,29 +9,55 @@ from corpora_cli.context import ContextObject
 
 app = typer.Typer(help="Split commands")
 
+SEARCH_MODES = ("vector", "hybrid", "lexical", "summary")
+
 
 @app.command()
-def search(ctx: typer.Context, text: str, limit: int = 10):
+def search(
+    ctx: typer.Context,
+    text: str,
+    limit: int = 10,
+    mode: str = typer.Option(
+        "vector",
+        help=(
+            "vector, hybrid (vector and full-text), lexical (full-text only), "
+            "or summary (within the files with the nearest summaries)"
+        ),
+    ),
+    per_corpus_limit: Optional[int] = typer.Option(
+        None, help="At most this many results from any one corpus",
+    ),
+    *,
+    all_corpora: Annotated[
+        bool,
+        typer.Option(
+            "--all-corpora",
+            help="Search every corpus you own, not just this one.",
+        ),
+    ] = False,
+):
     """Search for splits in the corpus with a given text."""
     if not text:
         raise typer.BadParameter("Missing argument 'TEXT'")
     if limit < 1:
         raise typer.BadParameter("Limit must be greater than 0")
+    if mode not in SEARCH_MODES:
+        raise typer.BadParameter(f"Mode must be one of {', '.join(SEARCH_MODES)}")
     c: ContextObject = ctx.obj
     c.console.print("Searching for splits...")
     query = SplitVectorSearchSchema(
         # TODO: how do we really want to identify the corpus?
-        corpus_id=c.config["id"],
+        corpus_id=None if all_corpora else c.config["id"],
+        all_corpora=all_corpora,
         text=text,
         limit=limit,
+        per_corpus_limit=per_corpus_limit,
+        mode=mode,
     )
     res = c.split_api.vector_search(query)
     for split in res:
-        # c.console.print(f"File ID: {split.file_id}")
-        phial = c.file_api.get_file(split.file_id)
-        c.console.print(f"File: {phial.path}")
+        c.console.print(f"File: {split.file_path}")
         c.console.print(f"{split.order} {split.content[:100]}", style="dim")
-        # c.console.print(phial.content[:100], style="dim")
 
 
 @app.command()
@@ -1,22 +1,41 @@
-from io import StringIO
+from datetime import datetime, timedelta, timezone
+from io import BytesIO, StringIO
+from pathlib import Path
 from unittest.mock import Mock, mock_open, patch
 
+import pytest
+import typer
 from corpora_client.exceptions import ApiException
+from corpora_client.models.ingestion_job_response_schema import (
+    IngestionJobResponseSchema,
+)
 from rich.console import Console
 from typer.testing import CliRunner
 
-from corpora_cli.commands.corpus import app
+from corpora_cli.commands.corpus import (
+    JOB_STALL_TIMEOUT,
+    app,
+    get_remote_file_hashes,
+    wait_for_job,
+)
+from corpora_cli.utils.index import SyncIndex
 
 runner = CliRunner()
 
 
+@patch("corpora_cli.commands.corpus.upload.create_corpus")
 @patch("corpora_cli.commands.corpus.save_config")
 @patch("corpora_cli.commands.corpus.Path")
 @patch("corpora_cli.commands.corpus.get_best_collector")
 @patch("corpora_cli.commands.corpus.ContextObject")
 @patch("builtins.open", new_callable=mock_open)
 def test_init_command(
-    mock_open_file, mock_context, mock_get_best_collector, mock_path, mock_save_config,
+    mock_open_file,
+    mock_context,
+    mock_get_best_collector,
+    mock_path,
+    mock_save_config,
+    mock_create_corpus,
 ):
     """Test the `init` command for basic behavior."""
     # Create a real console and capture output in a StringIO buffer
@@ -36,18 +55,15 @@ def test_init_command(
 
     # Mock collector behavior
     mock_collector = mock_get_best_collector.return_value
-    mock_collector.collect_files.return_value = ["file1", "file2"]
-    mock_collector.create_tarball.return_value.getvalue.return_value = (
-        b"tarball_content"
-    )
+    mock_collector.collect_files.return_value = [Path("file1"), Path("file2")]
+    tarball = BytesIO(b"tarball_content")
+    mock_collector.create_tarball.return_value = tarball
 
     # Mock API response
     mock_create_corpus_response = Mock()
     mock_create_corpus_response.id = "12345"
     mock_create_corpus_response.name = "test_repo"
-    mock_context_instance.corpus_api.create_corpus.return_value = (
-        mock_create_corpus_response
-    )
+    mock_create_corpus.return_value = mock_create_corpus_response
 
     # Run the command
     result = runner.invoke(app, ["init"], obj=mock_context_instance)
@@ -60,16 +76,20 @@ def test_init_command(
     assert "Initializing a new corpus..." in output
     assert "Gathering files..." in output
     assert "Collected 2 files." in output
+    assert "Tarball created: 15 bytes" in output
     assert "Uploading corpus tarball to server..." in output
     assert "test_repo created!" in output
     assert "Corpus ID saved to .corpora/.id" in output
 
     # Verify create_corpus was called with correct parameters
-    mock_context_instance.corpus_api.create_corpus.assert_called_once_with(
+    mock_create_corpus.assert_called_once_with(
+        mock_context_instance.corpus_api,
         name="test_repo",
         url="https://github.com/test/repo",
-        tarball=b"tarball_content",
+        tarball=tarball,
     )
+    # The tarball is closed once uploaded
+    assert tarball.closed
 
     # Verify config file was saved once with the correct data
     assert mock_save_config.call_count == 1
@@ -85,6 +105,50 @@ def test_init_command(
     mock_open_file.return_value.write.assert_called_once_with("12345")
 
 
+@patch("corpora_cli.commands.corpus.upload.upload_shards")
+@patch("corpora_cli.commands.corpus.shard_files")
+@patch("corpora_cli.commands.corpus.save_config")
+@patch("corpora_cli.commands.corpus.get_best_collector")
+@patch("corpora_cli.commands.corpus.ContextObject")
+@patch("builtins.open", new_callable=mock_open)
+def test_init_command_shards(
+    mock_open_file,
+    mock_context,
+    mock_get_best_collector,
+    mock_save_config,
+    mock_shard_files,
+    mock_upload_shards,
+):
+    """Test that `init` uploads a large repo as several tarballs."""
+    console_output = StringIO()
+    mock_context_instance = mock_context.return_value
+    mock_context_instance.console = Console(file=console_output)
+    mock_context_instance.config = {
+        "name": "test_repo",
+        "url": "https://github.com/test/repo",
+    }
+    files = [Path("file1"), Path("file2")]
+    mock_get_best_collector.return_value.collect_files.return_value = files
+    mock_shard_files.return_value = [[files[0]], [files[1]]]
+    mock_upload_shards.return_value = ["upload-1", "upload-2"]
+    response = mock_context_instance.corpus_api.create_corpus.return_value
+    response.id = "12345"
+    response.name = "test_repo"
+
+    result = runner.invoke(app, ["init"], obj=mock_context_instance)
+
+    assert result.exit_code == 0
+    assert "Uploading 2 tarballs in parallel..." in console_output.getvalue()
+    shards = mock_upload_shards.call_args.args[1]
+    assert shards == [[files[0]], [files[1]]]
+    mock_context_instance.corpus_api.create_corpus.assert_called_once_with(
+        name="test_repo",
+        url="https://github.com/test/repo",
+        upload_ids=["upload-1", "upload-2"],
+    )
+    mock_get_best_collector.return_value.create_tarball.assert_not_called()
+
+
 @patch("corpora_cli.commands.corpus.ContextObject")
 def test_delete_command(mock_context):
     """Test the `delete` command for basic deletion."""
@@ -170,3 +234,113 @@ def test_print_command(mock_context):
     assert "This is a log message." in output
     assert "Panel Title" in output
     assert "This is inside a panel." in output
+
+
+def test_get_remote_file_hashes_uses_cache_on_304():
+    """A 304 reuses the cached remote hashes; a 200 refreshes the cache."""
+    c = Mock()
+    c.console = Console(file=StringIO())
+    index = SyncIndex()
+    index.set_remote("corpus-1", '"v1"', {"a.txt": "abc"})
+
+    c.corpus_api.get_file_hashes_with_http_info.side_effect = ApiException(
+        status=304,
+    )
+    assert get_remote_file_hashes(c, "corpus-1", index) == {"a.txt": "abc"}
+    c.corpus_api.get_file_hashes_with_http_info.assert_called_once_with(
+        "corpus-1", _headers={"If-None-Match": '"v1"'},
+    )
+
+    c.corpus_api.get_file_hashes_with_http_info.side_effect = None
+    c.corpus_api.get_file_hashes_with_http_info.return_value = Mock(
+        data={"a.txt": "def"}, headers={"ETag": '"v2"'},
+    )
+    assert get_remote_file_hashes(c, "corpus-1", index) == {"a.txt": "def"}
+    assert index.get_remote_etag("corpus-1") == '"v2"'
+    # Another corpus never sends this corpus's ETag
+    assert index.get_remote_etag("corpus-2") is None
+
+
+def test_wait_for_job_polls_until_finished():
+    """`sync --wait` polls the job and reports where the time went."""
+    output = StringIO()
+    c = Mock()
+    c.console = Console(file=output)
+    created_at = datetime(2024, 11, 1, 12, 0, tzinfo=timezone.utc)
+
+    def job(**progress):
+        fields = {
+            "id": "job-1",
+            "corpus_id": "corpus-1",
+            "shards": 2,
+            "shards_done": 2,
+            "shards_failed": 0,
+            "files_seen": 5,
+            "files_updated": 3,
+            "files_split": 3,
+            "splits_created": 7,
+            "files_embedded": 3,
+            "vectors_done": 7,
+            "files_failed": 0,
+            "ingest_seconds": 0.5,
+            "split_seconds": 1.0,
+            "embed_seconds": 4.0,
+            "created_at": created_at,
+        }
+        return IngestionJobResponseSchema(**{**fields, **progress})
+
+    c.corpus_api.get_ingestion_job.side_effect = [
+        job(shards_done=1, files_embedded=0, finished_at=None),
+        job(files_embedded=1, finished_at=None),
+        job(finished_at=created_at + timedelta(seconds=6)),
+    ]
+
+    with patch("corpora_cli.commands.corpus.time.sleep") as sleep:
+        result = wait_for_job(c, "corpus-1", "job-1")
+
+    assert result.files_embedded == 3
+    assert sleep.call_count == 2
+    c.corpus_api.get_ingestion_job.assert_called_with("corpus-1", "job-1")
+    text = output.getvalue()
+    assert "Ingested 3 changed files (2 unchanged) into 7 splits and 7 vectors in 6.0s" in text
+    assert "unpacking 0.5s, splitting 1.0s, embedding 4.0s" in text
+    assert "failed" not in text
+
+
+def test_wait_for_job_gives_up_when_stalled():
+    """A job whose counters stop moving, e.g. after its worker died, ends
+    `sync --wait` with an error instead of polling forever.
+    """
+    output = StringIO()
+    c = Mock()
+    c.console = Console(file=output)
+    c.corpus_api.get_ingestion_job.return_value = IngestionJobResponseSchema(
+        id="job-1",
+        corpus_id="corpus-1",
+        shards=1,
+        shards_done=1,
+        shards_failed=0,
+        files_seen=5,
+        files_updated=3,
+        files_split=3,
+        splits_created=7,
+        files_embedded=1,
+        vectors_done=2,
+        files_failed=0,
+        ingest_seconds=0.5,
+        split_seconds=1.0,
+        embed_seconds=1.0,
+        created_at=datetime(2024, 11, 1, 12, 0, tzinfo=timezone.utc),
+        finished_at=None,
+    )
+    clock = iter(range(0, 10 * int(JOB_STALL_TIMEOUT), 100))
+
+    with patch("corpora_cli.commands.corpus.time.sleep") as sleep, patch(
+        "corpora_cli.commands.corpus.time.monotonic", lambda: next(clock),
+    ):
+        with pytest.raises(typer.Exit):
+            wait_for_job(c, "corpus-1", "job-1")
+
+    # Polled every 100s of the clock until the timeout passed
+    assert sleep.call_count == JOB_STALL_TIMEOUT // 100
+    assert "made no progress in 600s" in output.getvalue()
@@ -1,5 +1,5 @@
 from io import StringIO
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from rich.console import Console
 from typer.testing import CliRunner
@@ -47,3 +47,28 @@ def test_remove_command(mock_context):
 
     assert result.exit_code == 0
     assert f"Removing file {file_id} from corpus {corpus_id}" in output
+
+
+@patch("corpora_cli.commands.file.ContextObject")
+def test_find_command(mock_context):
+    """Test the `find` command for fuzzy path search."""
+    console_output = StringIO()
+    real_console = Console(file=console_output)
+
+    mock_context_instance = mock_context.return_value
+    mock_context_instance.console = real_console
+    mock_context_instance.config = {"id": "test_corpus_id"}
+    mock_context_instance.file_api.search_file_paths.return_value = [
+        MagicMock(path="py/corpora/models.py"),
+    ]
+
+    result = runner.invoke(
+        app, ["find", "modles", "--mode", "trigram"], obj=mock_context_instance,
+    )
+    output = console_output.getvalue()
+
+    assert result.exit_code == 0
+    assert "py/corpora/models.py" in output
+    mock_context_instance.file_api.search_file_paths.assert_called_once_with(
+        corpus_id="test_corpus_id", q="modles", mode="trigram", limit=20,
+    )
@@ -21,12 +21,16 @@ def test_search_command(mock_context):
 
     # Mock APIs
     mock_context_instance.split_api.vector_search.return_value = [
-        MagicMock(file_id="file123", order=1, content="This is the first split..."),
-        MagicMock(file_id="file456", order=2, content="This is the second split..."),
-    ]
-    mock_context_instance.file_api.get_file.side_effect = [
-        MagicMock(path="/path/to/file1"),
-        MagicMock(path="/path/to/file2"),
+        MagicMock(
+            file_path="/path/to/file1",
+            order=1,
+            content="This is the first split...",
+        ),
+        MagicMock(
+            file_path="/path/to/file2",
+            order=2,
+            content="This is the second split...",
+        ),
     ]
 
     # Run the command
@@ -49,6 +53,36 @@ def test_search_command(mock_context):
     assert "1 This is the first split..." in output
     assert "File: /path/to/file2" in output
     assert "2 This is the second split..." in output
+    mock_context_instance.file_api.get_file.assert_not_called()
+    query = mock_context_instance.split_api.vector_search.call_args.args[0]
+    assert query.mode == "vector"
+
+    result = runner.invoke(
+        app,
+        ["search", "example search", "--mode", "lexical"],
+        obj=mock_context_instance,
+    )
+    assert result.exit_code == 0
+    query = mock_context_instance.split_api.vector_search.call_args.args[0]
+    assert query.mode == "lexical"
+
+    result = runner.invoke(
+        app,
+        ["search", "example search", "--mode", "fuzzy"],
+        obj=mock_context_instance,
+    )
+    assert result.exit_code != 0
+
+    result = runner.invoke(
+        app,
+        ["search", "example search", "--all-corpora", "--per-corpus-limit", "2"],
+        obj=mock_context_instance,
+    )
+    assert result.exit_code == 0
+    query = mock_context_instance.split_api.vector_search.call_args.args[0]
+    assert query.all_corpora
+    assert query.corpus_id is None
+    assert query.per_corpus_limit == 2
 
 
 @patch("corpora_cli.commands.split.ContextObject")
@@ -6,6 +6,7 @@ from corpora_client.models.message_schema import MessageSchema
 from prompt_toolkit.shortcuts import PromptSession
 
 from corpora_cli.context import ContextObject
+from corpora_cli.utils.stream import iter_text_stream
 
 app = typer.Typer(help="Interactive issue creation CLI")
 
@@ -73,7 +74,7 @@ def file(ctx: typer.Context, path: str):
         with open(f".corpora/{ext}/DIRECTIONS.md") as f:
             directions = f.read() if f else ""
 
-        revision = c.workon_api.file(
+        response = c.workon_api.file_stream_without_preload_content(
             CorpusFileChatSchema(
                 messages=messages,
                 corpus_id=c.config["id"],
@@ -84,7 +85,15 @@ def file(ctx: typer.Context, path: str):
                 directions=directions,
             ),
         )
-        c.console.print(f"{revision}", style="dim")
+        # Print the revision as it is generated
+        parts: List[str] = []
+        for text in iter_text_stream(response):
+            c.console.print(
+                text, end="", style="dim", markup=False, highlight=False,
+            )
+            parts.append(text)
+        c.console.print()
+        revision = "".join(parts)
         c.console.print(f"{path}", style="dim magenta")
         messages.append(MessageSchema(role="assistant", text=revision))
 
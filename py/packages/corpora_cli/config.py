@@ -10,6 +10,8 @@ from corpora_cli.utils.git import get_git_remote_url, get_git_repo_name
 
 CONFIG_FILE_PATH = ".corpora.yaml"
 ID_FILE_PATH = ".corpora/.id"
+INDEX_FILE_PATH = ".corpora/index"
+UPLOAD_FILE_PATH = ".corpora/upload"
 ENV_VAR_PATTERN = re.compile(r"\$\{(\w+)\}")  # Matches ${VAR_NAME}
 
 
@@ -1,9 +1,20 @@
-import io
+import gzip
+import heapq
+import math
 import shutil
 import subprocess
 import tarfile
+import tempfile
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import BinaryIO, Dict, List, Optional
+
+# Tarballs bigger than this are written to disk instead of memory
+TARBALL_SPOOL_SIZE = 8 * 1024 * 1024
+# Change sets bigger than this, in bytes or in files, are split into
+# shards that are tarred, uploaded and ingested in parallel
+SHARD_SIZE = 16 * 1024 * 1024
+SHARD_FILES = 1000
+MAX_SHARDS = 8
 
 
 class CorpusFileCollector:
@@ -14,11 +25,18 @@ class CorpusFileCollector:
     def collect_files(self) -> List[Path]:
         raise NotImplementedError("Must implement collect_files method")
 
-    def create_tarball(self, files: List[Path], repo_root: Path) -> io.BytesIO:
-        """Creates a tar.gz archive in memory for a list of files.
+    def create_tarball(self, files: List[Path], repo_root: Path) -> BinaryIO:
+        """Creates a tar.gz archive for a list of files, rewound and ready
+        to upload. Small archives stay in memory, larger ones spill to a
+        temporary file. Close it when done.
+
+        The gzip header carries no timestamp, so the same files give the
+        same bytes, which lets an interrupted resumable upload pick up
+        where it left off.
         """
-        tar_buffer = io.BytesIO()
-        with tarfile.open(fileobj=tar_buffer, mode="w:gz") as tar:
+        tar_buffer = tempfile.SpooledTemporaryFile(max_size=TARBALL_SPOOL_SIZE)
+        with gzip.GzipFile(fileobj=tar_buffer, mode="wb", mtime=0) as gz, \
+                tarfile.open(fileobj=gz, mode="w") as tar:
             for file_path in files:
                 tar.add(file_path, arcname=file_path.relative_to(repo_root))
         tar_buffer.seek(0)
@@ -86,3 +104,42 @@ def get_best_collector(
     raise ValueError(
         "Unable to determine an appropriate file collector. Please provide a valid `repo_root` for a Git repository or a `config`.",
     )
+
+
+def _file_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except FileNotFoundError:
+        return 0
+
+
+def shard_files(
+    files: List[Path],
+    size_per_shard: int = SHARD_SIZE,
+    files_per_shard: int = SHARD_FILES,
+    max_shards: int = MAX_SHARDS,
+) -> List[List[Path]]:
+    """Split files into shards of about `size_per_shard` bytes or
+    `files_per_shard` files, whichever makes more, up to `max_shards`.
+
+    Shards are balanced by size, largest files first, each going to the
+    smallest shard so far. The same files always give the same shards.
+    """
+    sizes = {file: _file_size(file) for file in files}
+    count = max(
+        1,
+        math.ceil(sum(sizes.values()) / size_per_shard),
+        math.ceil(len(files) / files_per_shard),
+    )
+    count = min(count, max_shards, len(files))
+    if count <= 1:
+        return [files]
+
+    shards: List[List[Path]] = [[] for _ in range(count)]
+    heap = [(0, i) for i in range(count)]
+    for file in sorted(files, key=lambda f: (-sizes[f], f)):
+        size, i = heapq.heappop(heap)
+        shards[i].append(file)
+        heapq.heappush(heap, (size + sizes[file], i))
+    # Empty files can leave a shard with nothing in it
+    return [shard for shard in shards if shard]
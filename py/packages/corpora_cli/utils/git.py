@@ -1,4 +1,8 @@
+import hashlib
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
 
 
 def run_command(command: list) -> str:
@@ -21,6 +25,84 @@ def get_file_hash(path: str) -> str:
     return result.strip()
 
 
+def compute_blob_hash(path: Path) -> str:
+    """Hash a file the way git (and the server's `compute_checksum`) does:
+    sha1 of `blob <size>\\0` followed by the raw bytes.
+    """
+    content = path.read_bytes()
+    header = f"blob {len(content)}\0".encode()
+    return hashlib.sha1(header + content).hexdigest()
+
+
+def _ls_files(repo_root: Path, *args: str) -> List[str]:
+    result = subprocess.run(
+        ["git", "ls-files", "-z", *args],
+        cwd=repo_root,
+        capture_output=True,
+        check=True,
+    )
+    return [
+        entry.decode("utf-8", "surrogateescape")
+        for entry in result.stdout.split(b"\0")
+        if entry
+    ]
+
+
+def get_index_hashes(repo_root: Path) -> Dict[Path, str]:
+    """Blob hashes of files whose working tree copy matches the index.
+
+    Two `git ls-files` calls regardless of repo size: `-s` for the staged
+    blob hashes and `-m` to drop files modified since they were staged.
+    """
+    modified = set(_ls_files(repo_root, "-m"))
+    hashes = {}
+    for entry in _ls_files(repo_root, "-s"):
+        # "<mode> <sha> <stage>\t<path>"
+        meta, path = entry.split("\t", 1)
+        mode, sha, _ = meta.split(" ")
+        # Skip submodules (gitlinks), they aren't files
+        if mode != "160000" and path not in modified:
+            hashes[Path(path)] = sha
+    return hashes
+
+
+def get_file_hashes(
+    repo_root: Path,
+    files: Iterable[Path],
+    max_workers: Optional[int] = None,
+) -> Dict[Path, str]:
+    """Map each file's path (relative to `repo_root`) to its blob hash.
+
+    Unmodified tracked files take their hash from the git index. The rest
+    (modified or untracked) are hashed in a thread pool. Files that no
+    longer exist on disk are left out.
+    """
+    index_hashes = get_index_hashes(repo_root)
+    hashes = {}
+    to_hash = []
+    for file in files:
+        path = file.relative_to(repo_root)
+        if path in index_hashes:
+            hashes[path] = index_hashes[path]
+        else:
+            to_hash.append(path)
+
+    def hash_one(path: Path) -> Optional[str]:
+        full_path = repo_root / path
+        if not full_path.is_file():
+            return None
+        return compute_blob_hash(full_path)
+
+    if to_hash:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            hashes.update(
+                (path, sha)
+                for path, sha in zip(to_hash, pool.map(hash_one, to_hash))
+                if sha is not None
+            )
+    return hashes
+
+
 def get_git_remote_url() -> str:
     """Retrieve the main remote URL of the current Git repository.
     """
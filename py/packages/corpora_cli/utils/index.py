@@ -0,0 +1,128 @@
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from corpora_cli.utils.git import get_file_hashes
+
+INDEX_VERSION = 1
+# Files modified this close to a scan may have changed again within the
+# filesystem's timestamp granularity without their stat changing (git's
+# "racy clean" problem), so they're rehashed on the next scan
+RACY_WINDOW_NS = 2_000_000_000
+
+
+class SyncIndex:
+    """Local cache for `corpora corpus sync`, kept in `.corpora/index`.
+
+    Like git's index, it maps each file's stat `(mtime_ns, size, inode)`
+    to its blob hash, so only files whose stat changed are rehashed. It
+    also keeps the last remote hash map with its ETag, so the server can
+    answer 304 when nothing changed there.
+    """
+
+    def __init__(
+        self,
+        files: Optional[Dict[str, List]] = None,
+        scanned_ns: int = 0,
+        corpus_id: Optional[str] = None,
+        remote_etag: Optional[str] = None,
+        remote_hashes: Optional[Dict[str, str]] = None,
+    ):
+        # path -> [mtime_ns, size, inode, hash]
+        self.files = files or {}
+        self.scanned_ns = scanned_ns
+        self.corpus_id = corpus_id
+        self.remote_etag = remote_etag
+        self.remote_hashes = remote_hashes or {}
+
+    @classmethod
+    def load(cls, path: str) -> "SyncIndex":
+        """Load the index, or start empty if it's missing or unreadable."""
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return cls()
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return cls()
+        return cls(
+            files=data.get("files"),
+            scanned_ns=data.get("scanned_ns", 0),
+            corpus_id=data.get("corpus_id"),
+            remote_etag=data.get("remote_etag"),
+            remote_hashes=data.get("remote_hashes"),
+        )
+
+    def save(self, path: str) -> None:
+        """Write the index atomically, so an interrupted sync can't leave
+        a truncated file behind.
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(
+                {
+                    "version": INDEX_VERSION,
+                    "scanned_ns": self.scanned_ns,
+                    "files": self.files,
+                    "corpus_id": self.corpus_id,
+                    "remote_etag": self.remote_etag,
+                    "remote_hashes": self.remote_hashes,
+                },
+                f,
+            )
+        os.replace(tmp_path, path)
+
+    def get_file_hashes(
+        self,
+        repo_root: Path,
+        files: Iterable[Path],
+    ) -> Dict[Path, str]:
+        """Map each file's path (relative to `repo_root`) to its blob hash,
+        rehashing only files whose stat differs from the cached entry.
+
+        Entries for files not in `files` are dropped.
+        """
+        racy_ns = self.scanned_ns - RACY_WINDOW_NS
+        self.scanned_ns = time.time_ns()
+        hashes = {}
+        stats = {}
+        stale = []
+        for file in files:
+            path = file.relative_to(repo_root)
+            try:
+                st = file.stat()
+            except FileNotFoundError:
+                continue
+            stat = [st.st_mtime_ns, st.st_size, st.st_ino]
+            stats[path] = stat
+            entry = self.files.get(path.as_posix())
+            if entry is not None and entry[:3] == stat and st.st_mtime_ns < racy_ns:
+                hashes[path] = entry[3]
+            else:
+                stale.append(file)
+
+        if stale:
+            hashes.update(get_file_hashes(repo_root, stale))
+
+        self.files = {
+            path.as_posix(): [*stats[path], sha]
+            for path, sha in hashes.items()
+        }
+        return hashes
+
+    def get_remote_etag(self, corpus_id: str) -> Optional[str]:
+        """The cached remote ETag, if it belongs to this corpus."""
+        return self.remote_etag if self.corpus_id == corpus_id else None
+
+    def set_remote(
+        self,
+        corpus_id: str,
+        etag: Optional[str],
+        hashes: Dict[str, str],
+    ) -> None:
+        self.corpus_id = corpus_id
+        self.remote_etag = etag
+        self.remote_hashes = hashes
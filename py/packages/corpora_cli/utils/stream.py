@@ -0,0 +1,27 @@
+import codecs
+from typing import Iterator
+
+import urllib3
+from corpora_client.exceptions import ApiException
+
+
+def iter_text_stream(
+    response: urllib3.HTTPResponse,
+    chunk_size: int = 1024,
+) -> Iterator[str]:
+    """Yield the text of a streamed plain-text response as it arrives.
+
+    Takes the raw response of a `*_without_preload_content` API call.
+    """
+    try:
+        if response.status >= 400:
+            raise ApiException(http_resp=response)
+        # A multi-byte character can be split across chunks
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        for chunk in response.stream(chunk_size, decode_content=True):
+            if text := decoder.decode(chunk):
+                yield text
+        if text := decoder.decode(b"", final=True):
+            yield text
+    finally:
+        response.release_conn()
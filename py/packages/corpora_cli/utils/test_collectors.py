@@ -1,5 +1,6 @@
-import io
 import tarfile
+import tempfile
+import time
 import unittest
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -11,6 +12,7 @@ from corpora_cli.utils.collectors import (
     get_best_collector,
     is_git_installed,
     is_git_repository,
+    shard_files,
 )
 
 
@@ -30,14 +32,13 @@ class TestCorpusFileCollector(unittest.TestCase):
         "tarfile.TarFile.add",
     )  # Mock tarfile.TarFile.add to simulate adding files without real I/O
     def test_create_tarball(self, mock_add, mock_exists):
-        """Test that create_tarball creates a tar.gz archive in memory without needing actual files."""
+        """Test that create_tarball creates a tar.gz archive without needing actual files."""
         # Create a CorpusFileCollector instance and call create_tarball
         collector = CorpusFileCollector()
         tar_buffer = collector.create_tarball(self.files, self.repo_root)
 
-        # Check that tar_buffer is a valid tar file
-        self.assertIsInstance(tar_buffer, io.BytesIO)
-        tar_buffer.seek(0)
+        # Check that tar_buffer is a rewound file object
+        self.assertEqual(tar_buffer.tell(), 0)
 
         # Patch the TarFile.open context to mock entries in the tarball
         with tarfile.open(fileobj=tar_buffer, mode="r:gz") as tar:
@@ -56,6 +57,55 @@ class TestCorpusFileCollector(unittest.TestCase):
         mock_add.assert_any_call(self.files[1], arcname=Path("file2.txt"))
         self.assertEqual(mock_add.call_count, 2)
 
+    def test_create_tarball_is_reproducible(self):
+        collector = CorpusFileCollector()
+        with tempfile.TemporaryDirectory() as tmp:
+            repo_root = Path(tmp)
+            files = [repo_root / "a.txt", repo_root / "b.txt"]
+            for file in files:
+                file.write_text(file.name)
+
+            with collector.create_tarball(files, repo_root) as first:
+                time.sleep(1.1)  # gzip timestamps have 1s resolution
+                with collector.create_tarball(files, repo_root) as second:
+                    self.assertEqual(first.read(), second.read())
+
+
+class TestShardFiles(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+
+    def make_files(self, sizes):
+        files = []
+        for i, size in enumerate(sizes):
+            path = self.root / f"file{i}.txt"
+            path.write_bytes(b"x" * size)
+            files.append(path)
+        return files
+
+    def test_small_change_set_is_one_shard(self):
+        files = self.make_files([10, 20])
+        self.assertEqual(shard_files(files, size_per_shard=100), [files])
+
+    def test_balances_shards_by_size(self):
+        files = self.make_files([60, 50, 40, 30, 20])
+
+        shards = shard_files(files, size_per_shard=100)
+
+        self.assertEqual(len(shards), 2)
+        self.assertCountEqual(sum(shards, []), files)
+        totals = sorted(sum(f.stat().st_size for f in shard) for shard in shards)
+        self.assertEqual(totals, [90, 110])
+        # Deterministic, so a resumed sync builds the same tarballs
+        self.assertEqual(shard_files(list(reversed(files)), size_per_shard=100), shards)
+
+    def test_shards_by_file_count(self):
+        files = self.make_files([1] * 25)
+        shards = shard_files(files, files_per_shard=10, max_shards=2)
+        self.assertEqual([len(shard) for shard in shards], [13, 12])
+
 
 class TestGitCorpusFileCollector(unittest.TestCase):
     def setUp(self):
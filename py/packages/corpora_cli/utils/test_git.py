@@ -0,0 +1,95 @@
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+
+from corpora_cli.utils.git import (
+    compute_blob_hash,
+    get_file_hash,
+    get_file_hashes,
+)
+
+
+def git(repo_root: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", *args],
+        cwd=repo_root,
+        check=True,
+        capture_output=True,
+    )
+
+
+class TestGetFileHashes(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.repo_root = Path(self.tmp.name)
+        git(self.repo_root, "init", "-q")
+        (self.repo_root / "clean.txt").write_text("clean\n")
+        (self.repo_root / "modified.txt").write_text("before\n")
+        (self.repo_root / "deleted.txt").write_text("gone soon\n")
+        (self.repo_root / "sub").mkdir()
+        (self.repo_root / "sub" / "nested é.txt").write_bytes(b"\x00\xffbin")
+        git(self.repo_root, "add", ".")
+        (self.repo_root / "modified.txt").write_text("after\n")
+        (self.repo_root / "deleted.txt").unlink()
+        (self.repo_root / "untracked.txt").write_text("new\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_compute_blob_hash_matches_git(self):
+        path = self.repo_root / "sub" / "nested é.txt"
+        self.assertEqual(compute_blob_hash(path), get_file_hash(str(path)))
+
+    def test_matches_git_hash_object(self):
+        files = [
+            self.repo_root / name
+            for name in (
+                "clean.txt",
+                "modified.txt",
+                "deleted.txt",
+                "sub/nested é.txt",
+                "untracked.txt",
+            )
+        ]
+        hashes = get_file_hashes(self.repo_root, files)
+
+        expected = {
+            file.relative_to(self.repo_root): get_file_hash(str(file))
+            for file in files
+            if file.exists()
+        }
+        self.assertEqual(hashes, expected)
+        # Deleted files are left out rather than failing the sync
+        self.assertNotIn(Path("deleted.txt"), hashes)
+
+
+class TestGetFileHashesMatchesPerFile(unittest.TestCase):
+    """The batched index lookup agrees with one `git hash-object` per file."""
+
+    FILE_COUNT = 50
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.repo_root = Path(self.tmp.name)
+        git(self.repo_root, "init", "-q")
+        self.files = []
+        for i in range(self.FILE_COUNT):
+            path = self.repo_root / f"file_{i}.txt"
+            path.write_text(f"content {i}\n" * 50)
+            self.files.append(path)
+        git(self.repo_root, "add", ".")
+        # A few dirty files so the thread pool path is exercised too
+        for path in self.files[:10]:
+            path.write_text("changed\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_batched_matches_per_file(self):
+        per_file = {
+            file.relative_to(self.repo_root): get_file_hash(str(file))
+            for file in self.files
+        }
+
+        self.assertEqual(get_file_hashes(self.repo_root, self.files), per_file)
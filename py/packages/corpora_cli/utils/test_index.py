@@ -0,0 +1,87 @@
+import os
+import subprocess
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from corpora_cli.utils import git
+from corpora_cli.utils.git import compute_blob_hash
+from corpora_cli.utils.index import RACY_WINDOW_NS, SyncIndex
+
+
+class TestSyncIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.repo_root = Path(self.tmp.name)
+        subprocess.run(
+            ["git", "init", "-q"], cwd=self.repo_root, check=True,
+        )
+        self.index_path = str(self.repo_root / ".corpora" / "index")
+        self.files = []
+        for name in ("a.txt", "b.txt"):
+            path = self.repo_root / name
+            path.write_text(name)
+            self.files.append(path)
+            # Old enough that the stat can be trusted
+            os.utime(path, ns=(0, 1_000_000_000))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def scan(self):
+        index = SyncIndex.load(self.index_path)
+        with patch(
+            "corpora_cli.utils.index.get_file_hashes",
+            wraps=git.get_file_hashes,
+        ) as hasher:
+            hashes = index.get_file_hashes(self.repo_root, self.files)
+        index.save(self.index_path)
+        rehashed = (
+            sorted(f.name for f in hasher.call_args.args[1])
+            if hasher.called else []
+        )
+        return hashes, rehashed
+
+    def test_only_changed_files_are_rehashed(self):
+        hashes, rehashed = self.scan()
+        self.assertEqual(rehashed, ["a.txt", "b.txt"])
+        self.assertEqual(
+            hashes[Path("a.txt")], compute_blob_hash(self.files[0]),
+        )
+
+        _, rehashed = self.scan()
+        self.assertEqual(rehashed, [])
+
+        self.files[1].write_text("changed")
+        os.utime(self.files[1], ns=(0, 2_000_000_000))
+        hashes, rehashed = self.scan()
+        self.assertEqual(rehashed, ["b.txt"])
+        self.assertEqual(
+            hashes[Path("b.txt")], compute_blob_hash(self.files[1]),
+        )
+
+    def test_recently_modified_files_are_rehashed(self):
+        # Modified just before the scan, so it could change again without
+        # its stat changing
+        os.utime(self.files[0], ns=(0, time.time_ns() - RACY_WINDOW_NS // 2))
+        self.scan()
+        _, rehashed = self.scan()
+        self.assertEqual(rehashed, ["a.txt"])
+
+    def test_removed_files_are_dropped(self):
+        self.scan()
+        self.files[1].unlink()
+        hashes, _ = self.scan()
+        self.assertEqual(list(hashes), [Path("a.txt")])
+        self.assertEqual(
+            list(SyncIndex.load(self.index_path).files), ["a.txt"],
+        )
+
+    def test_load_missing_or_corrupt(self):
+        self.assertEqual(SyncIndex.load(self.index_path).files, {})
+        os.makedirs(os.path.dirname(self.index_path))
+        with open(self.index_path, "w") as f:
+            f.write("{not json")
+        self.assertEqual(SyncIndex.load(self.index_path).files, {})
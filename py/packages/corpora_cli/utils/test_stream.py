@@ -0,0 +1,35 @@
+import io
+import unittest
+
+import urllib3
+from corpora_client.exceptions import ApiException
+
+from corpora_cli.utils.stream import iter_text_stream
+
+
+def make_response(body: bytes, status: int = 200) -> urllib3.HTTPResponse:
+    return urllib3.HTTPResponse(
+        body=io.BytesIO(body),
+        status=status,
+        preload_content=False,
+    )
+
+
+class TestIterTextStream(unittest.TestCase):
+    def test_yields_text_incrementally(self):
+        response = make_response(b"Hello, world")
+        chunks = list(iter_text_stream(response, chunk_size=5))
+        self.assertEqual(chunks, ["Hello", ", wor", "ld"])
+
+    def test_multibyte_character_split_across_chunks(self):
+        # "é" is two bytes, so the first chunk ends mid-character
+        response = make_response("aé".encode())
+        chunks = list(iter_text_stream(response, chunk_size=2))
+        self.assertEqual("".join(chunks), "aé")
+        self.assertEqual(chunks[0], "a")
+
+    def test_error_status_raises(self):
+        response = make_response(b'{"detail": "Not Found"}', status=404)
+        with self.assertRaises(ApiException) as context:
+            list(iter_text_stream(response))
+        self.assertEqual(context.exception.status, 404)
@@ -0,0 +1,276 @@
+import hashlib
+import io
+import json
+import os
+import tempfile
+import unittest
+from email.parser import BytesParser
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import urllib3
+from corpora_client import ApiClient, Configuration, CorpusApi
+from corpora_client.exceptions import ApiException
+from corpora_client.models.upload_part_response_schema import (
+    UploadPartResponseSchema,
+)
+from corpora_client.models.upload_response_schema import UploadResponseSchema
+
+from corpora_cli.utils.upload import (
+    load_upload_state,
+    multipart_body,
+    resumable_upload,
+    update_files,
+    upload_shards,
+)
+
+
+def parse_multipart(boundary: str, body: bytes):
+    message = BytesParser().parsebytes(
+        f"Content-Type: multipart/form-data; boundary={boundary}\r\n\r\n".encode()
+        + body,
+    )
+    return {
+        part.get_param("name", header="content-disposition"): part.get_payload(
+            decode=True,
+        )
+        for part in message.get_payload()
+    }
+
+
+class TestMultipartBody(unittest.TestCase):
+    def test_streams_file_in_chunks(self):
+        content = bytes(range(256)) * 10
+        body, length = multipart_body(
+            [("name", "repo"), ("delete_files", "a.txt")],
+            "tarball",
+            io.BytesIO(content),
+            "b0undary",
+            chunk_size=1000,
+        )
+        chunks = list(body)
+        # Fields and file header, three file chunks, closing boundary
+        self.assertEqual(len(chunks), 5)
+        self.assertEqual(length, len(b"".join(chunks)))
+        self.assertEqual(
+            parse_multipart("b0undary", b"".join(chunks)),
+            {"name": b"repo", "delete_files": b"a.txt", "tarball": content},
+        )
+
+
+class TestUpdateFiles(unittest.TestCase):
+    def setUp(self):
+        config = Configuration(host="http://corpora.test")
+        config.access_token = "token"
+        self.api = CorpusApi(ApiClient(config))
+
+    def respond(self, status: int, body: bytes):
+        return patch.object(
+            self.api.api_client.rest_client.pool_manager,
+            "request",
+            return_value=urllib3.HTTPResponse(
+                body=io.BytesIO(body),
+                status=status,
+                headers={"Content-Type": "application/json"},
+                preload_content=False,
+            ),
+        )
+
+    def test_streams_multipart(self):
+        job = {
+            "id": "job-1",
+            "corpus_id": "corpus-1",
+            "shards": 1,
+            "shards_done": 0,
+            "shards_failed": 0,
+            "files_seen": 0,
+            "files_updated": 0,
+            "files_split": 0,
+            "splits_created": 0,
+            "files_embedded": 0,
+            "vectors_done": 0,
+            "files_failed": 0,
+            "ingest_seconds": 0,
+            "split_seconds": 0,
+            "embed_seconds": 0,
+            "created_at": "2024-11-01T12:00:00Z",
+        }
+        with self.respond(200, json.dumps(job).encode()) as request:
+            result = update_files(
+                self.api, "corpus-1", io.BytesIO(b"tar"), ["a.txt"],
+            )
+
+        self.assertEqual(result.id, "job-1")
+        (method, url), kwargs = request.call_args
+        self.assertEqual(method, "POST")
+        self.assertEqual(url, "http://corpora.test/api/corpora/corpus/corpus-1/files")
+        self.assertEqual(kwargs["headers"]["Authorization"], "Bearer token")
+        body = b"".join(kwargs["body"])
+        self.assertEqual(kwargs["headers"]["Content-Length"], str(len(body)))
+        content_type = kwargs["headers"]["Content-Type"]
+        boundary = content_type.split("boundary=")[1]
+        self.assertEqual(
+            parse_multipart(boundary, body),
+            {"delete_files": b"a.txt", "tarball": b"tar"},
+        )
+
+    def test_raises_api_exception(self):
+        with self.respond(404, b'"Not found"'), self.assertRaises(ApiException) as e:
+            update_files(self.api, "corpus-1", io.BytesIO(b"tar"))
+        self.assertEqual(e.exception.status, 404)
+
+
+class TestResumableUpload(unittest.TestCase):
+    content = bytes(range(256)) * 40  # 10240 bytes, three 4096-byte parts
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.state_path = os.path.join(tmp.name, ".corpora", "upload")
+        self.sha256 = hashlib.sha256(self.content).hexdigest()
+        self.api = MagicMock()
+        self.api.create_upload.return_value = self.status("upload-1")
+
+    def status(self, upload_id, parts=(), completed=False):
+        return UploadResponseSchema(
+            id=upload_id,
+            size=len(self.content),
+            part_size=4096,
+            parts=[
+                UploadPartResponseSchema(
+                    offset=offset, size=size, sha256="x",
+                )
+                for offset, size in parts
+            ],
+            completed=completed,
+        )
+
+    def sent_parts(self):
+        return {
+            call.args[1]: call.args[3][1]
+            for call in self.api.upload_part.call_args_list
+        }
+
+    def test_uploads_parts_and_completes(self):
+        tarball = io.BytesIO(self.content)
+        upload_id = resumable_upload(self.api, tarball, self.state_path, workers=2)
+
+        self.assertEqual(upload_id, "upload-1")
+        upload_schema = self.api.create_upload.call_args.args[0]
+        self.assertEqual(upload_schema.size, len(self.content))
+        self.assertEqual(upload_schema.sha256, self.sha256)
+        self.assertEqual(
+            self.sent_parts(),
+            {
+                0: self.content[:4096],
+                4096: self.content[4096:8192],
+                8192: self.content[8192:],
+            },
+        )
+        for call in self.api.upload_part.call_args_list:
+            self.assertEqual(
+                call.args[2], hashlib.sha256(call.args[3][1]).hexdigest(),
+            )
+        self.api.complete_upload.assert_called_once_with("upload-1")
+        self.assertEqual(tarball.tell(), 0)
+        self.assertEqual(
+            load_upload_state(self.state_path), {self.sha256: "upload-1"},
+        )
+
+    def test_resumes_interrupted_upload(self):
+        self.api.upload_part.side_effect = [None, ConnectionError("gone")] + [
+            ConnectionError("gone"),
+        ] * 10
+        with patch("corpora_cli.utils.upload.time.sleep"):
+            with self.assertRaises(ConnectionError):
+                resumable_upload(
+                    self.api, io.BytesIO(self.content), self.state_path, workers=1,
+                )
+        self.api.complete_upload.assert_not_called()
+
+        # The next run finds the upload and sends only what's missing
+        self.api.reset_mock()
+        self.api.upload_part.side_effect = None
+        self.api.get_upload.return_value = self.status("upload-1", [(0, 4096)])
+        upload_id = resumable_upload(
+            self.api, io.BytesIO(self.content), self.state_path,
+        )
+
+        self.assertEqual(upload_id, "upload-1")
+        self.api.get_upload.assert_called_once_with("upload-1")
+        self.api.create_upload.assert_not_called()
+        self.assertEqual(sorted(self.sent_parts()), [4096, 8192])
+        self.api.complete_upload.assert_called_once_with("upload-1")
+
+    def test_retries_failed_part(self):
+        self.api.upload_part.side_effect = [ConnectionError("reset"), None, None, None]
+        with patch("corpora_cli.utils.upload.time.sleep") as sleep:
+            resumable_upload(
+                self.api, io.BytesIO(self.content), self.state_path, workers=1,
+            )
+        sleep.assert_called_once_with(1)
+        self.assertEqual(self.api.upload_part.call_count, 4)
+        self.api.complete_upload.assert_called_once()
+
+    def test_starts_over_when_upload_is_gone(self):
+        resumable_upload(self.api, io.BytesIO(self.content), self.state_path)
+        self.api.reset_mock()
+        self.api.get_upload.side_effect = ApiException(status=404)
+        self.api.create_upload.return_value = self.status("upload-2")
+
+        upload_id = resumable_upload(
+            self.api, io.BytesIO(self.content), self.state_path,
+        )
+
+        self.assertEqual(upload_id, "upload-2")
+        self.assertEqual(len(self.sent_parts()), 3)
+        self.assertEqual(load_upload_state(self.state_path)[self.sha256], "upload-2")
+
+    def test_different_tarball_starts_new_upload(self):
+        resumable_upload(self.api, io.BytesIO(self.content), self.state_path)
+        self.api.reset_mock()
+        self.api.create_upload.return_value = self.status("upload-2")
+
+        resumable_upload(
+            self.api, io.BytesIO(self.content[::-1]), self.state_path,
+        )
+
+        self.api.get_upload.assert_not_called()
+        self.api.create_upload.assert_called_once()
+
+    def test_upload_shards(self):
+        shards = [[Path("a.txt")], [Path("b.txt"), Path("c.txt")]]
+        contents = {
+            "a.txt": self.content,
+            "b.txt,c.txt": self.content[:5000],
+        }
+        self.api.create_upload.side_effect = lambda schema: UploadResponseSchema(
+            id=f"upload-{schema.size}",
+            size=schema.size,
+            part_size=4096,
+            parts=[],
+            completed=False,
+        )
+        uploaded = []
+
+        upload_ids = upload_shards(
+            self.api,
+            shards,
+            lambda files: io.BytesIO(contents[",".join(map(str, files))]),
+            self.state_path,
+            on_uploaded=lambda: uploaded.append(1),
+        )
+
+        self.assertEqual(upload_ids, ["upload-10240", "upload-5000"])
+        self.assertEqual(len(uploaded), 2)
+        # Two parts for the 5000-byte shard, three for the other
+        self.assertEqual(self.api.upload_part.call_count, 5)
+        self.assertEqual(
+            sorted(c.args[0] for c in self.api.complete_upload.call_args_list),
+            ["upload-10240", "upload-5000"],
+        )
+        # Both are remembered, so either can be resumed
+        self.assertEqual(
+            sorted(load_upload_state(self.state_path).values()),
+            ["upload-10240", "upload-5000"],
+        )
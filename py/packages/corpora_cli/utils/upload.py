@@ -0,0 +1,329 @@
+import hashlib
+import json
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple
+
+from corpora_client import CorpusApi
+from corpora_client.api_client import ApiClient, RequestSerialized
+from corpora_client.exceptions import ApiException
+from corpora_client.models.corpus_response_schema import CorpusResponseSchema
+from corpora_client.models.ingestion_job_response_schema import (
+    IngestionJobResponseSchema,
+)
+from corpora_client.models.upload_response_schema import UploadResponseSchema
+from corpora_client.models.upload_schema import UploadSchema
+from corpora_client.rest import RESTResponse
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+# Tarballs bigger than this go up as a resumable upload, in parts
+RESUMABLE_UPLOAD_SIZE = 8 * 1024 * 1024
+UPLOAD_WORKERS = 4
+PART_RETRIES = 3
+
+_state_lock = threading.Lock()
+
+
+def multipart_body(
+    fields: List[Tuple[str, str]],
+    file_field: str,
+    fileobj: BinaryIO,
+    boundary: str,
+    filename: str = "tarball.tar.gz",
+    chunk_size: int = UPLOAD_CHUNK_SIZE,
+) -> Tuple[Iterator[bytes], int]:
+    """Build a multipart/form-data body that reads the file a chunk at a
+    time instead of holding it in memory.
+
+    Returns the body iterator and its total length. Django ignores request
+    bodies without a Content-Length, so the length is sent rather than
+    using chunked transfer encoding.
+    """
+    head = b"".join(
+        (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="{name}"\r\n\r\n'
+            f"{value}\r\n"
+        ).encode()
+        for name, value in fields
+    ) + (
+        f"--{boundary}\r\n"
+        f'Content-Disposition: form-data; name="{file_field}"; '
+        f'filename="{filename}"\r\n'
+        "Content-Type: application/gzip\r\n\r\n"
+    ).encode()
+    tail = f"\r\n--{boundary}--\r\n".encode()
+
+    start = fileobj.tell()
+    file_size = fileobj.seek(0, os.SEEK_END) - start
+    fileobj.seek(start)
+
+    def iter_body() -> Iterator[bytes]:
+        yield head
+        while chunk := fileobj.read(chunk_size):
+            yield chunk
+        yield tail
+
+    return iter_body(), len(head) + file_size + len(tail)
+
+
+def stream_multipart(
+    api_client: ApiClient,
+    serialized: RequestSerialized,
+    boundary: str,
+    file_field: str,
+    fileobj: BinaryIO,
+    response_types_map: Dict[str, Optional[str]],
+):
+    """Send a request built by a generated `_*_serialize` method, streaming
+    its form fields plus `fileobj` as the multipart body.
+
+    The generated client would read the whole file into the request body
+    first; this sends it as it's read. Responses and errors are handled
+    by the generated client as usual.
+    """
+    method, url, headers, _, post_params = serialized
+    body, content_length = multipart_body(
+        post_params, file_field, fileobj, boundary,
+    )
+    response = api_client.rest_client.pool_manager.request(
+        method,
+        url,
+        body=body,
+        headers={**headers, "Content-Length": str(content_length)},
+        preload_content=False,
+    )
+    response_data = RESTResponse(response)
+    response_data.read()
+    return api_client.response_deserialize(
+        response_data=response_data,
+        response_types_map=response_types_map,
+    ).data
+
+
+def create_corpus(
+    api: CorpusApi,
+    name: str,
+    url: str,
+    tarball: BinaryIO,
+) -> CorpusResponseSchema:
+    """Streaming `CorpusApi.create_corpus`."""
+    boundary = uuid.uuid4().hex
+    serialized = api._create_corpus_serialize(
+        name=name,
+        url=url,
+        upload_ids=None,
+        tarball=None,
+        _request_auth=None,
+        _content_type=f"multipart/form-data; boundary={boundary}",
+        _headers=None,
+        _host_index=0,
+    )
+    return stream_multipart(
+        api.api_client,
+        serialized,
+        boundary,
+        "tarball",
+        tarball,
+        {
+            "201": "CorpusResponseSchema",
+            "400": "str",
+            "404": "str",
+            "409": "str",
+            "413": "str",
+        },
+    )
+
+
+def update_files(
+    api: CorpusApi,
+    corpus_id: str,
+    tarball: BinaryIO,
+    delete_files: Optional[List[str]] = None,
+) -> IngestionJobResponseSchema:
+    """Streaming `CorpusApi.update_files`."""
+    boundary = uuid.uuid4().hex
+    serialized = api._update_files_serialize(
+        corpus_id=corpus_id,
+        upload_ids=None,
+        tarball=None,
+        delete_files=delete_files,
+        _request_auth=None,
+        _content_type=f"multipart/form-data; boundary={boundary}",
+        _headers=None,
+        _host_index=0,
+    )
+    return stream_multipart(
+        api.api_client,
+        serialized,
+        boundary,
+        "tarball",
+        tarball,
+        {
+            "200": "IngestionJobResponseSchema",
+            "400": "str",
+            "404": "str",
+            "413": "str",
+        },
+    )
+
+
+def file_digest(fileobj: BinaryIO) -> Tuple[int, str]:
+    """Size and sha256 of a rewound file, leaving it rewound."""
+    digest = hashlib.sha256()
+    size = 0
+    while chunk := fileobj.read(UPLOAD_CHUNK_SIZE):
+        digest.update(chunk)
+        size += len(chunk)
+    fileobj.seek(0)
+    return size, digest.hexdigest()
+
+
+def load_upload_state(state_path: str) -> Dict[str, str]:
+    """Upload ids by the sha256 of the tarball they're for."""
+    try:
+        with open(state_path) as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return state if isinstance(state, dict) else {}
+
+
+def save_upload_state(state_path: str, sha256: str, upload_id: str) -> None:
+    # Shards are uploaded from several threads
+    with _state_lock:
+        state = load_upload_state(state_path)
+        state[sha256] = upload_id
+        os.makedirs(os.path.dirname(state_path) or ".", exist_ok=True)
+        with open(state_path, "w") as f:
+            json.dump(state, f)
+
+
+def clear_upload_state(state_path: str) -> None:
+    try:
+        os.remove(state_path)
+    except FileNotFoundError:
+        pass
+
+
+def resume_upload(
+    api: CorpusApi,
+    state_path: str,
+    size: int,
+    sha256: str,
+) -> Optional[UploadResponseSchema]:
+    """The upload left behind by an interrupted run for these same bytes,
+    if the server still has it.
+    """
+    upload_id = load_upload_state(state_path).get(sha256)
+    if upload_id is None:
+        return None
+    try:
+        status = api.get_upload(upload_id)
+    except ApiException as e:
+        if e.status != 404:
+            raise
+        # Expired, or already used by a corpus
+        return None
+    return status if status.size == size else None
+
+
+def send_part(
+    api: CorpusApi,
+    upload_id: str,
+    offset: int,
+    data: bytes,
+    retries: int = PART_RETRIES,
+) -> None:
+    """Send one part, retrying with backoff. Parts are idempotent: a retry
+    replaces whatever an earlier attempt left on the server.
+    """
+    sha256 = hashlib.sha256(data).hexdigest()
+    for attempt in range(retries + 1):
+        try:
+            api.upload_part(upload_id, offset, sha256, ("part", data))
+            return
+        except Exception:  # noqa: PERF203
+            if attempt == retries:
+                raise
+            time.sleep(2**attempt)
+
+
+def resumable_upload(
+    api: CorpusApi,
+    tarball: BinaryIO,
+    state_path: str,
+    workers: int = UPLOAD_WORKERS,
+    on_progress: Optional[Callable[[int], None]] = None,
+) -> str:
+    """Upload a tarball in parts, several at a time, and return the id of
+    the completed upload for `create_corpus`/`update_files`.
+
+    The upload id is kept in `state_path`, so running again with the same
+    tarball after an interruption only sends the parts the server is
+    missing. `on_progress` is called with the byte count of each part sent.
+    """
+    size, sha256 = file_digest(tarball)
+    status = resume_upload(api, state_path, size, sha256)
+    if status is None:
+        status = api.create_upload(UploadSchema(size=size, sha256=sha256))
+        save_upload_state(state_path, sha256, status.id)
+
+    if not status.completed:
+        part_size = status.part_size
+        received = {
+            part.offset
+            for part in status.parts
+            if part.size == min(part_size, size - part.offset)
+        }
+        missing = [
+            offset for offset in range(0, size, part_size) if offset not in received
+        ]
+        # Workers share the file; only the reads need to take turns
+        lock = threading.Lock()
+
+        def upload(offset: int) -> None:
+            with lock:
+                tarball.seek(offset)
+                data = tarball.read(part_size)
+            send_part(api, status.id, offset, data)
+            if on_progress:
+                on_progress(len(data))
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # list() to surface the first failure
+            list(executor.map(upload, missing))
+        api.complete_upload(status.id)
+
+    tarball.seek(0)
+    return status.id
+
+
+def upload_shards(
+    api: CorpusApi,
+    shards: List[List[Path]],
+    make_tarball: Callable[[List[Path]], BinaryIO],
+    state_path: str,
+    workers: int = UPLOAD_WORKERS,
+    on_uploaded: Optional[Callable[[], None]] = None,
+) -> List[str]:
+    """Tar and upload several shards at a time, returning their upload
+    ids in order. `on_uploaded` is called as each shard finishes.
+    """
+    part_workers = max(1, workers // len(shards))
+
+    def upload(files: List[Path]) -> str:
+        with make_tarball(files) as tarball:
+            upload_id = resumable_upload(
+                api, tarball, state_path, workers=part_workers,
+            )
+        if on_uploaded:
+            on_uploaded()
+        return upload_id
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(shards))) as executor:
+        return list(executor.map(upload, shards))
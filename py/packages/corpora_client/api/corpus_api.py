@@ -16,10 +16,14 @@ from pydantic import validate_call, Field, StrictFloat, StrictStr, StrictInt
 from typing import Any, Dict, List, Optional, Tuple, Union
 from typing_extensions import Annotated
 
-from pydantic import StrictBytes, StrictStr
+from pydantic import StrictBytes, StrictInt, StrictStr
 from typing import Dict, List, Optional, Tuple, Union
 from corpora_client.models.corpus_chat_schema import CorpusChatSchema
 from corpora_client.models.corpus_response_schema import CorpusResponseSchema
+from corpora_client.models.ingestion_job_response_schema import IngestionJobResponseSchema
+from corpora_client.models.upload_part_response_schema import UploadPartResponseSchema
+from corpora_client.models.upload_response_schema import UploadResponseSchema
+from corpora_client.models.upload_schema import UploadSchema
 
 from corpora_client.api_client import ApiClient, RequestSerialized
 from corpora_client.api_response import ApiResponse
@@ -317,11 +321,9 @@ class CorpusApi:
 
 
     @validate_call
-    def create_corpus(
+    def chat_stream(
         self,
-        name: StrictStr,
-        tarball: Union[StrictBytes, StrictStr, Tuple[StrictStr, StrictBytes]],
-        url: Optional[StrictStr] = None,
+        corpus_chat_schema: CorpusChatSchema,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -334,17 +336,13 @@ class CorpusApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> CorpusResponseSchema:
-        """Create Corpus
+    ) -> str:
+        """Chat Stream
 
-        Create a new Corpus with an uploaded tarball.
+        Chat with the Corpus, streaming the reply as plain text while it is generated.
 
-        :param name: (required)
-        :type name: str
-        :param tarball: (required)
-        :type tarball: bytearray
-        :param url:
-        :type url: str
+        :param corpus_chat_schema: (required)
+        :type corpus_chat_schema: CorpusChatSchema
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -367,10 +365,8 @@ class CorpusApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._create_corpus_serialize(
-            name=name,
-            tarball=tarball,
-            url=url,
+        _param = self._chat_stream_serialize(
+            corpus_chat_schema=corpus_chat_schema,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -378,9 +374,8 @@ class CorpusApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '201': "CorpusResponseSchema",
-            '400': "str",
-            '409': "str",
+            '200': "str",
+            '404': "str",
         }
         response_data = self.api_client.call_api(
             *_param,
@@ -394,11 +389,9 @@ class CorpusApi:
 
 
     @validate_call
-    def create_corpus_with_http_info(
+    def chat_stream_with_http_info(
         self,
-        name: StrictStr,
-        tarball: Union[StrictBytes, StrictStr, Tuple[StrictStr, StrictBytes]],
-        url: Optional[StrictStr] = None,
+        corpus_chat_schema: CorpusChatSchema,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -411,17 +404,13 @@ class CorpusApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[CorpusResponseSchema]:
-        """Create Corpus
+    ) -> ApiResponse[str]:
+        """Chat Stream
 
-        Create a new Corpus with an uploaded tarball.
+        Chat with the Corpus, streaming the reply as plain text while it is generated.
 
-        :param name: (required)
-        :type name: str
-        :param tarball: (required)
-        :type tarball: bytearray
-        :param url:
-        :type url: str
+        :param corpus_chat_schema: (required)
+        :type corpus_chat_schema: CorpusChatSchema
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -444,10 +433,8 @@ class CorpusApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._create_corpus_serialize(
-            name=name,
-            tarball=tarball,
-            url=url,
+        _param = self._chat_stream_serialize(
+            corpus_chat_schema=corpus_chat_schema,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -455,9 +442,8 @@ class CorpusApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '201': "CorpusResponseSchema",
-            '400': "str",
-            '409': "str",
+            '200': "str",
+            '404': "str",
         }
         response_data = self.api_client.call_api(
             *_param,
@@ -471,11 +457,9 @@ class CorpusApi:
 
 
     @validate_call
-    def create_corpus_without_preload_content(
+    def chat_stream_without_preload_content(
         self,
-        name: StrictStr,
-        tarball: Union[StrictBytes, StrictStr, Tuple[StrictStr, StrictBytes]],
-        url: Optional[StrictStr] = None,
+        corpus_chat_schema: CorpusChatSchema,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -489,16 +473,12 @@ class CorpusApi:
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
     ) -> RESTResponseType:
-        """Create Corpus
+        """Chat Stream
 
-        Create a new Corpus with an uploaded tarball.
+        Chat with the Corpus, streaming the reply as plain text while it is generated.
 
-        :param name: (required)
-        :type name: str
-        :param tarball: (required)
-        :type tarball: bytearray
-        :param url:
-        :type url: str
+        :param corpus_chat_schema: (required)
+        :type corpus_chat_schema: CorpusChatSchema
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -521,10 +501,8 @@ class CorpusApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._create_corpus_serialize(
-            name=name,
-            tarball=tarball,
-            url=url,
+        _param = self._chat_stream_serialize(
+            corpus_chat_schema=corpus_chat_schema,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -532,9 +510,8 @@ class CorpusApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '201': "CorpusResponseSchema",
-            '400': "str",
-            '409': "str",
+            '200': "str",
+            '404': "str",
         }
         response_data = self.api_client.call_api(
             *_param,
@@ -543,11 +520,9 @@ class CorpusApi:
         return response_data.response
 
 
-    def _create_corpus_serialize(
+    def _chat_stream_serialize(
         self,
-        name,
-        tarball,
-        url,
+        corpus_chat_schema,
         _request_auth,
         _content_type,
         _headers,
@@ -572,13 +547,9 @@ class CorpusApi:
         # process the query parameters
         # process the header parameters
         # process the form parameters
-        if name is not None:
-            _form_params.append(('name', name))
-        if url is not None:
-            _form_params.append(('url', url))
-        if tarball is not None:
-            _files['tarball'] = tarball
         # process the body parameter
+        if corpus_chat_schema is not None:
+            _body_params = corpus_chat_schema
 
 
         # set the HTTP header `Accept`
@@ -596,7 +567,7 @@ class CorpusApi:
             _default_content_type = (
                 self.api_client.select_header_content_type(
                     [
-                        'multipart/form-data'
+                        'application/json'
                     ]
                 )
             )
@@ -610,7 +581,7 @@ class CorpusApi:
 
         return self.api_client.param_serialize(
             method='POST',
-            resource_path='/api/corpora/corpus',
+            resource_path='/api/corpora/corpus/chat/stream',
             path_params=_path_params,
             query_params=_query_params,
             header_params=_header_params,
@@ -627,9 +598,9 @@ class CorpusApi:
 
 
     @validate_call
-    def delete_corpus(
+    def complete_upload(
         self,
-        corpus_name: StrictStr,
+        upload_id: StrictStr,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -642,13 +613,13 @@ class CorpusApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> str:
-        """Delete Corpus
+    ) -> UploadResponseSchema:
+        """Complete Upload
 
-        Delete a Corpus by name.
+        Join the received parts, once they cover the whole upload.
 
-        :param corpus_name: (required)
-        :type corpus_name: str
+        :param upload_id: (required)
+        :type upload_id: str
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -671,8 +642,8 @@ class CorpusApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._delete_corpus_serialize(
-            corpus_name=corpus_name,
+        _param = self._complete_upload_serialize(
+            upload_id=upload_id,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -680,7 +651,8 @@ class CorpusApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '204': "str",
+            '200': "UploadResponseSchema",
+            '400': "str",
             '404': "str",
         }
         response_data = self.api_client.call_api(
@@ -695,9 +667,9 @@ class CorpusApi:
 
 
     @validate_call
-    def delete_corpus_with_http_info(
+    def complete_upload_with_http_info(
         self,
-        corpus_name: StrictStr,
+        upload_id: StrictStr,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -710,13 +682,13 @@ class CorpusApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[str]:
-        """Delete Corpus
+    ) -> ApiResponse[UploadResponseSchema]:
+        """Complete Upload
 
-        Delete a Corpus by name.
+        Join the received parts, once they cover the whole upload.
 
-        :param corpus_name: (required)
-        :type corpus_name: str
+        :param upload_id: (required)
+        :type upload_id: str
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -739,8 +711,8 @@ class CorpusApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._delete_corpus_serialize(
-            corpus_name=corpus_name,
+        _param = self._complete_upload_serialize(
+            upload_id=upload_id,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -748,7 +720,8 @@ class CorpusApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '204': "str",
+            '200': "UploadResponseSchema",
+            '400': "str",
             '404': "str",
         }
         response_data = self.api_client.call_api(
@@ -763,9 +736,9 @@ class CorpusApi:
 
 
     @validate_call
-    def delete_corpus_without_preload_content(
+    def complete_upload_without_preload_content(
         self,
-        corpus_name: StrictStr,
+        upload_id: StrictStr,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -779,12 +752,12 @@ class CorpusApi:
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
     ) -> RESTResponseType:
-        """Delete Corpus
+        """Complete Upload
 
-        Delete a Corpus by name.
+        Join the received parts, once they cover the whole upload.
 
-        :param corpus_name: (required)
-        :type corpus_name: str
+        :param upload_id: (required)
+        :type upload_id: str
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -807,8 +780,1685 @@ class CorpusApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._delete_corpus_serialize(
-            corpus_name=corpus_name,
+        _param = self._complete_upload_serialize(
+            upload_id=upload_id,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "UploadResponseSchema",
+            '400': "str",
+            '404': "str",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        return response_data.response
+
+
+    def _complete_upload_serialize(
+        self,
+        upload_id,
+        _request_auth,
+        _content_type,
+        _headers,
+        _host_index,
+    ) -> RequestSerialized:
+
+        _host = None
+
+        _collection_formats: Dict[str, str] = {
+        }
+
+        _path_params: Dict[str, str] = {}
+        _query_params: List[Tuple[str, str]] = []
+        _header_params: Dict[str, Optional[str]] = _headers or {}
+        _form_params: List[Tuple[str, str]] = []
+        _files: Dict[
+            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
+        ] = {}
+        _body_params: Optional[bytes] = None
+
+        # process the path parameters
+        if upload_id is not None:
+            _path_params['upload_id'] = upload_id
+        # process the query parameters
+        # process the header parameters
+        # process the form parameters
+        # process the body parameter
+
+
+        # set the HTTP header `Accept`
+        if 'Accept' not in _header_params:
+            _header_params['Accept'] = self.api_client.select_header_accept(
+                [
+                    'application/json'
+                ]
+            )
+
+
+        # authentication setting
+        _auth_settings: List[str] = [
+            'BearerAuth'
+        ]
+
+        return self.api_client.param_serialize(
+            method='POST',
+            resource_path='/api/corpora/corpus/uploads/{upload_id}/complete',
+            path_params=_path_params,
+            query_params=_query_params,
+            header_params=_header_params,
+            body=_body_params,
+            post_params=_form_params,
+            files=_files,
+            auth_settings=_auth_settings,
+            collection_formats=_collection_formats,
+            _host=_host,
+            _request_auth=_request_auth
+        )
+
+
+
+
+    @validate_call
+    def create_corpus(
+        self,
+        name: StrictStr,
+        url: Optional[StrictStr] = None,
+        upload_ids: Optional[List[StrictStr]] = None,
+        tarball: Optional[Union[StrictBytes, StrictStr, Tuple[StrictStr, StrictBytes]]] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> CorpusResponseSchema:
+        """Create Corpus
+
+        Create a new Corpus with an uploaded tarball, or the tarballs of completed resumable uploads, ingested in parallel.
+
+        :param name: (required)
+        :type name: str
+        :param url:
+        :type url: str
+        :param upload_ids:
+        :type upload_ids: List[str]
+        :param tarball:
+        :type tarball: bytearray
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._create_corpus_serialize(
+            name=name,
+            url=url,
+            upload_ids=upload_ids,
+            tarball=tarball,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '201': "CorpusResponseSchema",
+            '400': "str",
+            '404': "str",
+            '409': "str",
+            '413': "str",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        ).data
+
+
+    @validate_call
+    def create_corpus_with_http_info(
+        self,
+        name: StrictStr,
+        url: Optional[StrictStr] = None,
+        upload_ids: Optional[List[StrictStr]] = None,
+        tarball: Optional[Union[StrictBytes, StrictStr, Tuple[StrictStr, StrictBytes]]] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[CorpusResponseSchema]:
+        """Create Corpus
+
+        Create a new Corpus with an uploaded tarball, or the tarballs of completed resumable uploads, ingested in parallel.
+
+        :param name: (required)
+        :type name: str
+        :param url:
+        :type url: str
+        :param upload_ids:
+        :type upload_ids: List[str]
+        :param tarball:
+        :type tarball: bytearray
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._create_corpus_serialize(
+            name=name,
+            url=url,
+            upload_ids=upload_ids,
+            tarball=tarball,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '201': "CorpusResponseSchema",
+            '400': "str",
+            '404': "str",
+            '409': "str",
+            '413': "str",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        )
+
+
+    @validate_call
+    def create_corpus_without_preload_content(
+        self,
+        name: StrictStr,
+        url: Optional[StrictStr] = None,
+        upload_ids: Optional[List[StrictStr]] = None,
+        tarball: Optional[Union[StrictBytes, StrictStr, Tuple[StrictStr, StrictBytes]]] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Create Corpus
+
+        Create a new Corpus with an uploaded tarball, or the tarballs of completed resumable uploads, ingested in parallel.
+
+        :param name: (required)
+        :type name: str
+        :param url:
+        :type url: str
+        :param upload_ids:
+        :type upload_ids: List[str]
+        :param tarball:
+        :type tarball: bytearray
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._create_corpus_serialize(
+            name=name,
+            url=url,
+            upload_ids=upload_ids,
+            tarball=tarball,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '201': "CorpusResponseSchema",
+            '400': "str",
+            '404': "str",
+            '409': "str",
+            '413': "str",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        return response_data.response
+
+
+    def _create_corpus_serialize(
+        self,
+        name,
+        url,
+        upload_ids,
+        tarball,
+        _request_auth,
+        _content_type,
+        _headers,
+        _host_index,
+    ) -> RequestSerialized:
+
+        _host = None
+
+        _collection_formats: Dict[str, str] = {
+            'upload_ids': 'csv',
+        }
+
+        _path_params: Dict[str, str] = {}
+        _query_params: List[Tuple[str, str]] = []
+        _header_params: Dict[str, Optional[str]] = _headers or {}
+        _form_params: List[Tuple[str, str]] = []
+        _files: Dict[
+            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
+        ] = {}
+        _body_params: Optional[bytes] = None
+
+        # process the path parameters
+        # process the query parameters
+        # process the header parameters
+        # process the form parameters
+        if name is not None:
+            _form_params.append(('name', name))
+        if url is not None:
+            _form_params.append(('url', url))
+        if upload_ids is not None:
+            _form_params.append(('upload_ids', upload_ids))
+        if tarball is not None:
+            _files['tarball'] = tarball
+        # process the body parameter
+
+
+        # set the HTTP header `Accept`
+        if 'Accept' not in _header_params:
+            _header_params['Accept'] = self.api_client.select_header_accept(
+                [
+                    'application/json'
+                ]
+            )
+
+        # set the HTTP header `Content-Type`
+        if _content_type:
+            _header_params['Content-Type'] = _content_type
+        else:
+            _default_content_type = (
+                self.api_client.select_header_content_type(
+                    [
+                        'multipart/form-data'
+                    ]
+                )
+            )
+            if _default_content_type is not None:
+                _header_params['Content-Type'] = _default_content_type
+
+        # authentication setting
+        _auth_settings: List[str] = [
+            'BearerAuth'
+        ]
+
+        return self.api_client.param_serialize(
+            method='POST',
+            resource_path='/api/corpora/corpus',
+            path_params=_path_params,
+            query_params=_query_params,
+            header_params=_header_params,
+            body=_body_params,
+            post_params=_form_params,
+            files=_files,
+            auth_settings=_auth_settings,
+            collection_formats=_collection_formats,
+            _host=_host,
+            _request_auth=_request_auth
+        )
+
+
+
+
+    @validate_call
+    def create_upload(
+        self,
+        upload_schema: UploadSchema,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> UploadResponseSchema:
+        """Create Upload
+
+        Start a resumable tarball upload.
+
+        :param upload_schema: (required)
+        :type upload_schema: UploadSchema
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._create_upload_serialize(
+            upload_schema=upload_schema,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '201': "UploadResponseSchema",
+            '413': "str",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        ).data
+
+
+    @validate_call
+    def create_upload_with_http_info(
+        self,
+        upload_schema: UploadSchema,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[UploadResponseSchema]:
+        """Create Upload
+
+        Start a resumable tarball upload.
+
+        :param upload_schema: (required)
+        :type upload_schema: UploadSchema
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._create_upload_serialize(
+            upload_schema=upload_schema,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '201': "UploadResponseSchema",
+            '413': "str",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        )
+
+
+    @validate_call
+    def create_upload_without_preload_content(
+        self,
+        upload_schema: UploadSchema,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Create Upload
+
+        Start a resumable tarball upload.
+
+        :param upload_schema: (required)
+        :type upload_schema: UploadSchema
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._create_upload_serialize(
+            upload_schema=upload_schema,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '201': "UploadResponseSchema",
+            '413': "str",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        return response_data.response
+
+
+    def _create_upload_serialize(
+        self,
+        upload_schema,
+        _request_auth,
+        _content_type,
+        _headers,
+        _host_index,
+    ) -> RequestSerialized:
+
+        _host = None
+
+        _collection_formats: Dict[str, str] = {
+        }
+
+        _path_params: Dict[str, str] = {}
+        _query_params: List[Tuple[str, str]] = []
+        _header_params: Dict[str, Optional[str]] = _headers or {}
+        _form_params: List[Tuple[str, str]] = []
+        _files: Dict[
+            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
+        ] = {}
+        _body_params: Optional[bytes] = None
+
+        # process the path parameters
+        # process the query parameters
+        # process the header parameters
+        # process the form parameters
+        # process the body parameter
+        if upload_schema is not None:
+            _body_params = upload_schema
+
+
+        # set the HTTP header `Accept`
+        if 'Accept' not in _header_params:
+            _header_params['Accept'] = self.api_client.select_header_accept(
+                [
+                    'application/json'
+                ]
+            )
+
+        # set the HTTP header `Content-Type`
+        if _content_type:
+            _header_params['Content-Type'] = _content_type
+        else:
+            _default_content_type = (
+                self.api_client.select_header_content_type(
+                    [
+                        'application/json'
+                    ]
+                )
+            )
+            if _default_content_type is not None:
+                _header_params['Content-Type'] = _default_content_type
+
+        # authentication setting
+        _auth_settings: List[str] = [
+            'BearerAuth'
+        ]
+
+        return self.api_client.param_serialize(
+            method='POST',
+            resource_path='/api/corpora/corpus/uploads',
+            path_params=_path_params,
+            query_params=_query_params,
+            header_params=_header_params,
+            body=_body_params,
+            post_params=_form_params,
+            files=_files,
+            auth_settings=_auth_settings,
+            collection_formats=_collection_formats,
+            _host=_host,
+            _request_auth=_request_auth
+        )
+
+
+
+
+    @validate_call
+    def delete_corpus(
+        self,
+        corpus_name: StrictStr,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> str:
+        """Delete Corpus
+
+        Delete a Corpus by name.
+
+        :param corpus_name: (required)
+        :type corpus_name: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._delete_corpus_serialize(
+            corpus_name=corpus_name,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '204': "str",
+            '404': "str",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        ).data
+
+
+    @validate_call
+    def delete_corpus_with_http_info(
+        self,
+        corpus_name: StrictStr,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[str]:
+        """Delete Corpus
+
+        Delete a Corpus by name.
+
+        :param corpus_name: (required)
+        :type corpus_name: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._delete_corpus_serialize(
+            corpus_name=corpus_name,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '204': "str",
+            '404': "str",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        )
+
+
+    @validate_call
+    def delete_corpus_without_preload_content(
+        self,
+        corpus_name: StrictStr,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Delete Corpus
+
+        Delete a Corpus by name.
+
+        :param corpus_name: (required)
+        :type corpus_name: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._delete_corpus_serialize(
+            corpus_name=corpus_name,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '204': "str",
+            '404': "str",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        return response_data.response
+
+
+    def _delete_corpus_serialize(
+        self,
+        corpus_name,
+        _request_auth,
+        _content_type,
+        _headers,
+        _host_index,
+    ) -> RequestSerialized:
+
+        _host = None
+
+        _collection_formats: Dict[str, str] = {
+        }
+
+        _path_params: Dict[str, str] = {}
+        _query_params: List[Tuple[str, str]] = []
+        _header_params: Dict[str, Optional[str]] = _headers or {}
+        _form_params: List[Tuple[str, str]] = []
+        _files: Dict[
+            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
+        ] = {}
+        _body_params: Optional[bytes] = None
+
+        # process the path parameters
+        # process the query parameters
+        if corpus_name is not None:
+            
+            _query_params.append(('corpus_name', corpus_name))
+            
+        # process the header parameters
+        # process the form parameters
+        # process the body parameter
+
+
+        # set the HTTP header `Accept`
+        if 'Accept' not in _header_params:
+            _header_params['Accept'] = self.api_client.select_header_accept(
+                [
+                    'application/json'
+                ]
+            )
+
+
+        # authentication setting
+        _auth_settings: List[str] = [
+            'BearerAuth'
+        ]
+
+        return self.api_client.param_serialize(
+            method='DELETE',
+            resource_path='/api/corpora/corpus',
+            path_params=_path_params,
+            query_params=_query_params,
+            header_params=_header_params,
+            body=_body_params,
+            post_params=_form_params,
+            files=_files,
+            auth_settings=_auth_settings,
+            collection_formats=_collection_formats,
+            _host=_host,
+            _request_auth=_request_auth
+        )
+
+
+
+
+    @validate_call
+    def get_corpus(
+        self,
+        corpus_id: StrictStr,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> CorpusResponseSchema:
+        """Get Corpus
+
+        Retrieve a Corpus by ID.
+
+        :param corpus_id: (required)
+        :type corpus_id: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._get_corpus_serialize(
+            corpus_id=corpus_id,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "CorpusResponseSchema",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        ).data
+
+
+    @validate_call
+    def get_corpus_with_http_info(
+        self,
+        corpus_id: StrictStr,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[CorpusResponseSchema]:
+        """Get Corpus
+
+        Retrieve a Corpus by ID.
+
+        :param corpus_id: (required)
+        :type corpus_id: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._get_corpus_serialize(
+            corpus_id=corpus_id,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "CorpusResponseSchema",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        )
+
+
+    @validate_call
+    def get_corpus_without_preload_content(
+        self,
+        corpus_id: StrictStr,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Get Corpus
+
+        Retrieve a Corpus by ID.
+
+        :param corpus_id: (required)
+        :type corpus_id: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._get_corpus_serialize(
+            corpus_id=corpus_id,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "CorpusResponseSchema",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        return response_data.response
+
+
+    def _get_corpus_serialize(
+        self,
+        corpus_id,
+        _request_auth,
+        _content_type,
+        _headers,
+        _host_index,
+    ) -> RequestSerialized:
+
+        _host = None
+
+        _collection_formats: Dict[str, str] = {
+        }
+
+        _path_params: Dict[str, str] = {}
+        _query_params: List[Tuple[str, str]] = []
+        _header_params: Dict[str, Optional[str]] = _headers or {}
+        _form_params: List[Tuple[str, str]] = []
+        _files: Dict[
+            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
+        ] = {}
+        _body_params: Optional[bytes] = None
+
+        # process the path parameters
+        if corpus_id is not None:
+            _path_params['corpus_id'] = corpus_id
+        # process the query parameters
+        # process the header parameters
+        # process the form parameters
+        # process the body parameter
+
+
+        # set the HTTP header `Accept`
+        if 'Accept' not in _header_params:
+            _header_params['Accept'] = self.api_client.select_header_accept(
+                [
+                    'application/json'
+                ]
+            )
+
+
+        # authentication setting
+        _auth_settings: List[str] = [
+            'BearerAuth'
+        ]
+
+        return self.api_client.param_serialize(
+            method='GET',
+            resource_path='/api/corpora/corpus/{corpus_id}',
+            path_params=_path_params,
+            query_params=_query_params,
+            header_params=_header_params,
+            body=_body_params,
+            post_params=_form_params,
+            files=_files,
+            auth_settings=_auth_settings,
+            collection_formats=_collection_formats,
+            _host=_host,
+            _request_auth=_request_auth
+        )
+
+
+
+
+    @validate_call
+    def get_file_hashes(
+        self,
+        corpus_id: StrictStr,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> Dict[str, str]:
+        """Get File Hashes
+
+        Retrieve a map of file paths to their hashes for a Corpus.  Sends an ETag; a matching If-None-Match gets an empty 304 instead.
+
+        :param corpus_id: (required)
+        :type corpus_id: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._get_file_hashes_serialize(
+            corpus_id=corpus_id,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "Dict[str, str]",
+            '304': None,
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        ).data
+
+
+    @validate_call
+    def get_file_hashes_with_http_info(
+        self,
+        corpus_id: StrictStr,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[Dict[str, str]]:
+        """Get File Hashes
+
+        Retrieve a map of file paths to their hashes for a Corpus.  Sends an ETag; a matching If-None-Match gets an empty 304 instead.
+
+        :param corpus_id: (required)
+        :type corpus_id: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._get_file_hashes_serialize(
+            corpus_id=corpus_id,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "Dict[str, str]",
+            '304': None,
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        )
+
+
+    @validate_call
+    def get_file_hashes_without_preload_content(
+        self,
+        corpus_id: StrictStr,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Get File Hashes
+
+        Retrieve a map of file paths to their hashes for a Corpus.  Sends an ETag; a matching If-None-Match gets an empty 304 instead.
+
+        :param corpus_id: (required)
+        :type corpus_id: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._get_file_hashes_serialize(
+            corpus_id=corpus_id,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "Dict[str, str]",
+            '304': None,
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        return response_data.response
+
+
+    def _get_file_hashes_serialize(
+        self,
+        corpus_id,
+        _request_auth,
+        _content_type,
+        _headers,
+        _host_index,
+    ) -> RequestSerialized:
+
+        _host = None
+
+        _collection_formats: Dict[str, str] = {
+        }
+
+        _path_params: Dict[str, str] = {}
+        _query_params: List[Tuple[str, str]] = []
+        _header_params: Dict[str, Optional[str]] = _headers or {}
+        _form_params: List[Tuple[str, str]] = []
+        _files: Dict[
+            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
+        ] = {}
+        _body_params: Optional[bytes] = None
+
+        # process the path parameters
+        if corpus_id is not None:
+            _path_params['corpus_id'] = corpus_id
+        # process the query parameters
+        # process the header parameters
+        # process the form parameters
+        # process the body parameter
+
+
+        # set the HTTP header `Accept`
+        if 'Accept' not in _header_params:
+            _header_params['Accept'] = self.api_client.select_header_accept(
+                [
+                    'application/json'
+                ]
+            )
+
+
+        # authentication setting
+        _auth_settings: List[str] = [
+            'BearerAuth'
+        ]
+
+        return self.api_client.param_serialize(
+            method='GET',
+            resource_path='/api/corpora/corpus/{corpus_id}/files',
+            path_params=_path_params,
+            query_params=_query_params,
+            header_params=_header_params,
+            body=_body_params,
+            post_params=_form_params,
+            files=_files,
+            auth_settings=_auth_settings,
+            collection_formats=_collection_formats,
+            _host=_host,
+            _request_auth=_request_auth
+        )
+
+
+
+
+    @validate_call
+    def get_ingestion_job(
+        self,
+        corpus_id: StrictStr,
+        job_id: StrictStr,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> IngestionJobResponseSchema:
+        """Get Ingestion Job
+
+        Get the progress of an ingestion job.
+
+        :param corpus_id: (required)
+        :type corpus_id: str
+        :param job_id: (required)
+        :type job_id: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._get_ingestion_job_serialize(
+            corpus_id=corpus_id,
+            job_id=job_id,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "IngestionJobResponseSchema",
+            '404': "str",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        ).data
+
+
+    @validate_call
+    def get_ingestion_job_with_http_info(
+        self,
+        corpus_id: StrictStr,
+        job_id: StrictStr,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[IngestionJobResponseSchema]:
+        """Get Ingestion Job
+
+        Get the progress of an ingestion job.
+
+        :param corpus_id: (required)
+        :type corpus_id: str
+        :param job_id: (required)
+        :type job_id: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._get_ingestion_job_serialize(
+            corpus_id=corpus_id,
+            job_id=job_id,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "IngestionJobResponseSchema",
+            '404': "str",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        )
+
+
+    @validate_call
+    def get_ingestion_job_without_preload_content(
+        self,
+        corpus_id: StrictStr,
+        job_id: StrictStr,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Get Ingestion Job
+
+        Get the progress of an ingestion job.
+
+        :param corpus_id: (required)
+        :type corpus_id: str
+        :param job_id: (required)
+        :type job_id: str
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._get_ingestion_job_serialize(
+            corpus_id=corpus_id,
+            job_id=job_id,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -816,7 +2466,7 @@ class CorpusApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '204': "str",
+            '200': "IngestionJobResponseSchema",
             '404': "str",
         }
         response_data = self.api_client.call_api(
@@ -826,9 +2476,10 @@ class CorpusApi:
         return response_data.response
 
 
-    def _delete_corpus_serialize(
+    def _get_ingestion_job_serialize(
         self,
-        corpus_name,
+        corpus_id,
+        job_id,
         _request_auth,
         _content_type,
         _headers,
@@ -850,11 +2501,11 @@ class CorpusApi:
         _body_params: Optional[bytes] = None
 
         # process the path parameters
+        if corpus_id is not None:
+            _path_params['corpus_id'] = corpus_id
+        if job_id is not None:
+            _path_params['job_id'] = job_id
         # process the query parameters
-        if corpus_name is not None:
-            
-            _query_params.append(('corpus_name', corpus_name))
-            
         # process the header parameters
         # process the form parameters
         # process the body parameter
@@ -875,8 +2526,8 @@ class CorpusApi:
         ]
 
         return self.api_client.param_serialize(
-            method='DELETE',
-            resource_path='/api/corpora/corpus',
+            method='GET',
+            resource_path='/api/corpora/corpus/{corpus_id}/jobs/{job_id}',
             path_params=_path_params,
             query_params=_query_params,
             header_params=_header_params,
@@ -893,9 +2544,9 @@ class CorpusApi:
 
 
     @validate_call
-    def get_corpus(
+    def get_upload(
         self,
-        corpus_id: StrictStr,
+        upload_id: StrictStr,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -908,13 +2559,13 @@ class CorpusApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> CorpusResponseSchema:
-        """Get Corpus
+    ) -> UploadResponseSchema:
+        """Get Upload
 
-        Retrieve a Corpus by ID.
+        Get a resumable upload and the parts received so far.
 
-        :param corpus_id: (required)
-        :type corpus_id: str
+        :param upload_id: (required)
+        :type upload_id: str
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -937,8 +2588,8 @@ class CorpusApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._get_corpus_serialize(
-            corpus_id=corpus_id,
+        _param = self._get_upload_serialize(
+            upload_id=upload_id,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -946,7 +2597,8 @@ class CorpusApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "CorpusResponseSchema",
+            '200': "UploadResponseSchema",
+            '404': "str",
         }
         response_data = self.api_client.call_api(
             *_param,
@@ -960,9 +2612,9 @@ class CorpusApi:
 
 
     @validate_call
-    def get_corpus_with_http_info(
+    def get_upload_with_http_info(
         self,
-        corpus_id: StrictStr,
+        upload_id: StrictStr,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -975,13 +2627,13 @@ class CorpusApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[CorpusResponseSchema]:
-        """Get Corpus
+    ) -> ApiResponse[UploadResponseSchema]:
+        """Get Upload
 
-        Retrieve a Corpus by ID.
+        Get a resumable upload and the parts received so far.
 
-        :param corpus_id: (required)
-        :type corpus_id: str
+        :param upload_id: (required)
+        :type upload_id: str
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -1004,8 +2656,8 @@ class CorpusApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._get_corpus_serialize(
-            corpus_id=corpus_id,
+        _param = self._get_upload_serialize(
+            upload_id=upload_id,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -1013,7 +2665,8 @@ class CorpusApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "CorpusResponseSchema",
+            '200': "UploadResponseSchema",
+            '404': "str",
         }
         response_data = self.api_client.call_api(
             *_param,
@@ -1027,9 +2680,9 @@ class CorpusApi:
 
 
     @validate_call
-    def get_corpus_without_preload_content(
+    def get_upload_without_preload_content(
         self,
-        corpus_id: StrictStr,
+        upload_id: StrictStr,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -1043,12 +2696,12 @@ class CorpusApi:
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
     ) -> RESTResponseType:
-        """Get Corpus
+        """Get Upload
 
-        Retrieve a Corpus by ID.
+        Get a resumable upload and the parts received so far.
 
-        :param corpus_id: (required)
-        :type corpus_id: str
+        :param upload_id: (required)
+        :type upload_id: str
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -1071,8 +2724,8 @@ class CorpusApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._get_corpus_serialize(
-            corpus_id=corpus_id,
+        _param = self._get_upload_serialize(
+            upload_id=upload_id,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -1080,7 +2733,8 @@ class CorpusApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "CorpusResponseSchema",
+            '200': "UploadResponseSchema",
+            '404': "str",
         }
         response_data = self.api_client.call_api(
             *_param,
@@ -1089,9 +2743,9 @@ class CorpusApi:
         return response_data.response
 
 
-    def _get_corpus_serialize(
+    def _get_upload_serialize(
         self,
-        corpus_id,
+        upload_id,
         _request_auth,
         _content_type,
         _headers,
@@ -1113,8 +2767,8 @@ class CorpusApi:
         _body_params: Optional[bytes] = None
 
         # process the path parameters
-        if corpus_id is not None:
-            _path_params['corpus_id'] = corpus_id
+        if upload_id is not None:
+            _path_params['upload_id'] = upload_id
         # process the query parameters
         # process the header parameters
         # process the form parameters
@@ -1137,7 +2791,7 @@ class CorpusApi:
 
         return self.api_client.param_serialize(
             method='GET',
-            resource_path='/api/corpora/corpus/{corpus_id}',
+            resource_path='/api/corpora/corpus/uploads/{upload_id}',
             path_params=_path_params,
             query_params=_query_params,
             header_params=_header_params,
@@ -1154,9 +2808,8 @@ class CorpusApi:
 
 
     @validate_call
-    def get_file_hashes(
+    def list_corpora(
         self,
-        corpus_id: StrictStr,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -1169,13 +2822,11 @@ class CorpusApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> Dict[str, str]:
-        """Get File Hashes
+    ) -> List[CorpusResponseSchema]:
+        """List Corpora
 
-        Retrieve a map of file paths to their hashes for a Corpus.
+        List all Corpora.
 
-        :param corpus_id: (required)
-        :type corpus_id: str
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -1198,8 +2849,7 @@ class CorpusApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._get_file_hashes_serialize(
-            corpus_id=corpus_id,
+        _param = self._list_corpora_serialize(
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -1207,7 +2857,7 @@ class CorpusApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "Dict[str, str]",
+            '200': "List[CorpusResponseSchema]",
         }
         response_data = self.api_client.call_api(
             *_param,
@@ -1221,9 +2871,8 @@ class CorpusApi:
 
 
     @validate_call
-    def get_file_hashes_with_http_info(
+    def list_corpora_with_http_info(
         self,
-        corpus_id: StrictStr,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -1236,13 +2885,11 @@ class CorpusApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[Dict[str, str]]:
-        """Get File Hashes
+    ) -> ApiResponse[List[CorpusResponseSchema]]:
+        """List Corpora
 
-        Retrieve a map of file paths to their hashes for a Corpus.
+        List all Corpora.
 
-        :param corpus_id: (required)
-        :type corpus_id: str
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -1265,8 +2912,7 @@ class CorpusApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._get_file_hashes_serialize(
-            corpus_id=corpus_id,
+        _param = self._list_corpora_serialize(
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -1274,7 +2920,7 @@ class CorpusApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "Dict[str, str]",
+            '200': "List[CorpusResponseSchema]",
         }
         response_data = self.api_client.call_api(
             *_param,
@@ -1288,9 +2934,8 @@ class CorpusApi:
 
 
     @validate_call
-    def get_file_hashes_without_preload_content(
+    def list_corpora_without_preload_content(
         self,
-        corpus_id: StrictStr,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -1304,12 +2949,10 @@ class CorpusApi:
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
     ) -> RESTResponseType:
-        """Get File Hashes
+        """List Corpora
 
-        Retrieve a map of file paths to their hashes for a Corpus.
+        List all Corpora.
 
-        :param corpus_id: (required)
-        :type corpus_id: str
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -1332,8 +2975,7 @@ class CorpusApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._get_file_hashes_serialize(
-            corpus_id=corpus_id,
+        _param = self._list_corpora_serialize(
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -1341,7 +2983,7 @@ class CorpusApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "Dict[str, str]",
+            '200': "List[CorpusResponseSchema]",
         }
         response_data = self.api_client.call_api(
             *_param,
@@ -1350,9 +2992,8 @@ class CorpusApi:
         return response_data.response
 
 
-    def _get_file_hashes_serialize(
+    def _list_corpora_serialize(
         self,
-        corpus_id,
         _request_auth,
         _content_type,
         _headers,
@@ -1374,8 +3015,6 @@ class CorpusApi:
         _body_params: Optional[bytes] = None
 
         # process the path parameters
-        if corpus_id is not None:
-            _path_params['corpus_id'] = corpus_id
         # process the query parameters
         # process the header parameters
         # process the form parameters
@@ -1398,7 +3037,7 @@ class CorpusApi:
 
         return self.api_client.param_serialize(
             method='GET',
-            resource_path='/api/corpora/corpus/{corpus_id}/files',
+            resource_path='/api/corpora/corpus',
             path_params=_path_params,
             query_params=_query_params,
             header_params=_header_params,
@@ -1415,8 +3054,12 @@ class CorpusApi:
 
 
     @validate_call
-    def list_corpora(
+    def update_files(
         self,
+        corpus_id: StrictStr,
+        delete_files: Optional[List[StrictStr]] = None,
+        upload_ids: Optional[List[StrictStr]] = None,
+        tarball: Optional[Union[StrictBytes, StrictStr, Tuple[StrictStr, StrictBytes]]] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -1429,11 +3072,19 @@ class CorpusApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> List[CorpusResponseSchema]:
-        """List Corpora
+    ) -> IngestionJobResponseSchema:
+        """Update Files
 
-        List all Corpora.
+        Update a Corpus with an uploaded tarball (or the tarballs of completed resumable uploads) for additions/updates and a list of files to delete. Returns the job tracking the ingestion.
 
+        :param corpus_id: (required)
+        :type corpus_id: str
+        :param delete_files:
+        :type delete_files: List[str]
+        :param upload_ids:
+        :type upload_ids: List[str]
+        :param tarball:
+        :type tarball: bytearray
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -1456,7 +3107,11 @@ class CorpusApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._list_corpora_serialize(
+        _param = self._update_files_serialize(
+            corpus_id=corpus_id,
+            delete_files=delete_files,
+            upload_ids=upload_ids,
+            tarball=tarball,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -1464,7 +3119,10 @@ class CorpusApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "List[CorpusResponseSchema]",
+            '200': "IngestionJobResponseSchema",
+            '400': "str",
+            '404': "str",
+            '413': "str",
         }
         response_data = self.api_client.call_api(
             *_param,
@@ -1478,8 +3136,12 @@ class CorpusApi:
 
 
     @validate_call
-    def list_corpora_with_http_info(
+    def update_files_with_http_info(
         self,
+        corpus_id: StrictStr,
+        delete_files: Optional[List[StrictStr]] = None,
+        upload_ids: Optional[List[StrictStr]] = None,
+        tarball: Optional[Union[StrictBytes, StrictStr, Tuple[StrictStr, StrictBytes]]] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -1492,11 +3154,19 @@ class CorpusApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[List[CorpusResponseSchema]]:
-        """List Corpora
+    ) -> ApiResponse[IngestionJobResponseSchema]:
+        """Update Files
 
-        List all Corpora.
+        Update a Corpus with an uploaded tarball (or the tarballs of completed resumable uploads) for additions/updates and a list of files to delete. Returns the job tracking the ingestion.
 
+        :param corpus_id: (required)
+        :type corpus_id: str
+        :param delete_files:
+        :type delete_files: List[str]
+        :param upload_ids:
+        :type upload_ids: List[str]
+        :param tarball:
+        :type tarball: bytearray
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -1519,7 +3189,11 @@ class CorpusApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._list_corpora_serialize(
+        _param = self._update_files_serialize(
+            corpus_id=corpus_id,
+            delete_files=delete_files,
+            upload_ids=upload_ids,
+            tarball=tarball,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -1527,7 +3201,10 @@ class CorpusApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "List[CorpusResponseSchema]",
+            '200': "IngestionJobResponseSchema",
+            '400': "str",
+            '404': "str",
+            '413': "str",
         }
         response_data = self.api_client.call_api(
             *_param,
@@ -1541,8 +3218,12 @@ class CorpusApi:
 
 
     @validate_call
-    def list_corpora_without_preload_content(
+    def update_files_without_preload_content(
         self,
+        corpus_id: StrictStr,
+        delete_files: Optional[List[StrictStr]] = None,
+        upload_ids: Optional[List[StrictStr]] = None,
+        tarball: Optional[Union[StrictBytes, StrictStr, Tuple[StrictStr, StrictBytes]]] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -1556,10 +3237,18 @@ class CorpusApi:
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
     ) -> RESTResponseType:
-        """List Corpora
+        """Update Files
 
-        List all Corpora.
+        Update a Corpus with an uploaded tarball (or the tarballs of completed resumable uploads) for additions/updates and a list of files to delete. Returns the job tracking the ingestion.
 
+        :param corpus_id: (required)
+        :type corpus_id: str
+        :param delete_files:
+        :type delete_files: List[str]
+        :param upload_ids:
+        :type upload_ids: List[str]
+        :param tarball:
+        :type tarball: bytearray
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -1582,7 +3271,11 @@ class CorpusApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._list_corpora_serialize(
+        _param = self._update_files_serialize(
+            corpus_id=corpus_id,
+            delete_files=delete_files,
+            upload_ids=upload_ids,
+            tarball=tarball,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -1590,7 +3283,10 @@ class CorpusApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "List[CorpusResponseSchema]",
+            '200': "IngestionJobResponseSchema",
+            '400': "str",
+            '404': "str",
+            '413': "str",
         }
         response_data = self.api_client.call_api(
             *_param,
@@ -1599,8 +3295,12 @@ class CorpusApi:
         return response_data.response
 
 
-    def _list_corpora_serialize(
+    def _update_files_serialize(
         self,
+        corpus_id,
+        delete_files,
+        upload_ids,
+        tarball,
         _request_auth,
         _content_type,
         _headers,
@@ -1610,6 +3310,8 @@ class CorpusApi:
         _host = None
 
         _collection_formats: Dict[str, str] = {
+            'delete_files': 'csv',
+            'upload_ids': 'csv',
         }
 
         _path_params: Dict[str, str] = {}
@@ -1622,9 +3324,17 @@ class CorpusApi:
         _body_params: Optional[bytes] = None
 
         # process the path parameters
+        if corpus_id is not None:
+            _path_params['corpus_id'] = corpus_id
         # process the query parameters
         # process the header parameters
         # process the form parameters
+        if delete_files is not None:
+            _form_params.append(('delete_files', delete_files))
+        if upload_ids is not None:
+            _form_params.append(('upload_ids', upload_ids))
+        if tarball is not None:
+            _files['tarball'] = tarball
         # process the body parameter
 
 
@@ -1636,6 +3346,19 @@ class CorpusApi:
                 ]
             )
 
+        # set the HTTP header `Content-Type`
+        if _content_type:
+            _header_params['Content-Type'] = _content_type
+        else:
+            _default_content_type = (
+                self.api_client.select_header_content_type(
+                    [
+                        'multipart/form-data'
+                    ]
+                )
+            )
+            if _default_content_type is not None:
+                _header_params['Content-Type'] = _default_content_type
 
         # authentication setting
         _auth_settings: List[str] = [
@@ -1643,8 +3366,8 @@ class CorpusApi:
         ]
 
         return self.api_client.param_serialize(
-            method='GET',
-            resource_path='/api/corpora/corpus',
+            method='POST',
+            resource_path='/api/corpora/corpus/{corpus_id}/files',
             path_params=_path_params,
             query_params=_query_params,
             header_params=_header_params,
@@ -1661,11 +3384,12 @@ class CorpusApi:
 
 
     @validate_call
-    def update_files(
+    def upload_part(
         self,
-        corpus_id: StrictStr,
-        tarball: Union[StrictBytes, StrictStr, Tuple[StrictStr, StrictBytes]],
-        delete_files: Optional[List[StrictStr]] = None,
+        upload_id: StrictStr,
+        offset: StrictInt,
+        sha256: StrictStr,
+        part: Union[StrictBytes, StrictStr, Tuple[StrictStr, StrictBytes]],
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -1678,17 +3402,19 @@ class CorpusApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> str:
-        """Update Files
-
-        Update a Corpus with an uploaded tarball for additions/updates and a list of files to delete
-
-        :param corpus_id: (required)
-        :type corpus_id: str
-        :param tarball: (required)
-        :type tarball: bytearray
-        :param delete_files:
-        :type delete_files: List[str]
+    ) -> UploadPartResponseSchema:
+        """Upload Part
+
+        Upload the bytes at `offset`, replacing an earlier attempt.
+
+        :param upload_id: (required)
+        :type upload_id: str
+        :param offset: (required)
+        :type offset: int
+        :param sha256: (required)
+        :type sha256: str
+        :param part: (required)
+        :type part: bytearray
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -1711,10 +3437,11 @@ class CorpusApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._update_files_serialize(
-            corpus_id=corpus_id,
-            tarball=tarball,
-            delete_files=delete_files,
+        _param = self._upload_part_serialize(
+            upload_id=upload_id,
+            offset=offset,
+            sha256=sha256,
+            part=part,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -1722,7 +3449,8 @@ class CorpusApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "str",
+            '200': "UploadPartResponseSchema",
+            '400': "str",
             '404': "str",
         }
         response_data = self.api_client.call_api(
@@ -1737,11 +3465,12 @@ class CorpusApi:
 
 
     @validate_call
-    def update_files_with_http_info(
+    def upload_part_with_http_info(
         self,
-        corpus_id: StrictStr,
-        tarball: Union[StrictBytes, StrictStr, Tuple[StrictStr, StrictBytes]],
-        delete_files: Optional[List[StrictStr]] = None,
+        upload_id: StrictStr,
+        offset: StrictInt,
+        sha256: StrictStr,
+        part: Union[StrictBytes, StrictStr, Tuple[StrictStr, StrictBytes]],
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -1754,17 +3483,19 @@ class CorpusApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[str]:
-        """Update Files
-
-        Update a Corpus with an uploaded tarball for additions/updates and a list of files to delete
-
-        :param corpus_id: (required)
-        :type corpus_id: str
-        :param tarball: (required)
-        :type tarball: bytearray
-        :param delete_files:
-        :type delete_files: List[str]
+    ) -> ApiResponse[UploadPartResponseSchema]:
+        """Upload Part
+
+        Upload the bytes at `offset`, replacing an earlier attempt.
+
+        :param upload_id: (required)
+        :type upload_id: str
+        :param offset: (required)
+        :type offset: int
+        :param sha256: (required)
+        :type sha256: str
+        :param part: (required)
+        :type part: bytearray
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -1787,10 +3518,11 @@ class CorpusApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._update_files_serialize(
-            corpus_id=corpus_id,
-            tarball=tarball,
-            delete_files=delete_files,
+        _param = self._upload_part_serialize(
+            upload_id=upload_id,
+            offset=offset,
+            sha256=sha256,
+            part=part,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -1798,7 +3530,8 @@ class CorpusApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "str",
+            '200': "UploadPartResponseSchema",
+            '400': "str",
             '404': "str",
         }
         response_data = self.api_client.call_api(
@@ -1813,11 +3546,12 @@ class CorpusApi:
 
 
     @validate_call
-    def update_files_without_preload_content(
+    def upload_part_without_preload_content(
         self,
-        corpus_id: StrictStr,
-        tarball: Union[StrictBytes, StrictStr, Tuple[StrictStr, StrictBytes]],
-        delete_files: Optional[List[StrictStr]] = None,
+        upload_id: StrictStr,
+        offset: StrictInt,
+        sha256: StrictStr,
+        part: Union[StrictBytes, StrictStr, Tuple[StrictStr, StrictBytes]],
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -1831,16 +3565,18 @@ class CorpusApi:
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
     ) -> RESTResponseType:
-        """Update Files
-
-        Update a Corpus with an uploaded tarball for additions/updates and a list of files to delete
-
-        :param corpus_id: (required)
-        :type corpus_id: str
-        :param tarball: (required)
-        :type tarball: bytearray
-        :param delete_files:
-        :type delete_files: List[str]
+        """Upload Part
+
+        Upload the bytes at `offset`, replacing an earlier attempt.
+
+        :param upload_id: (required)
+        :type upload_id: str
+        :param offset: (required)
+        :type offset: int
+        :param sha256: (required)
+        :type sha256: str
+        :param part: (required)
+        :type part: bytearray
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -1863,10 +3599,11 @@ class CorpusApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._update_files_serialize(
-            corpus_id=corpus_id,
-            tarball=tarball,
-            delete_files=delete_files,
+        _param = self._upload_part_serialize(
+            upload_id=upload_id,
+            offset=offset,
+            sha256=sha256,
+            part=part,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -1874,7 +3611,8 @@ class CorpusApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "str",
+            '200': "UploadPartResponseSchema",
+            '400': "str",
             '404': "str",
         }
         response_data = self.api_client.call_api(
@@ -1884,11 +3622,12 @@ class CorpusApi:
         return response_data.response
 
 
-    def _update_files_serialize(
+    def _upload_part_serialize(
         self,
-        corpus_id,
-        tarball,
-        delete_files,
+        upload_id,
+        offset,
+        sha256,
+        part,
         _request_auth,
         _content_type,
         _headers,
@@ -1898,7 +3637,6 @@ class CorpusApi:
         _host = None
 
         _collection_formats: Dict[str, str] = {
-            'delete_files': 'csv',
         }
 
         _path_params: Dict[str, str] = {}
@@ -1911,15 +3649,17 @@ class CorpusApi:
         _body_params: Optional[bytes] = None
 
         # process the path parameters
-        if corpus_id is not None:
-            _path_params['corpus_id'] = corpus_id
+        if upload_id is not None:
+            _path_params['upload_id'] = upload_id
         # process the query parameters
         # process the header parameters
         # process the form parameters
-        if delete_files is not None:
-            _form_params.append(('delete_files', delete_files))
-        if tarball is not None:
-            _files['tarball'] = tarball
+        if offset is not None:
+            _form_params.append(('offset', offset))
+        if sha256 is not None:
+            _form_params.append(('sha256', sha256))
+        if part is not None:
+            _files['part'] = part
         # process the body parameter
 
 
@@ -1952,7 +3692,7 @@ class CorpusApi:
 
         return self.api_client.param_serialize(
             method='POST',
-            resource_path='/api/corpora/corpus/{corpus_id}/files',
+            resource_path='/api/corpora/corpus/uploads/{upload_id}/parts',
             path_params=_path_params,
             query_params=_query_params,
             header_params=_header_params,
@@ -580,7 +580,7 @@ class SplitApi:
     ) -> List[SplitResponseSchema]:
         """Vector Search
 
-        Perform a vector similarity search for splits using a provided query vector.
+        Search for splits by vector similarity to the text, by full-text match, or by both fused (`mode`), in one corpus or across several.
 
         :param split_vector_search_schema: (required)
         :type split_vector_search_schema: SplitVectorSearchSchema
@@ -616,6 +616,8 @@ class SplitApi:
 
         _response_types_map: Dict[str, Optional[str]] = {
             '200': "List[SplitResponseSchema]",
+            '400': "str",
+            '404': "str",
         }
         response_data = self.api_client.call_api(
             *_param,
@@ -647,7 +649,7 @@ class SplitApi:
     ) -> ApiResponse[List[SplitResponseSchema]]:
         """Vector Search
 
-        Perform a vector similarity search for splits using a provided query vector.
+        Search for splits by vector similarity to the text, by full-text match, or by both fused (`mode`), in one corpus or across several.
 
         :param split_vector_search_schema: (required)
         :type split_vector_search_schema: SplitVectorSearchSchema
@@ -683,6 +685,8 @@ class SplitApi:
 
         _response_types_map: Dict[str, Optional[str]] = {
             '200': "List[SplitResponseSchema]",
+            '400': "str",
+            '404': "str",
         }
         response_data = self.api_client.call_api(
             *_param,
@@ -714,7 +718,7 @@ class SplitApi:
     ) -> RESTResponseType:
         """Vector Search
 
-        Perform a vector similarity search for splits using a provided query vector.
+        Search for splits by vector similarity to the text, by full-text match, or by both fused (`mode`), in one corpus or across several.
 
         :param split_vector_search_schema: (required)
         :type split_vector_search_schema: SplitVectorSearchSchema
@@ -750,6 +754,8 @@ class SplitApi:
 
         _response_types_map: Dict[str, Optional[str]] = {
             '200': "List[SplitResponseSchema]",
+            '400': "str",
+            '404': "str",
         }
         response_data = self.api_client.call_api(
             *_param,
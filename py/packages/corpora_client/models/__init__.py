@@ -19,10 +19,15 @@ from corpora_client.models.corpus_file_chat_schema import CorpusFileChatSchema
 from corpora_client.models.corpus_response_schema import CorpusResponseSchema
 from corpora_client.models.corpus_schema import CorpusSchema
 from corpora_client.models.corpus_update_files_schema import CorpusUpdateFilesSchema
+from corpora_client.models.file_path_response_schema import FilePathResponseSchema
 from corpora_client.models.file_response_schema import FileResponseSchema
 from corpora_client.models.file_schema import FileSchema
+from corpora_client.models.ingestion_job_response_schema import IngestionJobResponseSchema
 from corpora_client.models.issue_schema import IssueSchema
 from corpora_client.models.message_schema import MessageSchema
 from corpora_client.models.plot_response_schema import PlotResponseSchema
 from corpora_client.models.split_response_schema import SplitResponseSchema
 from corpora_client.models.split_vector_search_schema import SplitVectorSearchSchema
+from corpora_client.models.upload_part_response_schema import UploadPartResponseSchema
+from corpora_client.models.upload_response_schema import UploadResponseSchema
+from corpora_client.models.upload_schema import UploadSchema
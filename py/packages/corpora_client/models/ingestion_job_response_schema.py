@@ -0,0 +1,125 @@
+# coding: utf-8
+
+"""
+    Corpora API
+
+    API for managing and processing corpora
+
+    The version of the OpenAPI document: 0.1.0
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+from __future__ import annotations
+import pprint
+import re  # noqa: F401
+import json
+
+from datetime import datetime
+from pydantic import BaseModel, ConfigDict, StrictFloat, StrictInt, StrictStr
+from typing import Any, ClassVar, Dict, List, Optional, Union
+from typing import Optional, Set
+from typing_extensions import Self
+
+class IngestionJobResponseSchema(BaseModel):
+    """
+    IngestionJobResponseSchema
+    """ # noqa: E501
+    id: StrictStr
+    corpus_id: StrictStr
+    shards: StrictInt
+    shards_done: StrictInt
+    shards_failed: StrictInt
+    files_seen: StrictInt
+    files_updated: StrictInt
+    files_split: StrictInt
+    splits_created: StrictInt
+    files_embedded: StrictInt
+    vectors_done: StrictInt
+    files_failed: StrictInt
+    ingest_seconds: Union[StrictFloat, StrictInt]
+    split_seconds: Union[StrictFloat, StrictInt]
+    embed_seconds: Union[StrictFloat, StrictInt]
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+    __properties: ClassVar[List[str]] = ["id", "corpus_id", "shards", "shards_done", "shards_failed", "files_seen", "files_updated", "files_split", "splits_created", "files_embedded", "vectors_done", "files_failed", "ingest_seconds", "split_seconds", "embed_seconds", "created_at", "finished_at"]
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        validate_assignment=True,
+        protected_namespaces=(),
+    )
+
+
+    def to_str(self) -> str:
+        """Returns the string representation of the model using alias"""
+        return pprint.pformat(self.model_dump(by_alias=True))
+
+    def to_json(self) -> str:
+        """Returns the JSON representation of the model using alias"""
+        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, json_str: str) -> Optional[Self]:
+        """Create an instance of IngestionJobResponseSchema from a JSON string"""
+        return cls.from_dict(json.loads(json_str))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the dictionary representation of the model using alias.
+
+        This has the following differences from calling pydantic's
+        `self.model_dump(by_alias=True)`:
+
+        * `None` is only added to the output dict for nullable fields that
+          were set at model initialization. Other fields with value `None`
+          are ignored.
+        """
+        excluded_fields: Set[str] = set([
+        ])
+
+        _dict = self.model_dump(
+            by_alias=True,
+            exclude=excluded_fields,
+            exclude_none=True,
+        )
+        # set to None if finished_at (nullable) is None
+        # and model_fields_set contains the field
+        if self.finished_at is None and "finished_at" in self.model_fields_set:
+            _dict['finished_at'] = None
+
+        return _dict
+
+    @classmethod
+    def from_dict(cls, obj: Optional[Dict[str, Any]]) -> Optional[Self]:
+        """Create an instance of IngestionJobResponseSchema from a dict"""
+        if obj is None:
+            return None
+
+        if not isinstance(obj, dict):
+            return cls.model_validate(obj)
+
+        _obj = cls.model_validate({
+            "id": obj.get("id"),
+            "corpus_id": obj.get("corpus_id"),
+            "shards": obj.get("shards"),
+            "shards_done": obj.get("shards_done"),
+            "shards_failed": obj.get("shards_failed"),
+            "files_seen": obj.get("files_seen"),
+            "files_updated": obj.get("files_updated"),
+            "files_split": obj.get("files_split"),
+            "splits_created": obj.get("splits_created"),
+            "files_embedded": obj.get("files_embedded"),
+            "vectors_done": obj.get("vectors_done"),
+            "files_failed": obj.get("files_failed"),
+            "ingest_seconds": obj.get("ingest_seconds"),
+            "split_seconds": obj.get("split_seconds"),
+            "embed_seconds": obj.get("embed_seconds"),
+            "created_at": obj.get("created_at"),
+            "finished_at": obj.get("finished_at")
+        })
+        return _obj
+
+
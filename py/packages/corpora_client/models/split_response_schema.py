@@ -27,10 +27,12 @@ class SplitResponseSchema(BaseModel):
     SplitResponseSchema
     """ # noqa: E501
     id: StrictStr
+    corpus_id: StrictStr
     content: StrictStr
     order: StrictInt
     file_id: StrictStr
-    __properties: ClassVar[List[str]] = ["id", "content", "order", "file_id"]
+    file_path: StrictStr
+    __properties: ClassVar[List[str]] = ["id", "corpus_id", "content", "order", "file_id", "file_path"]
 
     model_config = ConfigDict(
         populate_by_name=True,
@@ -84,9 +86,11 @@ class SplitResponseSchema(BaseModel):
 
         _obj = cls.model_validate({
             "id": obj.get("id"),
+            "corpus_id": obj.get("corpus_id"),
             "content": obj.get("content"),
             "order": obj.get("order"),
-            "file_id": obj.get("file_id")
+            "file_id": obj.get("file_id"),
+            "file_path": obj.get("file_path")
         })
         return _obj
 
@@ -17,8 +17,9 @@ import pprint
 import re  # noqa: F401
 import json
 
-from pydantic import BaseModel, ConfigDict, StrictInt, StrictStr
+from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictStr, field_validator
 from typing import Any, ClassVar, Dict, List, Optional
+from typing_extensions import Annotated
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -26,10 +27,25 @@ class SplitVectorSearchSchema(BaseModel):
     """
     SplitVectorSearchSchema
     """ # noqa: E501
-    corpus_id: StrictStr
+    corpus_id: Optional[StrictStr] = None
+    corpus_ids: Optional[List[StrictStr]] = None
+    all_corpora: Optional[StrictBool] = False
     text: StrictStr
-    limit: Optional[StrictInt] = 10
-    __properties: ClassVar[List[str]] = ["corpus_id", "text", "limit"]
+    limit: Optional[Annotated[int, Field(strict=True, ge=1)]] = 10
+    per_corpus_limit: Optional[Annotated[int, Field(strict=True, ge=1)]] = None
+    ef_search: Optional[Annotated[int, Field(le=1000, strict=True, ge=1)]] = None
+    mode: Optional[StrictStr] = 'vector'
+    __properties: ClassVar[List[str]] = ["corpus_id", "corpus_ids", "all_corpora", "text", "limit", "per_corpus_limit", "ef_search", "mode"]
+
+    @field_validator('mode')
+    def mode_validate_enum(cls, value):
+        """Validates the enum"""
+        if value is None:
+            return value
+
+        if value not in set(['vector', 'hybrid', 'lexical', 'summary']):
+            raise ValueError("must be one of enum values ('vector', 'hybrid', 'lexical', 'summary')")
+        return value
 
     model_config = ConfigDict(
         populate_by_name=True,
@@ -70,6 +86,26 @@ class SplitVectorSearchSchema(BaseModel):
             exclude=excluded_fields,
             exclude_none=True,
         )
+        # set to None if corpus_id (nullable) is None
+        # and model_fields_set contains the field
+        if self.corpus_id is None and "corpus_id" in self.model_fields_set:
+            _dict['corpus_id'] = None
+
+        # set to None if corpus_ids (nullable) is None
+        # and model_fields_set contains the field
+        if self.corpus_ids is None and "corpus_ids" in self.model_fields_set:
+            _dict['corpus_ids'] = None
+
+        # set to None if per_corpus_limit (nullable) is None
+        # and model_fields_set contains the field
+        if self.per_corpus_limit is None and "per_corpus_limit" in self.model_fields_set:
+            _dict['per_corpus_limit'] = None
+
+        # set to None if ef_search (nullable) is None
+        # and model_fields_set contains the field
+        if self.ef_search is None and "ef_search" in self.model_fields_set:
+            _dict['ef_search'] = None
+
         return _dict
 
     @classmethod
@@ -83,8 +119,13 @@ class SplitVectorSearchSchema(BaseModel):
 
         _obj = cls.model_validate({
             "corpus_id": obj.get("corpus_id"),
+            "corpus_ids": obj.get("corpus_ids"),
+            "all_corpora": obj.get("all_corpora") if obj.get("all_corpora") is not None else False,
             "text": obj.get("text"),
-            "limit": obj.get("limit") if obj.get("limit") is not None else 10
+            "limit": obj.get("limit") if obj.get("limit") is not None else 10,
+            "per_corpus_limit": obj.get("per_corpus_limit"),
+            "ef_search": obj.get("ef_search"),
+            "mode": obj.get("mode") if obj.get("mode") is not None else 'vector'
         })
         return _obj
 
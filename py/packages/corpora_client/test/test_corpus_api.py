@@ -33,6 +33,20 @@ class TestCorpusApi(unittest.TestCase):
         """
         pass
 
+    def test_chat_stream(self) -> None:
+        """Test case for chat_stream
+
+        Chat Stream
+        """
+        pass
+
+    def test_complete_upload(self) -> None:
+        """Test case for complete_upload
+
+        Complete Upload
+        """
+        pass
+
     def test_create_corpus(self) -> None:
         """Test case for create_corpus
 
@@ -40,6 +54,13 @@ class TestCorpusApi(unittest.TestCase):
         """
         pass
 
+    def test_create_upload(self) -> None:
+        """Test case for create_upload
+
+        Create Upload
+        """
+        pass
+
     def test_delete_corpus(self) -> None:
         """Test case for delete_corpus
 
@@ -61,6 +82,20 @@ class TestCorpusApi(unittest.TestCase):
         """
         pass
 
+    def test_get_ingestion_job(self) -> None:
+        """Test case for get_ingestion_job
+
+        Get Ingestion Job
+        """
+        pass
+
+    def test_get_upload(self) -> None:
+        """Test case for get_upload
+
+        Get Upload
+        """
+        pass
+
     def test_list_corpora(self) -> None:
         """Test case for list_corpora
 
@@ -75,6 +110,13 @@ class TestCorpusApi(unittest.TestCase):
         """
         pass
 
+    def test_upload_part(self) -> None:
+        """Test case for upload_part
+
+        Upload Part
+        """
+        pass
+
 
 if __name__ == '__main__':
     unittest.main()
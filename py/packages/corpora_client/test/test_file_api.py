@@ -47,6 +47,13 @@ class TestFileApi(unittest.TestCase):
         """
         pass
 
+    def test_search_file_paths(self) -> None:
+        """Test case for search_file_paths
+
+        Search File Paths
+        """
+        pass
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,83 @@
+# coding: utf-8
+
+"""
+    Corpora API
+
+    API for managing and processing corpora
+
+    The version of the OpenAPI document: 0.1.0
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+import unittest
+
+from corpora_client.models.ingestion_job_response_schema import IngestionJobResponseSchema
+
+class TestIngestionJobResponseSchema(unittest.TestCase):
+    """IngestionJobResponseSchema unit test stubs"""
+
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    def make_instance(self, include_optional) -> IngestionJobResponseSchema:
+        """Test IngestionJobResponseSchema
+            include_optional is a boolean, when False only required
+            params are included, when True both required and
+            optional params are included """
+        # uncomment below to create an instance of `IngestionJobResponseSchema`
+        """
+        model = IngestionJobResponseSchema()
+        if include_optional:
+            return IngestionJobResponseSchema(
+                id = '',
+                corpus_id = '',
+                shards = 56,
+                shards_done = 56,
+                shards_failed = 56,
+                files_seen = 56,
+                files_updated = 56,
+                files_split = 56,
+                splits_created = 56,
+                files_embedded = 56,
+                vectors_done = 56,
+                files_failed = 56,
+                ingest_seconds = 1.337,
+                split_seconds = 1.337,
+                embed_seconds = 1.337,
+                created_at = datetime.datetime.strptime('2013-10-20 19:20:30.00', '%Y-%m-%d %H:%M:%S.%f'),
+                finished_at = datetime.datetime.strptime('2013-10-20 19:20:30.00', '%Y-%m-%d %H:%M:%S.%f')
+            )
+        else:
+            return IngestionJobResponseSchema(
+                id = '',
+                corpus_id = '',
+                shards = 56,
+                shards_done = 56,
+                shards_failed = 56,
+                files_seen = 56,
+                files_updated = 56,
+                files_split = 56,
+                splits_created = 56,
+                files_embedded = 56,
+                vectors_done = 56,
+                files_failed = 56,
+                ingest_seconds = 1.337,
+                split_seconds = 1.337,
+                embed_seconds = 1.337,
+                created_at = datetime.datetime.strptime('2013-10-20 19:20:30.00', '%Y-%m-%d %H:%M:%S.%f'),
+        )
+        """
+
+    def testIngestionJobResponseSchema(self):
+        """Test IngestionJobResponseSchema"""
+        # inst_req_only = self.make_instance(include_optional=False)
+        # inst_req_and_optional = self.make_instance(include_optional=True)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -36,16 +36,20 @@ class TestSplitResponseSchema(unittest.TestCase):
         if include_optional:
             return SplitResponseSchema(
                 id = '',
+                corpus_id = '',
                 content = '',
                 order = 56,
-                file_id = ''
+                file_id = '',
+                file_path = ''
             )
         else:
             return SplitResponseSchema(
                 id = '',
+                corpus_id = '',
                 content = '',
                 order = 56,
                 file_id = '',
+                file_path = '',
         )
         """
 
@@ -36,12 +36,18 @@ class TestSplitVectorSearchSchema(unittest.TestCase):
         if include_optional:
             return SplitVectorSearchSchema(
                 corpus_id = '',
+                corpus_ids = [
+                    ''
+                    ],
+                all_corpora = True,
                 text = '',
-                limit = 56
+                limit = 1,
+                per_corpus_limit = 1,
+                ef_search = 1,
+                mode = 'vector'
             )
         else:
             return SplitVectorSearchSchema(
-                corpus_id = '',
                 text = '',
         )
         """
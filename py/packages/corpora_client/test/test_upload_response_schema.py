@@ -0,0 +1,70 @@
+# coding: utf-8
+
+"""
+    Corpora API
+
+    API for managing and processing corpora
+
+    The version of the OpenAPI document: 0.1.0
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+import unittest
+
+from corpora_client.models.upload_response_schema import UploadResponseSchema
+
+class TestUploadResponseSchema(unittest.TestCase):
+    """UploadResponseSchema unit test stubs"""
+
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        pass
+
+    def make_instance(self, include_optional) -> UploadResponseSchema:
+        """Test UploadResponseSchema
+            include_optional is a boolean, when False only required
+            params are included, when True both required and
+            optional params are included """
+        # uncomment below to create an instance of `UploadResponseSchema`
+        """
+        model = UploadResponseSchema()
+        if include_optional:
+            return UploadResponseSchema(
+                id = '',
+                size = 56,
+                part_size = 56,
+                parts = [
+                    corpora_client.models.upload_part_response_schema.UploadPartResponseSchema(
+                        offset = 56, 
+                        size = 56, 
+                        sha256 = '', )
+                    ],
+                completed = True
+            )
+        else:
+            return UploadResponseSchema(
+                id = '',
+                size = 56,
+                part_size = 56,
+                parts = [
+                    corpora_client.models.upload_part_response_schema.UploadPartResponseSchema(
+                        offset = 56, 
+                        size = 56, 
+                        sha256 = '', )
+                    ],
+                completed = True,
+        )
+        """
+
+    def testUploadResponseSchema(self):
+        """Test UploadResponseSchema"""
+        # inst_req_only = self.make_instance(include_optional=False)
+        # inst_req_and_optional = self.make_instance(include_optional=True)
+
+if __name__ == '__main__':
+    unittest.main()
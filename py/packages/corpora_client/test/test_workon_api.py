@@ -33,6 +33,13 @@ class TestWorkonApi(unittest.TestCase):
         """
         pass
 
+    def test_file_stream(self) -> None:
+        """Test case for file_stream
+
+        File Stream
+        """
+        pass
+
 
 if __name__ == '__main__':
     unittest.main()
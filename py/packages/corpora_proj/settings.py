@@ -38,6 +38,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "django_extensions",
     "oauth2_provider",
     "ninja",
@@ -133,9 +134,119 @@ STATIC_URL = "static/"
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+# Corpus tarballs can be large; always spool uploads to a temporary file
+# rather than holding small ones in memory
+FILE_UPLOAD_HANDLERS = [
+    "django.core.files.uploadhandler.TemporaryFileUploadHandler",
+]
+
+# Uploaded tarballs are staged here for the ingestion tasks, which only
+# get the file name. Web and worker processes must share this location.
+CORPORA_UPLOAD_ROOT = os.getenv(
+    "CORPORA_UPLOAD_ROOT",
+    os.path.join(os.path.dirname(os.path.dirname(__file__)), ".uploads"),
+)
+# Largest accepted tarball, in bytes (default 1 GiB)
+CORPORA_MAX_UPLOAD_SIZE = int(
+    os.getenv("CORPORA_MAX_UPLOAD_SIZE", str(1024 * 1024 * 1024)),
+)
+# Staged uploads older than this many seconds are deleted
+CORPORA_UPLOAD_TTL = int(os.getenv("CORPORA_UPLOAD_TTL", str(24 * 60 * 60)))
+# Part size suggested to clients for resumable uploads, in bytes
+CORPORA_UPLOAD_PART_SIZE = int(
+    os.getenv("CORPORA_UPLOAD_PART_SIZE", str(8 * 1024 * 1024)),
+)
+
+STORAGES = {
+    "default": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+    },
+    "staticfiles": {
+        "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage",
+    },
+    "corpus_uploads": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+        "OPTIONS": {"location": CORPORA_UPLOAD_ROOT},
+    },
+}
+
 # Celery settings
 CELERY_BROKER_URL = os.getenv("REDIS_URL", "redis://corpora-redis:6379/0")
 CELERY_RESULT_BACKEND = os.getenv("REDIS_URL", "redis://corpora-redis:6379/0")
+CELERY_BEAT_SCHEDULE = {
+    "cleanup-staged-uploads": {
+        "task": "corpora.tasks.sync.cleanup_staged_uploads_task",
+        "schedule": 60 * 60,
+    },
+}
+# File summaries go to their own queue, served by a worker started with
+# `-Q summaries`, so they never hold up ingestion or chat
+CELERY_TASK_ROUTES = {
+    "corpora.tasks.summaries.*": {"queue": "summaries"},
+}
+
+# Files are summarized, and the summaries embedded, in the background
+# after ingestion. Summary requests share a tokens-per-minute budget
+# across workers; keep it well under the provider's limit so interactive
+# traffic always has headroom. Inputs are cut to CORPORA_SUMMARY_INPUT_TOKENS.
+CORPORA_SUMMARIZE_FILES = (
+    os.getenv("CORPORA_SUMMARIZE_FILES", "true").lower() == "true"
+)
+CORPORA_SUMMARY_TOKENS_PER_MINUTE = int(
+    os.getenv("CORPORA_SUMMARY_TOKENS_PER_MINUTE", "100000"),
+)
+CORPORA_SUMMARY_INPUT_TOKENS = int(
+    os.getenv("CORPORA_SUMMARY_INPUT_TOKENS", "4000"),
+)
+
+# Candidates the HNSW index visits per vector search (pgvector default 40).
+# Higher improves recall at the cost of latency.
+CORPORA_HNSW_EF_SEARCH = int(os.getenv("CORPORA_HNSW_EF_SEARCH", "40"))
+
+# Files whose splits the two-stage "summary" search ranks, picked by
+# their summary vectors. See `manage.py benchmark_search` to tune it.
+CORPORA_SUMMARY_SEARCH_FILES = int(os.getenv("CORPORA_SUMMARY_SEARCH_FILES", "20"))
+
+# Search query embeddings are cached so repeated queries (chat turns,
+# retries) skip the provider. In-process LRU by default; set
+# CORPORA_QUERY_EMBEDDING_CACHE_URL (e.g. a redis:// URL) to share it
+# across workers.
+QUERY_EMBEDDING_CACHE_URL = os.getenv("CORPORA_QUERY_EMBEDDING_CACHE_URL")
+QUERY_EMBEDDING_CACHE_TTL = int(
+    os.getenv("CORPORA_QUERY_EMBEDDING_CACHE_TTL", "3600"),
+)
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "query_embeddings": (
+        {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": QUERY_EMBEDDING_CACHE_URL,
+            "TIMEOUT": QUERY_EMBEDDING_CACHE_TTL,
+        }
+        if QUERY_EMBEDDING_CACHE_URL
+        else {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "query-embeddings",
+            "TIMEOUT": QUERY_EMBEDDING_CACHE_TTL,
+            "OPTIONS": {"MAX_ENTRIES": 1000},
+        }
+    ),
+    # Tokens-per-minute budgets (`corpora.lib.dj.rate_limits`), shared
+    # by the Celery workers through Redis
+    "rate_limits": (
+        {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.environ["REDIS_URL"],
+        }
+        if os.getenv("REDIS_URL")
+        else {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "rate-limits",
+        }
+    ),
+}
 
 LOGGING = {
     "version": 1,
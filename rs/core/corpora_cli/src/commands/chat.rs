@@ -2,7 +2,6 @@ use crate::context::Context;
 use clap::Args;
 use corpora_client::models::{CorpusChatSchema, MessageSchema};
 use std::fs;
-use termimad::MadSkin;
 
 #[derive(Args)]
 pub struct ChatArgs {
@@ -68,24 +67,24 @@ pub fn run(ctx: &Context, args: ChatArgs) {
         let structure =
             fs::read_to_string(root_path.join(".corpora/STRUCTURE.md")).unwrap_or_default();
 
-        match corpora_client::apis::corpus_api::chat(
-            &ctx.api_config,
-            CorpusChatSchema {
-                messages: messages.clone(),
-                corpus_id: ctx
-                    .corpora_config
-                    .id
-                    .clone()
-                    .expect("Failed to get corpus ID"),
-                voice: Some(voice),
-                purpose: Some(purpose),
-                structure: Some(structure),
-                directions: None,
-            },
-        ) {
+        let request = CorpusChatSchema {
+            messages: messages.clone(),
+            corpus_id: ctx
+                .corpora_config
+                .id
+                .clone()
+                .expect("Failed to get corpus ID"),
+            voice: Some(voice),
+            purpose: Some(purpose),
+            structure: Some(structure),
+            directions: None,
+        };
+        // Print the reply as it is generated
+        match ctx.post_text_stream("/api/corpora/corpus/chat/stream", &request, |text| {
+            ctx.dim_inline(text)
+        }) {
             Ok(response) => {
-                let skin = MadSkin::default();
-                skin.print_text(&response);
+                ctx.dim_inline("\n");
                 messages.push(MessageSchema {
                     role: "assistant".to_string(),
                     text: response.clone(),
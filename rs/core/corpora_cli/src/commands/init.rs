@@ -69,8 +69,9 @@ pub fn run(ctx: &Context) {
     match corpora_client::apis::corpus_api::create_corpus(
         &ctx.api_config,
         &corpus_name,
-        tarball_path.clone(),
         url.as_deref(),
+        None,
+        Some(tarball_path.clone()),
     ) {
         Ok(response) => {
             api_progress.finish_with_message("Corpus created successfully!");
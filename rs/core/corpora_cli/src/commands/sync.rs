@@ -137,8 +137,9 @@ pub fn run(ctx: &Context, args: SyncArgs) {
     match corpora_client::apis::corpus_api::update_files(
         &ctx.api_config,
         &corpus_id,
-        tarball_path.clone(),
         Some(files_to_delete),
+        None,
+        Some(tarball_path.clone()),
     ) {
         Ok(_) => {
             ctx.success("Corpus sync completed successfully!");
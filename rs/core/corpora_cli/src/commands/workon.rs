@@ -105,30 +105,32 @@ pub fn run(ctx: &Context, args: WorkonArgs) {
             fs::read_to_string(root_path.join(format!(".corpora/{}/DIRECTIONS.md", ext)))
                 .unwrap_or_default();
 
-        let revision = match corpora_client::apis::workon_api::file(
-            &ctx.api_config,
-            CorpusFileChatSchema {
-                messages: messages.clone(),
-                corpus_id: ctx
-                    .corpora_config
-                    .id
-                    .clone()
-                    .expect("Failed to get corpus ID"),
-                path: relative_path.to_string_lossy().to_string(),
-                voice: Some(voice),
-                purpose: Some(purpose),
-                structure: Some(structure),
-                directions: Some(directions),
-            },
-        ) {
-            Ok(response) => response,
-            Err(err) => {
-                ctx.error(&format!("Failed to generate revision: {:?}", err));
-                continue;
-            }
+        let request = CorpusFileChatSchema {
+            messages: messages.clone(),
+            corpus_id: ctx
+                .corpora_config
+                .id
+                .clone()
+                .expect("Failed to get corpus ID"),
+            path: relative_path.to_string_lossy().to_string(),
+            voice: Some(voice),
+            purpose: Some(purpose),
+            structure: Some(structure),
+            directions: Some(directions),
         };
+        // Print the revision as it is generated
+        let revision =
+            match ctx.post_text_stream("/api/corpora/workon/file/stream", &request, |text| {
+                ctx.dim_inline(text)
+            }) {
+                Ok(response) => response,
+                Err(err) => {
+                    ctx.error(&format!("Failed to generate revision: {:?}", err));
+                    continue;
+                }
+            };
+        ctx.dim_inline("\n");
 
-        ctx.dim(&revision);
         ctx.highlight(&format!("^^Revision for `{}`^^", relative_path.display()));
         messages.push(MessageSchema {
             role: "assistant".to_string(),
@@ -3,6 +3,7 @@ pub mod collector;
 pub mod config;
 
 use std::fs;
+use std::io::Read;
 use std::sync::Arc;
 use std::time::Duration;
 use std::{env, process::Command};
@@ -112,6 +113,68 @@ impl Context {
     pub fn get_user_input_via_editor(&self, initial_content: &str) -> Result<String, String> {
         get_user_input_via_editor(initial_content)
     }
+
+    /// Prints dimmed text without a trailing newline, e.g. a streamed completion
+    pub fn dim_inline(&self, message: &str) {
+        let styled_message = Style::new().dim().apply_to(message);
+        self.term.write_str(&styled_message.to_string()).unwrap();
+    }
+
+    /// POSTs `body` as JSON to an API path that streams plain text back,
+    /// handing each piece to `on_text` as it arrives.
+    ///
+    /// Returns the complete text once the stream ends.
+    pub fn post_text_stream<T: serde::Serialize>(
+        &self,
+        path: &str,
+        body: &T,
+        on_text: impl FnMut(&str),
+    ) -> Result<String, String> {
+        let url = format!("{}{}", self.api_config.base_path, path);
+        let mut request = self.api_config.client.post(url).json(body);
+        if let Some(token) = &self.api_config.bearer_access_token {
+            request = request.bearer_auth(token);
+        }
+        let response = request
+            .send()
+            .map_err(|e| format!("Request failed: {}", e))?;
+        let status = response.status();
+        if !status.is_success() {
+            let content = response.text().unwrap_or_default();
+            return Err(format!("{}: {}", status, content));
+        }
+        read_text_stream(response, on_text).map_err(|e| format!("Failed to read response: {}", e))
+    }
+}
+
+/// Reads UTF-8 text from `reader` as it arrives, passing each decoded piece
+/// to `on_text`, and returns the whole text.
+pub fn read_text_stream<R: Read>(
+    mut reader: R,
+    mut on_text: impl FnMut(&str),
+) -> std::io::Result<String> {
+    let mut text = String::new();
+    let mut pending: Vec<u8> = Vec::new();
+    let mut buf = [0u8; 1024];
+    loop {
+        let n = reader.read(&mut buf)?;
+        pending.extend_from_slice(&buf[..n]);
+        // Hold back a multi-byte character split across reads
+        let end = match std::str::from_utf8(&pending) {
+            Ok(s) => s.len(),
+            Err(e) if n > 0 && e.error_len().is_none() => e.valid_up_to(),
+            Err(_) => pending.len(),
+        };
+        if end > 0 {
+            let chunk = String::from_utf8_lossy(&pending[..end]).into_owned();
+            pending.drain(..end);
+            on_text(&chunk);
+            text.push_str(&chunk);
+        }
+        if n == 0 {
+            return Ok(text);
+        }
+    }
 }
 
 pub fn get_user_input_via_editor(initial_content: &str) -> Result<String, String> {
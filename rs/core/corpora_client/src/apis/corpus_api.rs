@@ -21,12 +21,39 @@ pub enum ChatError {
     UnknownValue(serde_json::Value),
 }
 
+/// struct for typed errors of method [`chat_stream`]
+#[derive(Debug, Clone, Serialize, Deserialize)]
+#[serde(untagged)]
+pub enum ChatStreamError {
+    Status404(String),
+    UnknownValue(serde_json::Value),
+}
+
+/// struct for typed errors of method [`complete_upload`]
+#[derive(Debug, Clone, Serialize, Deserialize)]
+#[serde(untagged)]
+pub enum CompleteUploadError {
+    Status400(String),
+    Status404(String),
+    UnknownValue(serde_json::Value),
+}
+
 /// struct for typed errors of method [`create_corpus`]
 #[derive(Debug, Clone, Serialize, Deserialize)]
 #[serde(untagged)]
 pub enum CreateCorpusError {
     Status400(String),
+    Status404(String),
     Status409(String),
+    Status413(String),
+    UnknownValue(serde_json::Value),
+}
+
+/// struct for typed errors of method [`create_upload`]
+#[derive(Debug, Clone, Serialize, Deserialize)]
+#[serde(untagged)]
+pub enum CreateUploadError {
+    Status413(String),
     UnknownValue(serde_json::Value),
 }
 
@@ -52,6 +79,22 @@ pub enum GetFileHashesError {
     UnknownValue(serde_json::Value),
 }
 
+/// struct for typed errors of method [`get_ingestion_job`]
+#[derive(Debug, Clone, Serialize, Deserialize)]
+#[serde(untagged)]
+pub enum GetIngestionJobError {
+    Status404(String),
+    UnknownValue(serde_json::Value),
+}
+
+/// struct for typed errors of method [`get_upload`]
+#[derive(Debug, Clone, Serialize, Deserialize)]
+#[serde(untagged)]
+pub enum GetUploadError {
+    Status404(String),
+    UnknownValue(serde_json::Value),
+}
+
 /// struct for typed errors of method [`list_corpora`]
 #[derive(Debug, Clone, Serialize, Deserialize)]
 #[serde(untagged)]
@@ -63,6 +106,17 @@ pub enum ListCorporaError {
 #[derive(Debug, Clone, Serialize, Deserialize)]
 #[serde(untagged)]
 pub enum UpdateFilesError {
+    Status400(String),
+    Status404(String),
+    Status413(String),
+    UnknownValue(serde_json::Value),
+}
+
+/// struct for typed errors of method [`upload_part`]
+#[derive(Debug, Clone, Serialize, Deserialize)]
+#[serde(untagged)]
+pub enum UploadPartError {
+    Status400(String),
     Status404(String),
     UnknownValue(serde_json::Value),
 }
@@ -111,12 +165,103 @@ pub fn chat(
     }
 }
 
-/// Create a new Corpus with an uploaded tarball.
+/// Chat with the Corpus, streaming the reply as plain text while it is generated.
+pub fn chat_stream(
+    configuration: &configuration::Configuration,
+    corpus_chat_schema: models::CorpusChatSchema,
+) -> Result<String, Error<ChatStreamError>> {
+    let local_var_configuration = configuration;
+
+    let local_var_client = &local_var_configuration.client;
+
+    let local_var_uri_str = format!(
+        "{}/api/corpora/corpus/chat/stream",
+        local_var_configuration.base_path
+    );
+    let mut local_var_req_builder =
+        local_var_client.request(reqwest::Method::POST, local_var_uri_str.as_str());
+
+    if let Some(ref local_var_user_agent) = local_var_configuration.user_agent {
+        local_var_req_builder =
+            local_var_req_builder.header(reqwest::header::USER_AGENT, local_var_user_agent.clone());
+    }
+    if let Some(ref local_var_token) = local_var_configuration.bearer_access_token {
+        local_var_req_builder = local_var_req_builder.bearer_auth(local_var_token.to_owned());
+    };
+    local_var_req_builder = local_var_req_builder.json(&corpus_chat_schema);
+
+    let local_var_req = local_var_req_builder.build()?;
+    let local_var_resp = local_var_client.execute(local_var_req)?;
+
+    let local_var_status = local_var_resp.status();
+    let local_var_content = local_var_resp.text()?;
+
+    if !local_var_status.is_client_error() && !local_var_status.is_server_error() {
+        serde_json::from_str(&local_var_content).map_err(Error::from)
+    } else {
+        let local_var_entity: Option<ChatStreamError> =
+            serde_json::from_str(&local_var_content).ok();
+        let local_var_error = ResponseContent {
+            status: local_var_status,
+            content: local_var_content,
+            entity: local_var_entity,
+        };
+        Err(Error::ResponseError(local_var_error))
+    }
+}
+
+/// Join the received parts, once they cover the whole upload.
+pub fn complete_upload(
+    configuration: &configuration::Configuration,
+    upload_id: &str,
+) -> Result<models::UploadResponseSchema, Error<CompleteUploadError>> {
+    let local_var_configuration = configuration;
+
+    let local_var_client = &local_var_configuration.client;
+
+    let local_var_uri_str = format!(
+        "{}/api/corpora/corpus/uploads/{upload_id}/complete",
+        local_var_configuration.base_path,
+        upload_id = crate::apis::urlencode(upload_id)
+    );
+    let mut local_var_req_builder =
+        local_var_client.request(reqwest::Method::POST, local_var_uri_str.as_str());
+
+    if let Some(ref local_var_user_agent) = local_var_configuration.user_agent {
+        local_var_req_builder =
+            local_var_req_builder.header(reqwest::header::USER_AGENT, local_var_user_agent.clone());
+    }
+    if let Some(ref local_var_token) = local_var_configuration.bearer_access_token {
+        local_var_req_builder = local_var_req_builder.bearer_auth(local_var_token.to_owned());
+    };
+
+    let local_var_req = local_var_req_builder.build()?;
+    let local_var_resp = local_var_client.execute(local_var_req)?;
+
+    let local_var_status = local_var_resp.status();
+    let local_var_content = local_var_resp.text()?;
+
+    if !local_var_status.is_client_error() && !local_var_status.is_server_error() {
+        serde_json::from_str(&local_var_content).map_err(Error::from)
+    } else {
+        let local_var_entity: Option<CompleteUploadError> =
+            serde_json::from_str(&local_var_content).ok();
+        let local_var_error = ResponseContent {
+            status: local_var_status,
+            content: local_var_content,
+            entity: local_var_entity,
+        };
+        Err(Error::ResponseError(local_var_error))
+    }
+}
+
+/// Create a new Corpus with an uploaded tarball, or the tarballs of completed resumable uploads, ingested in parallel.
 pub fn create_corpus(
     configuration: &configuration::Configuration,
     name: &str,
-    tarball: std::path::PathBuf,
     url: Option<&str>,
+    upload_ids: Option<Vec<String>>,
+    tarball: Option<std::path::PathBuf>,
 ) -> Result<models::CorpusResponseSchema, Error<CreateCorpusError>> {
     let local_var_configuration = configuration;
 
@@ -138,7 +283,20 @@ pub fn create_corpus(
     if let Some(local_var_param_value) = url {
         local_var_form = local_var_form.text("url", local_var_param_value.to_string());
     }
-    local_var_form = local_var_form.file("tarball", tarball)?;
+    if let Some(local_var_param_value) = upload_ids {
+        local_var_form = local_var_form.text(
+            "upload_ids",
+            local_var_param_value
+                .into_iter()
+                .map(|p| p.to_string())
+                .collect::<Vec<String>>()
+                .join(",")
+                .to_string(),
+        );
+    }
+    if let Some(local_var_param_value) = tarball {
+        local_var_form = local_var_form.file("tarball", local_var_param_value)?;
+    }
     local_var_req_builder = local_var_req_builder.multipart(local_var_form);
 
     let local_var_req = local_var_req_builder.build()?;
@@ -161,6 +319,51 @@ pub fn create_corpus(
     }
 }
 
+/// Start a resumable tarball upload.
+pub fn create_upload(
+    configuration: &configuration::Configuration,
+    upload_schema: models::UploadSchema,
+) -> Result<models::UploadResponseSchema, Error<CreateUploadError>> {
+    let local_var_configuration = configuration;
+
+    let local_var_client = &local_var_configuration.client;
+
+    let local_var_uri_str = format!(
+        "{}/api/corpora/corpus/uploads",
+        local_var_configuration.base_path
+    );
+    let mut local_var_req_builder =
+        local_var_client.request(reqwest::Method::POST, local_var_uri_str.as_str());
+
+    if let Some(ref local_var_user_agent) = local_var_configuration.user_agent {
+        local_var_req_builder =
+            local_var_req_builder.header(reqwest::header::USER_AGENT, local_var_user_agent.clone());
+    }
+    if let Some(ref local_var_token) = local_var_configuration.bearer_access_token {
+        local_var_req_builder = local_var_req_builder.bearer_auth(local_var_token.to_owned());
+    };
+    local_var_req_builder = local_var_req_builder.json(&upload_schema);
+
+    let local_var_req = local_var_req_builder.build()?;
+    let local_var_resp = local_var_client.execute(local_var_req)?;
+
+    let local_var_status = local_var_resp.status();
+    let local_var_content = local_var_resp.text()?;
+
+    if !local_var_status.is_client_error() && !local_var_status.is_server_error() {
+        serde_json::from_str(&local_var_content).map_err(Error::from)
+    } else {
+        let local_var_entity: Option<CreateUploadError> =
+            serde_json::from_str(&local_var_content).ok();
+        let local_var_error = ResponseContent {
+            status: local_var_status,
+            content: local_var_content,
+            entity: local_var_entity,
+        };
+        Err(Error::ResponseError(local_var_error))
+    }
+}
+
 /// Delete a Corpus by name.
 pub fn delete_corpus(
     configuration: &configuration::Configuration,
@@ -249,7 +452,7 @@ pub fn get_corpus(
     }
 }
 
-/// Retrieve a map of file paths to their hashes for a Corpus.
+/// Retrieve a map of file paths to their hashes for a Corpus.  Sends an ETag; a matching If-None-Match gets an empty 304 instead.
 pub fn get_file_hashes(
     configuration: &configuration::Configuration,
     corpus_id: &str,
@@ -294,6 +497,98 @@ pub fn get_file_hashes(
     }
 }
 
+/// Get the progress of an ingestion job.
+pub fn get_ingestion_job(
+    configuration: &configuration::Configuration,
+    corpus_id: &str,
+    job_id: &str,
+) -> Result<models::IngestionJobResponseSchema, Error<GetIngestionJobError>> {
+    let local_var_configuration = configuration;
+
+    let local_var_client = &local_var_configuration.client;
+
+    let local_var_uri_str = format!(
+        "{}/api/corpora/corpus/{corpus_id}/jobs/{job_id}",
+        local_var_configuration.base_path,
+        corpus_id = crate::apis::urlencode(corpus_id),
+        job_id = crate::apis::urlencode(job_id)
+    );
+    let mut local_var_req_builder =
+        local_var_client.request(reqwest::Method::GET, local_var_uri_str.as_str());
+
+    if let Some(ref local_var_user_agent) = local_var_configuration.user_agent {
+        local_var_req_builder =
+            local_var_req_builder.header(reqwest::header::USER_AGENT, local_var_user_agent.clone());
+    }
+    if let Some(ref local_var_token) = local_var_configuration.bearer_access_token {
+        local_var_req_builder = local_var_req_builder.bearer_auth(local_var_token.to_owned());
+    };
+
+    let local_var_req = local_var_req_builder.build()?;
+    let local_var_resp = local_var_client.execute(local_var_req)?;
+
+    let local_var_status = local_var_resp.status();
+    let local_var_content = local_var_resp.text()?;
+
+    if !local_var_status.is_client_error() && !local_var_status.is_server_error() {
+        serde_json::from_str(&local_var_content).map_err(Error::from)
+    } else {
+        let local_var_entity: Option<GetIngestionJobError> =
+            serde_json::from_str(&local_var_content).ok();
+        let local_var_error = ResponseContent {
+            status: local_var_status,
+            content: local_var_content,
+            entity: local_var_entity,
+        };
+        Err(Error::ResponseError(local_var_error))
+    }
+}
+
+/// Get a resumable upload and the parts received so far.
+pub fn get_upload(
+    configuration: &configuration::Configuration,
+    upload_id: &str,
+) -> Result<models::UploadResponseSchema, Error<GetUploadError>> {
+    let local_var_configuration = configuration;
+
+    let local_var_client = &local_var_configuration.client;
+
+    let local_var_uri_str = format!(
+        "{}/api/corpora/corpus/uploads/{upload_id}",
+        local_var_configuration.base_path,
+        upload_id = crate::apis::urlencode(upload_id)
+    );
+    let mut local_var_req_builder =
+        local_var_client.request(reqwest::Method::GET, local_var_uri_str.as_str());
+
+    if let Some(ref local_var_user_agent) = local_var_configuration.user_agent {
+        local_var_req_builder =
+            local_var_req_builder.header(reqwest::header::USER_AGENT, local_var_user_agent.clone());
+    }
+    if let Some(ref local_var_token) = local_var_configuration.bearer_access_token {
+        local_var_req_builder = local_var_req_builder.bearer_auth(local_var_token.to_owned());
+    };
+
+    let local_var_req = local_var_req_builder.build()?;
+    let local_var_resp = local_var_client.execute(local_var_req)?;
+
+    let local_var_status = local_var_resp.status();
+    let local_var_content = local_var_resp.text()?;
+
+    if !local_var_status.is_client_error() && !local_var_status.is_server_error() {
+        serde_json::from_str(&local_var_content).map_err(Error::from)
+    } else {
+        let local_var_entity: Option<GetUploadError> =
+            serde_json::from_str(&local_var_content).ok();
+        let local_var_error = ResponseContent {
+            status: local_var_status,
+            content: local_var_content,
+            entity: local_var_entity,
+        };
+        Err(Error::ResponseError(local_var_error))
+    }
+}
+
 /// List all Corpora.
 pub fn list_corpora(
     configuration: &configuration::Configuration,
@@ -334,13 +629,14 @@ pub fn list_corpora(
     }
 }
 
-/// Update a Corpus with an uploaded tarball for additions/updates and a list of files to delete
+/// Update a Corpus with an uploaded tarball (or the tarballs of completed resumable uploads) for additions/updates and a list of files to delete. Returns the job tracking the ingestion.
 pub fn update_files(
     configuration: &configuration::Configuration,
     corpus_id: &str,
-    tarball: std::path::PathBuf,
     delete_files: Option<Vec<String>>,
-) -> Result<String, Error<UpdateFilesError>> {
+    upload_ids: Option<Vec<String>>,
+    tarball: Option<std::path::PathBuf>,
+) -> Result<models::IngestionJobResponseSchema, Error<UpdateFilesError>> {
     let local_var_configuration = configuration;
 
     let local_var_client = &local_var_configuration.client;
@@ -372,7 +668,20 @@ pub fn update_files(
                 .to_string(),
         );
     }
-    local_var_form = local_var_form.file("tarball", tarball)?;
+    if let Some(local_var_param_value) = upload_ids {
+        local_var_form = local_var_form.text(
+            "upload_ids",
+            local_var_param_value
+                .into_iter()
+                .map(|p| p.to_string())
+                .collect::<Vec<String>>()
+                .join(",")
+                .to_string(),
+        );
+    }
+    if let Some(local_var_param_value) = tarball {
+        local_var_form = local_var_form.file("tarball", local_var_param_value)?;
+    }
     local_var_req_builder = local_var_req_builder.multipart(local_var_form);
 
     let local_var_req = local_var_req_builder.build()?;
@@ -394,3 +703,56 @@ pub fn update_files(
         Err(Error::ResponseError(local_var_error))
     }
 }
+
+/// Upload the bytes at `offset`, replacing an earlier attempt.
+pub fn upload_part(
+    configuration: &configuration::Configuration,
+    upload_id: &str,
+    offset: i32,
+    sha256: &str,
+    part: std::path::PathBuf,
+) -> Result<models::UploadPartResponseSchema, Error<UploadPartError>> {
+    let local_var_configuration = configuration;
+
+    let local_var_client = &local_var_configuration.client;
+
+    let local_var_uri_str = format!(
+        "{}/api/corpora/corpus/uploads/{upload_id}/parts",
+        local_var_configuration.base_path,
+        upload_id = crate::apis::urlencode(upload_id)
+    );
+    let mut local_var_req_builder =
+        local_var_client.request(reqwest::Method::POST, local_var_uri_str.as_str());
+
+    if let Some(ref local_var_user_agent) = local_var_configuration.user_agent {
+        local_var_req_builder =
+            local_var_req_builder.header(reqwest::header::USER_AGENT, local_var_user_agent.clone());
+    }
+    if let Some(ref local_var_token) = local_var_configuration.bearer_access_token {
+        local_var_req_builder = local_var_req_builder.bearer_auth(local_var_token.to_owned());
+    };
+    let mut local_var_form = reqwest::blocking::multipart::Form::new();
+    local_var_form = local_var_form.text("offset", offset.to_string());
+    local_var_form = local_var_form.text("sha256", sha256.to_string());
+    local_var_form = local_var_form.file("part", part)?;
+    local_var_req_builder = local_var_req_builder.multipart(local_var_form);
+
+    let local_var_req = local_var_req_builder.build()?;
+    let local_var_resp = local_var_client.execute(local_var_req)?;
+
+    let local_var_status = local_var_resp.status();
+    let local_var_content = local_var_resp.text()?;
+
+    if !local_var_status.is_client_error() && !local_var_status.is_server_error() {
+        serde_json::from_str(&local_var_content).map_err(Error::from)
+    } else {
+        let local_var_entity: Option<UploadPartError> =
+            serde_json::from_str(&local_var_content).ok();
+        let local_var_error = ResponseContent {
+            status: local_var_status,
+            content: local_var_content,
+            entity: local_var_entity,
+        };
+        Err(Error::ResponseError(local_var_error))
+    }
+}
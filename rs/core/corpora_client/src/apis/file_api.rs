@@ -35,6 +35,14 @@ pub enum GetFileByPathError {
     UnknownValue(serde_json::Value),
 }
 
+/// struct for typed errors of method [`search_file_paths`]
+#[derive(Debug, Clone, Serialize, Deserialize)]
+#[serde(untagged)]
+pub enum SearchFilePathsError {
+    Status404(String),
+    UnknownValue(serde_json::Value),
+}
+
 /// Create a new File within a Corpus.
 pub fn create_file(
     configuration: &configuration::Configuration,
@@ -167,3 +175,60 @@ pub fn get_file_by_path(
         Err(Error::ResponseError(local_var_error))
     }
 }
+
+/// Find files in a Corpus by path, best matches first. \"trigram\" also matches misspelled paths; no embedding is involved.
+pub fn search_file_paths(
+    configuration: &configuration::Configuration,
+    corpus_id: &str,
+    q: &str,
+    mode: Option<&str>,
+    limit: Option<i32>,
+) -> Result<Vec<models::FilePathResponseSchema>, Error<SearchFilePathsError>> {
+    let local_var_configuration = configuration;
+
+    let local_var_client = &local_var_configuration.client;
+
+    let local_var_uri_str = format!(
+        "{}/api/corpora/file/corpus/{corpus_id}/search",
+        local_var_configuration.base_path,
+        corpus_id = crate::apis::urlencode(corpus_id)
+    );
+    let mut local_var_req_builder =
+        local_var_client.request(reqwest::Method::GET, local_var_uri_str.as_str());
+
+    local_var_req_builder = local_var_req_builder.query(&[("q", &q.to_string())]);
+    if let Some(ref local_var_str) = mode {
+        local_var_req_builder =
+            local_var_req_builder.query(&[("mode", &local_var_str.to_string())]);
+    }
+    if let Some(ref local_var_str) = limit {
+        local_var_req_builder =
+            local_var_req_builder.query(&[("limit", &local_var_str.to_string())]);
+    }
+    if let Some(ref local_var_user_agent) = local_var_configuration.user_agent {
+        local_var_req_builder =
+            local_var_req_builder.header(reqwest::header::USER_AGENT, local_var_user_agent.clone());
+    }
+    if let Some(ref local_var_token) = local_var_configuration.bearer_access_token {
+        local_var_req_builder = local_var_req_builder.bearer_auth(local_var_token.to_owned());
+    };
+
+    let local_var_req = local_var_req_builder.build()?;
+    let local_var_resp = local_var_client.execute(local_var_req)?;
+
+    let local_var_status = local_var_resp.status();
+    let local_var_content = local_var_resp.text()?;
+
+    if !local_var_status.is_client_error() && !local_var_status.is_server_error() {
+        serde_json::from_str(&local_var_content).map_err(Error::from)
+    } else {
+        let local_var_entity: Option<SearchFilePathsError> =
+            serde_json::from_str(&local_var_content).ok();
+        let local_var_error = ResponseContent {
+            status: local_var_status,
+            content: local_var_content,
+            entity: local_var_entity,
+        };
+        Err(Error::ResponseError(local_var_error))
+    }
+}
@@ -31,6 +31,8 @@ pub enum ListSplitsForFileError {
 #[derive(Debug, Clone, Serialize, Deserialize)]
 #[serde(untagged)]
 pub enum VectorSearchError {
+    Status400(String),
+    Status404(String),
     UnknownValue(serde_json::Value),
 }
 
@@ -123,7 +125,7 @@ pub fn list_splits_for_file(
     }
 }
 
-/// Perform a vector similarity search for splits using a provided query vector.
+/// Search for splits by vector similarity to the text, by full-text match, or by both fused (`mode`), in one corpus or across several.
 pub fn vector_search(
     configuration: &configuration::Configuration,
     split_vector_search_schema: models::SplitVectorSearchSchema,
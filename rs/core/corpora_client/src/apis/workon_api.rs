@@ -20,6 +20,13 @@ pub enum FileError {
     UnknownValue(serde_json::Value),
 }
 
+/// struct for typed errors of method [`file_stream`]
+#[derive(Debug, Clone, Serialize, Deserialize)]
+#[serde(untagged)]
+pub enum FileStreamError {
+    UnknownValue(serde_json::Value),
+}
+
 pub fn file(
     configuration: &configuration::Configuration,
     corpus_file_chat_schema: models::CorpusFileChatSchema,
@@ -62,3 +69,48 @@ pub fn file(
         Err(Error::ResponseError(local_var_error))
     }
 }
+
+/// Stream the new revision of the file as plain text while it is generated.
+pub fn file_stream(
+    configuration: &configuration::Configuration,
+    corpus_file_chat_schema: models::CorpusFileChatSchema,
+) -> Result<String, Error<FileStreamError>> {
+    let local_var_configuration = configuration;
+
+    let local_var_client = &local_var_configuration.client;
+
+    let local_var_uri_str = format!(
+        "{}/api/corpora/workon/file/stream",
+        local_var_configuration.base_path
+    );
+    let mut local_var_req_builder =
+        local_var_client.request(reqwest::Method::POST, local_var_uri_str.as_str());
+
+    if let Some(ref local_var_user_agent) = local_var_configuration.user_agent {
+        local_var_req_builder =
+            local_var_req_builder.header(reqwest::header::USER_AGENT, local_var_user_agent.clone());
+    }
+    if let Some(ref local_var_token) = local_var_configuration.bearer_access_token {
+        local_var_req_builder = local_var_req_builder.bearer_auth(local_var_token.to_owned());
+    };
+    local_var_req_builder = local_var_req_builder.json(&corpus_file_chat_schema);
+
+    let local_var_req = local_var_req_builder.build()?;
+    let local_var_resp = local_var_client.execute(local_var_req)?;
+
+    let local_var_status = local_var_resp.status();
+    let local_var_content = local_var_resp.text()?;
+
+    if !local_var_status.is_client_error() && !local_var_status.is_server_error() {
+        serde_json::from_str(&local_var_content).map_err(Error::from)
+    } else {
+        let local_var_entity: Option<FileStreamError> =
+            serde_json::from_str(&local_var_content).ok();
+        let local_var_error = ResponseContent {
+            status: local_var_status,
+            content: local_var_content,
+            entity: local_var_entity,
+        };
+        Err(Error::ResponseError(local_var_error))
+    }
+}
@@ -0,0 +1,26 @@
+/*
+ * Corpora API
+ *
+ * API for managing and processing corpora
+ *
+ * The version of the OpenAPI document: 0.1.0
+ *
+ * Generated by: https://openapi-generator.tech
+ */
+
+use crate::models;
+use serde::{Deserialize, Serialize};
+
+#[derive(Clone, Default, Debug, PartialEq, Serialize, Deserialize)]
+pub struct FilePathResponseSchema {
+    #[serde(rename = "id")]
+    pub id: uuid::Uuid,
+    #[serde(rename = "path")]
+    pub path: String,
+}
+
+impl FilePathResponseSchema {
+    pub fn new(id: uuid::Uuid, path: String) -> FilePathResponseSchema {
+        FilePathResponseSchema { id, path }
+    }
+}
@@ -0,0 +1,96 @@
+/*
+ * Corpora API
+ *
+ * API for managing and processing corpora
+ *
+ * The version of the OpenAPI document: 0.1.0
+ *
+ * Generated by: https://openapi-generator.tech
+ */
+
+use crate::models;
+use serde::{Deserialize, Serialize};
+
+#[derive(Clone, Default, Debug, PartialEq, Serialize, Deserialize)]
+pub struct IngestionJobResponseSchema {
+    #[serde(rename = "id")]
+    pub id: uuid::Uuid,
+    #[serde(rename = "corpus_id")]
+    pub corpus_id: uuid::Uuid,
+    #[serde(rename = "shards")]
+    pub shards: i32,
+    #[serde(rename = "shards_done")]
+    pub shards_done: i32,
+    #[serde(rename = "shards_failed")]
+    pub shards_failed: i32,
+    #[serde(rename = "files_seen")]
+    pub files_seen: i32,
+    #[serde(rename = "files_updated")]
+    pub files_updated: i32,
+    #[serde(rename = "files_split")]
+    pub files_split: i32,
+    #[serde(rename = "splits_created")]
+    pub splits_created: i32,
+    #[serde(rename = "files_embedded")]
+    pub files_embedded: i32,
+    #[serde(rename = "vectors_done")]
+    pub vectors_done: i32,
+    #[serde(rename = "files_failed")]
+    pub files_failed: i32,
+    #[serde(rename = "ingest_seconds")]
+    pub ingest_seconds: f64,
+    #[serde(rename = "split_seconds")]
+    pub split_seconds: f64,
+    #[serde(rename = "embed_seconds")]
+    pub embed_seconds: f64,
+    #[serde(rename = "created_at")]
+    pub created_at: String,
+    #[serde(
+        rename = "finished_at",
+        default,
+        with = "::serde_with::rust::double_option",
+        skip_serializing_if = "Option::is_none"
+    )]
+    pub finished_at: Option<Option<String>>,
+}
+
+impl IngestionJobResponseSchema {
+    pub fn new(
+        id: uuid::Uuid,
+        corpus_id: uuid::Uuid,
+        shards: i32,
+        shards_done: i32,
+        shards_failed: i32,
+        files_seen: i32,
+        files_updated: i32,
+        files_split: i32,
+        splits_created: i32,
+        files_embedded: i32,
+        vectors_done: i32,
+        files_failed: i32,
+        ingest_seconds: f64,
+        split_seconds: f64,
+        embed_seconds: f64,
+        created_at: String,
+    ) -> IngestionJobResponseSchema {
+        IngestionJobResponseSchema {
+            id,
+            corpus_id,
+            shards,
+            shards_done,
+            shards_failed,
+            files_seen,
+            files_updated,
+            files_split,
+            splits_created,
+            files_embedded,
+            vectors_done,
+            files_failed,
+            ingest_seconds,
+            split_seconds,
+            embed_seconds,
+            created_at,
+            finished_at: None,
+        }
+    }
+}
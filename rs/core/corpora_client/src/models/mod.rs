@@ -8,10 +8,14 @@ pub mod corpus_schema;
 pub use self::corpus_schema::CorpusSchema;
 pub mod corpus_update_files_schema;
 pub use self::corpus_update_files_schema::CorpusUpdateFilesSchema;
+pub mod file_path_response_schema;
+pub use self::file_path_response_schema::FilePathResponseSchema;
 pub mod file_response_schema;
 pub use self::file_response_schema::FileResponseSchema;
 pub mod file_schema;
 pub use self::file_schema::FileSchema;
+pub mod ingestion_job_response_schema;
+pub use self::ingestion_job_response_schema::IngestionJobResponseSchema;
 pub mod issue_schema;
 pub use self::issue_schema::IssueSchema;
 pub mod message_schema;
@@ -22,3 +26,9 @@ pub mod split_response_schema;
 pub use self::split_response_schema::SplitResponseSchema;
 pub mod split_vector_search_schema;
 pub use self::split_vector_search_schema::SplitVectorSearchSchema;
+pub mod upload_part_response_schema;
+pub use self::upload_part_response_schema::UploadPartResponseSchema;
+pub mod upload_response_schema;
+pub use self::upload_response_schema::UploadResponseSchema;
+pub mod upload_schema;
+pub use self::upload_schema::UploadSchema;
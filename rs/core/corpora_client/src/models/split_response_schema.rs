@@ -15,26 +15,34 @@ use serde::{Deserialize, Serialize};
 pub struct SplitResponseSchema {
     #[serde(rename = "id")]
     pub id: uuid::Uuid,
+    #[serde(rename = "corpus_id")]
+    pub corpus_id: uuid::Uuid,
     #[serde(rename = "content")]
     pub content: String,
     #[serde(rename = "order")]
     pub order: i32,
     #[serde(rename = "file_id")]
     pub file_id: uuid::Uuid,
+    #[serde(rename = "file_path")]
+    pub file_path: String,
 }
 
 impl SplitResponseSchema {
     pub fn new(
         id: uuid::Uuid,
+        corpus_id: uuid::Uuid,
         content: String,
         order: i32,
         file_id: uuid::Uuid,
+        file_path: String,
     ) -> SplitResponseSchema {
         SplitResponseSchema {
             id,
+            corpus_id,
             content,
             order,
             file_id,
+            file_path,
         }
     }
 }
@@ -13,20 +13,65 @@ use serde::{Deserialize, Serialize};
 
 #[derive(Clone, Default, Debug, PartialEq, Serialize, Deserialize)]
 pub struct SplitVectorSearchSchema {
-    #[serde(rename = "corpus_id")]
-    pub corpus_id: uuid::Uuid,
+    #[serde(
+        rename = "corpus_id",
+        default,
+        with = "::serde_with::rust::double_option",
+        skip_serializing_if = "Option::is_none"
+    )]
+    pub corpus_id: Option<Option<uuid::Uuid>>,
+    #[serde(
+        rename = "corpus_ids",
+        default,
+        with = "::serde_with::rust::double_option",
+        skip_serializing_if = "Option::is_none"
+    )]
+    pub corpus_ids: Option<Option<Vec<uuid::Uuid>>>,
+    #[serde(rename = "all_corpora", skip_serializing_if = "Option::is_none")]
+    pub all_corpora: Option<bool>,
     #[serde(rename = "text")]
     pub text: String,
     #[serde(rename = "limit", skip_serializing_if = "Option::is_none")]
     pub limit: Option<i32>,
+    #[serde(
+        rename = "per_corpus_limit",
+        default,
+        with = "::serde_with::rust::double_option",
+        skip_serializing_if = "Option::is_none"
+    )]
+    pub per_corpus_limit: Option<Option<i32>>,
+    #[serde(rename = "mode", skip_serializing_if = "Option::is_none")]
+    pub mode: Option<Mode>,
 }
 
 impl SplitVectorSearchSchema {
-    pub fn new(corpus_id: uuid::Uuid, text: String) -> SplitVectorSearchSchema {
+    pub fn new(text: String) -> SplitVectorSearchSchema {
         SplitVectorSearchSchema {
-            corpus_id,
+            corpus_id: None,
+            corpus_ids: None,
+            all_corpora: None,
             text,
             limit: None,
+            per_corpus_limit: None,
+            mode: None,
         }
     }
 }
+///
+#[derive(Clone, Copy, Debug, Eq, PartialEq, Ord, PartialOrd, Hash, Serialize, Deserialize)]
+pub enum Mode {
+    #[serde(rename = "vector")]
+    Vector,
+    #[serde(rename = "hybrid")]
+    Hybrid,
+    #[serde(rename = "lexical")]
+    Lexical,
+    #[serde(rename = "summary")]
+    Summary,
+}
+
+impl Default for Mode {
+    fn default() -> Mode {
+        Self::Vector
+    }
+}
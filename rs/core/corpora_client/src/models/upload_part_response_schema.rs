@@ -0,0 +1,32 @@
+/*
+ * Corpora API
+ *
+ * API for managing and processing corpora
+ *
+ * The version of the OpenAPI document: 0.1.0
+ *
+ * Generated by: https://openapi-generator.tech
+ */
+
+use crate::models;
+use serde::{Deserialize, Serialize};
+
+#[derive(Clone, Default, Debug, PartialEq, Serialize, Deserialize)]
+pub struct UploadPartResponseSchema {
+    #[serde(rename = "offset")]
+    pub offset: i32,
+    #[serde(rename = "size")]
+    pub size: i32,
+    #[serde(rename = "sha256")]
+    pub sha256: String,
+}
+
+impl UploadPartResponseSchema {
+    pub fn new(offset: i32, size: i32, sha256: String) -> UploadPartResponseSchema {
+        UploadPartResponseSchema {
+            offset,
+            size,
+            sha256,
+        }
+    }
+}
@@ -0,0 +1,44 @@
+/*
+ * Corpora API
+ *
+ * API for managing and processing corpora
+ *
+ * The version of the OpenAPI document: 0.1.0
+ *
+ * Generated by: https://openapi-generator.tech
+ */
+
+use crate::models;
+use serde::{Deserialize, Serialize};
+
+#[derive(Clone, Default, Debug, PartialEq, Serialize, Deserialize)]
+pub struct UploadResponseSchema {
+    #[serde(rename = "id")]
+    pub id: uuid::Uuid,
+    #[serde(rename = "size")]
+    pub size: i32,
+    #[serde(rename = "part_size")]
+    pub part_size: i32,
+    #[serde(rename = "parts")]
+    pub parts: Vec<models::UploadPartResponseSchema>,
+    #[serde(rename = "completed")]
+    pub completed: bool,
+}
+
+impl UploadResponseSchema {
+    pub fn new(
+        id: uuid::Uuid,
+        size: i32,
+        part_size: i32,
+        parts: Vec<models::UploadPartResponseSchema>,
+        completed: bool,
+    ) -> UploadResponseSchema {
+        UploadResponseSchema {
+            id,
+            size,
+            part_size,
+            parts,
+            completed,
+        }
+    }
+}
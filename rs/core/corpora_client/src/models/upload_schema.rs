@@ -0,0 +1,31 @@
+/*
+ * Corpora API
+ *
+ * API for managing and processing corpora
+ *
+ * The version of the OpenAPI document: 0.1.0
+ *
+ * Generated by: https://openapi-generator.tech
+ */
+
+use crate::models;
+use serde::{Deserialize, Serialize};
+
+#[derive(Clone, Default, Debug, PartialEq, Serialize, Deserialize)]
+pub struct UploadSchema {
+    #[serde(rename = "size")]
+    pub size: i32,
+    #[serde(
+        rename = "sha256",
+        default,
+        with = "::serde_with::rust::double_option",
+        skip_serializing_if = "Option::is_none"
+    )]
+    pub sha256: Option<Option<String>>,
+}
+
+impl UploadSchema {
+    pub fn new(size: i32) -> UploadSchema {
+        UploadSchema { size, sha256: None }
+    }
+}